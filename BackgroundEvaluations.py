@@ -0,0 +1,172 @@
+import concurrent.futures
+import threading
+from functools import partial
+
+
+class BackgroundEvaluation:
+    """
+    Evaluation policy running the getters of subscriptions on a thread (or process) pool instead of the publishing
+    thread - so expensive formatting or aggregation getters do not block the GUI thread. Policies are passed to
+    'ObserverObject.subscribeToVariable' (with the 'evaluation_policy' parameter). For every subscription the policy
+    creates separate 'VersionedEvaluation' with 'wrap' method, so one policy (and its pool) can be shared by many
+    subscriptions, e.g.:
+
+    evaluation = BackgroundEvaluation(QtScheduler())
+    self.subscribeToVariable('label', 'setText', view_model, 'presented_data', evaluation_policy=evaluation)
+
+    Every publication starts a new computation tagged with a version number. Computations superseded before they have
+    started are cancelled, results of those superseded later are discarded - only the newest result reaches the setter.
+    Results are delivered on the scheduler's event loop (see 'DeliveryPolicies' module), or, without a scheduler, on
+    the event loop the subscription was created in - or on the worker thread if there is none.
+
+    Getters of the source objects run on the worker threads, so they have to be safe to call from another thread.
+    Process pools cannot run getters of live objects - for them, give a 'transform' function (picklable, e.g. defined
+    at module level): the getter is then called on the publishing thread (it should only collect the inputs - cheaply)
+    and the transform computes the value from them in the pool.
+    """
+
+    def __init__(self, scheduler=None, executor: concurrent.futures.Executor = None, transform=None,
+                 max_workers: int = None, on_error=None):
+        """
+        :param scheduler: Scheduler of the subscriber's event loop - e.g. 'DeliveryPolicies.QtScheduler'. If 'None',
+            results are delivered on the subscriber's asyncio event loop or on the worker thread.
+        :param executor: Pool running the computations - 'ThreadPoolExecutor' or, with 'transform' given,
+            'ProcessPoolExecutor'. If 'None', a thread pool owned by the policy is created when needed.
+        :param transform: Function computing the delivered value from the getter's result - run in the pool instead of
+            the getter. If 'None', the getter itself runs in the pool.
+        :param max_workers: Number of threads of the pool created by the policy.
+        :param on_error: Function accepting the exception raised by a computation. If 'None', exceptions are only
+            counted and stored - see 'VersionedEvaluation.last_error'.
+        """
+        self.scheduler = scheduler
+        self.transform = transform
+        self.on_error = on_error
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self._max_workers,
+                                                                       thread_name_prefix='BackgroundEvaluation')
+            return self._executor
+
+    def wrap(self, evaluate, deliver, loop=None):
+        """
+        Creates the evaluation callable for a single subscription.
+
+        :param evaluate: Function without arguments returning the source value (the getter).
+        :param deliver: Function accepting the computed value - passes it to the subscriber.
+        :param loop: Event loop of the subscriber, if any.
+        :return: 'VersionedEvaluation' object - called for every publication instead of the setter.
+        """
+        return VersionedEvaluation(self, evaluate, deliver, loop)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts the pool created by the policy down - pools given to the constructor are left to their owners.
+
+        :param wait: If True, waits until the running computations end.
+        :return: None
+        """
+        with self._lock:
+            executor, owns_executor = self._executor, self._owns_executor
+            if owns_executor:
+                self._executor = None
+        if owns_executor and executor is not None:
+            executor.shutdown(wait)
+
+
+class VersionedEvaluation:
+    """
+    Evaluation callable created by 'BackgroundEvaluation' for a single subscription. Every call (publication) increases
+    'requested_version' and submits a computation tagged with it - the value passed to the call is ignored. Results are
+    delivered only if no newer computation has been requested in the meantime.
+    """
+    __slots__ = ('policy', 'evaluate', 'deliver', 'loop', 'requested_version', 'delivered_version', 'future',
+                 'cancelled_count', 'stale_count', 'errors_count', 'last_error', 'lock')
+
+    def __init__(self, policy: BackgroundEvaluation, evaluate, deliver, loop=None):
+        self.policy = policy
+        self.evaluate = evaluate
+        self.deliver = deliver
+        self.loop = loop
+        self.requested_version = 0
+        self.delivered_version = 0
+        # Newest computation submitted
+        self.future = None
+        self.cancelled_count = 0
+        self.stale_count = 0
+        self.errors_count = 0
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    def __call__(self, _=None):
+        # The version is taken before the computation is submitted - a computation ending immediately is compared
+        # against its own version, not the previous one
+        with self.lock:
+            self.requested_version += 1
+            version = self.requested_version
+
+        policy = self.policy
+        if policy.transform is None:
+            future = policy.executor.submit(self.evaluate)
+        else:
+            future = policy.executor.submit(policy.transform, self.evaluate())
+
+        with self.lock:
+            if version == self.requested_version:
+                previous_future, self.future = self.future, future
+            else:
+                # Superseded by a concurrent publication already
+                previous_future = future
+        # Computation that has not started yet is not needed anymore
+        if previous_future is not None and previous_future.cancel():
+            self.cancelled_count += 1
+        future.add_done_callback(partial(self._onComputed, version))
+
+    def _onComputed(self, version: int, future: concurrent.futures.Future):
+        if future.cancelled():
+            return
+        if version != self.requested_version:
+            self.stale_count += 1
+            return
+
+        error = future.exception()
+        if error is not None:
+            self.errors_count += 1
+            self.last_error = error
+            if self.policy.on_error is not None:
+                self.policy.on_error(error)
+            return
+
+        delivery = partial(self._deliverResult, version, future.result())
+        # This runs on the worker thread - schedulers pass the call to their event loop's thread
+        if self.policy.scheduler is not None:
+            self.policy.scheduler.callSoon(delivery)
+        elif self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(delivery)
+        else:
+            delivery()
+
+    def _deliverResult(self, version: int, new_value):
+        # Newer computation may have been requested while the result was waiting for the subscriber's thread
+        if version != self.requested_version:
+            self.stale_count += 1
+            return
+        self.delivered_version = version
+        self.deliver(new_value)
+
+    def wait(self, timeout: float = None):
+        """
+        Waits until the newest computation ends - its result may still be waiting for the subscriber's event loop.
+
+        :param timeout: Maximal time to wait in seconds.
+        :return: None
+        """
+        future = self.future
+        if future is not None:
+            concurrent.futures.wait((future,), timeout)
@@ -0,0 +1,339 @@
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+from ObservableObjects import ObservableObject, ObserverObject, BindingDeclaration
+from Utilities import PropertyChangedEventHandler
+
+# Headless benchmarks of the event mechanism - no Qt needed. Every benchmark runs on its own event hub, so the default
+# hub stays untouched. Usage:
+#
+#   python Benchmarks.py --output results.json
+#   python Benchmarks.py --baseline results.json --tolerance 0.25
+#
+# Results are written as JSON: {'environment': {...}, 'results': {benchmark_name: {'seconds': ..., ...}}}, where
+# 'seconds' is the median time of a single operation. When a baseline file is given, benchmarks slower than the
+# baseline by more than the tolerance are reported and the script exits with code 1.
+#
+# Timings depend on the machine, so no baseline is stored in the repository. Generate one on the machine the
+# comparisons will run on - from a separate checkout of the commit to compare against - e.g.:
+#
+#   git worktree add ../baseline <baseline-commit>
+#   (cd ../baseline && python Benchmarks.py --output ../baseline.json)
+#   python Benchmarks.py --baseline ../baseline.json
+#   git worktree remove ../baseline
+#
+# Benchmarks missing from the baseline (e.g. added since) are not compared.
+
+FAN_OUT_SIZES = (1, 10, 100, 1000, 10000, 100000)
+QUICK_FAN_OUT_SIZES = (1, 10, 100, 1000, 10000)
+
+
+class BenchmarkSource(ObservableObject):
+    value: int
+
+    def __init__(self):
+        self.value = 0
+
+    def getValue(self):
+        return self.value
+
+
+class BenchmarkTarget(ObserverObject):
+    def __init__(self):
+        self.value = None
+
+    def setValue(self, value):
+        self.value = value
+
+
+class DeclaredRowView(ObserverObject):
+    source: BenchmarkSource
+
+    bindings = (
+        BindingDeclaration('first', 'setValue', 'source', 'value', 'getValue'),
+        BindingDeclaration('second', 'setValue', 'source', 'value', 'getValue'),
+    )
+
+    def __init__(self, source: BenchmarkSource):
+        self.source = source
+        self.first = BenchmarkTarget()
+        self.second = BenchmarkTarget()
+        self.applyBindings()
+
+
+class ImperativeRowView(ObserverObject):
+    def __init__(self, source: BenchmarkSource):
+        self.source = source
+        self.first = BenchmarkTarget()
+        self.second = BenchmarkTarget()
+        for dst_property_name in ('first', 'second'):
+            self.subscribeToVariable(dst_property_name=dst_property_name, setter_method_name='setValue',
+                                     src_obj=self.source, src_property_name='value', getter_method_name='getValue')
+
+
+def measure(function, repeats: int = 5, number: int = 1) -> dict:
+    """
+    Measures the time of given operation. Garbage collector is disabled during the measurement.
+
+    :param function: Function without arguments - performs a single operation.
+    :param repeats: Number of measurements.
+    :param number: Number of operations performed in every measurement.
+    :return: Dictionary with keys: 'seconds' (median time of a single operation), 'min_seconds', 'repeats', 'number'.
+    """
+    timings = list()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {'seconds': statistics.median(timings), 'min_seconds': min(timings), 'repeats': repeats, 'number': number}
+
+
+def subscribe(event_hub: PropertyChangedEventHandler, source: BenchmarkSource, targets: list, use_methods: bool):
+    """
+    Subscribes every target to the source's 'value' attribute.
+
+    :param event_hub: Hub attached to the source.
+    :param source: Publisher.
+    :param targets: Subscribers.
+    :param use_methods: If True, custom getter and setter methods are used, otherwise 'getattr' and 'setattr'.
+    :return: None
+    """
+    getter_method_name, setter_method_name = ('getValue', 'setValue') if use_methods else (None, None)
+    dst_property_name = None if use_methods else 'value'
+    for target in targets:
+        target.subscribeToVariable(dst_property_name=dst_property_name, setter_method_name=setter_method_name,
+                                   src_obj=source, src_property_name='value', getter_method_name=getter_method_name)
+
+
+def benchmarkSubscribe(size: int) -> dict:
+    """
+    Throughput of 'subscribeToVariable' - time of a single subscription while building a registry of given size.
+    """
+    timings = list()
+    for _ in range(3):
+        with PropertyChangedEventHandler() as event_hub:
+            source = BenchmarkSource()
+            event_hub.attach(source)
+            targets = [BenchmarkTarget() for _ in range(size)]
+            timings.append(measure(lambda: subscribe(event_hub, source, targets, False), repeats=1)['seconds'])
+
+    seconds = statistics.median(timings) / size
+    return {'seconds': seconds, 'min_seconds': min(timings) / size, 'repeats': len(timings), 'number': size}
+
+
+def benchmarkPublish(size: int, use_methods: bool) -> dict:
+    """
+    Latency of 'publishPropertyChanges' for given fan-out (number of subscribers of the published attribute).
+    """
+    with PropertyChangedEventHandler() as event_hub:
+        source = BenchmarkSource()
+        event_hub.attach(source)
+        targets = [BenchmarkTarget() for _ in range(size)]
+        subscribe(event_hub, source, targets, use_methods)
+
+        def publish():
+            source.value += 1
+            source.publishPropertyChanges('value')
+
+        return measure(publish, repeats=5, number=max(1, 10000 // size))
+
+
+def benchmarkUpdateAllBindings(size: int, changed_only: bool) -> dict:
+    """
+    Time of 'updateAllBindings' over a registry of given size - 'size' publishers with 10 subscribers each. In the
+    'changed_only' mode one publisher in a hundred is marked as changed before every resynchronization.
+    """
+    with PropertyChangedEventHandler() as event_hub:
+        sources = [BenchmarkSource() for _ in range(size)]
+        event_hub.attach(*sources)
+        targets = [BenchmarkTarget() for _ in range(10 * size)]
+        for index, source in enumerate(sources):
+            subscribe(event_hub, source, targets[10 * index:10 * (index + 1)], False)
+        event_hub.updateAllBindings()
+
+        changed_sources = sources[::100]
+
+        def resync():
+            if changed_only:
+                for source in changed_sources:
+                    source.markPropertyChanged('value')
+            event_hub.updateAllBindings(changed_only=changed_only)
+
+        return measure(resync, repeats=5)
+
+
+def benchmarkNameofPublish() -> dict:
+    """
+    Publication with the attribute's name taken from 'nameof' - as in 'testing.py'. Requires 'varname' package.
+    """
+    from varname import nameof
+
+    with PropertyChangedEventHandler() as event_hub:
+        source = BenchmarkSource()
+        event_hub.attach(source)
+        subscribe(event_hub, source, [BenchmarkTarget()], False)
+
+        def publish():
+            source.value += 1
+            source.publishPropertyChanges(nameof(source.value))
+
+        return measure(publish, repeats=5, number=1000)
+
+
+def benchmarkViewModelSetter() -> dict:
+    """
+    Assignment to 'ViewModel.model_x' - publication of the property and recomputation of the dependent
+    'presented_data' property delivered to a subscriber.
+    """
+    from ViewModels import ViewModel
+
+    with PropertyChangedEventHandler() as event_hub:
+        view_model = ViewModel()
+        event_hub.attach(view_model)
+        target = BenchmarkTarget()
+        target.subscribeToVariable(dst_property_name='value', src_obj=view_model, src_property_name='presented_data')
+        values = [str(index) for index in range(1000)]
+        iterator = iter(values * 1000)
+
+        def assign():
+            view_model.model_x = next(iterator)
+
+        return measure(assign, repeats=5, number=1000)
+
+
+def benchmarkRowViews(view_class, size: int) -> dict:
+    """
+    Construction of row views subscribing to a shared source - time of a single view while building 'size' of them,
+    with bindings declared in the class ('DeclaredRowView') or created by 'subscribeToVariable' calls in the
+    constructor ('ImperativeRowView'). Both variants create the same subscriptions - the rows only track the cost of
+    each way of creating them.
+    """
+    timings = list()
+    for _ in range(3):
+        with PropertyChangedEventHandler() as event_hub:
+            source = BenchmarkSource()
+            event_hub.attach(source)
+            views = list()
+            timings.append(measure(lambda: views.extend(view_class(source) for _ in range(size)),
+                                   repeats=1)['seconds'])
+
+    seconds = statistics.median(timings) / size
+    return {'seconds': seconds, 'min_seconds': min(timings) / size, 'repeats': len(timings), 'number': size}
+
+
+def collectBenchmarks(quick: bool) -> list:
+    """
+    :param quick: If True, the largest sizes are skipped.
+    :return: List of (benchmark_name, function_without_arguments) tuples.
+    """
+    fan_out_sizes = QUICK_FAN_OUT_SIZES if quick else FAN_OUT_SIZES
+    benchmarks = list()
+
+    for size in fan_out_sizes:
+        benchmarks.append(('subscribe/getattr/n=%d' % size, lambda size=size: benchmarkSubscribe(size)))
+    for size in fan_out_sizes:
+        benchmarks.append(('publish/getattr/n=%d' % size, lambda size=size: benchmarkPublish(size, False)))
+        benchmarks.append(('publish/method/n=%d' % size, lambda size=size: benchmarkPublish(size, True)))
+    for size in fan_out_sizes[:-1]:
+        benchmarks.append(('update_all_bindings/full/n=%d' % size,
+                           lambda size=size: benchmarkUpdateAllBindings(size, False)))
+        benchmarks.append(('update_all_bindings/changed_only/n=%d' % size,
+                           lambda size=size: benchmarkUpdateAllBindings(size, True)))
+    for size in fan_out_sizes[:-1]:
+        benchmarks.append(('row_views/declared/n=%d' % size,
+                           lambda size=size: benchmarkRowViews(DeclaredRowView, size)))
+        benchmarks.append(('row_views/imperative/n=%d' % size,
+                           lambda size=size: benchmarkRowViews(ImperativeRowView, size)))
+    benchmarks.append(('nameof/publish', benchmarkNameofPublish))
+    benchmarks.append(('view_model/setter', benchmarkViewModelSetter))
+    return benchmarks
+
+
+def runBenchmarks(quick: bool = False, name_filter: str = None) -> dict:
+    """
+    Runs the benchmarks and prints their results.
+
+    :param quick: If True, the largest sizes are skipped.
+    :param name_filter: If given, only benchmarks whose names contain this text are run.
+    :return: Dictionary - {'environment': {...}, 'results': {benchmark_name: result_dictionary}, 'skipped': {...}}.
+    """
+    results, skipped = dict(), dict()
+    for name, benchmark in collectBenchmarks(quick):
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            results[name] = benchmark()
+        except ImportError as E:
+            # Optional dependency (e.g. 'varname') is not installed
+            skipped[name] = str(E)
+            print('%-45s skipped (%s)' % (name, E))
+            continue
+        print('%-45s %12.3f us' % (name, results[name]['seconds'] * 1e6))
+
+    environment = {'python': sys.version.split()[0], 'implementation': platform.python_implementation(),
+                   'platform': platform.platform(), 'quick': quick}
+    return {'environment': environment, 'results': results, 'skipped': skipped}
+
+
+def compareWithBaseline(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compares the results with the baseline - both in the format returned by 'runBenchmarks'.
+
+    :param results: Current results.
+    :param baseline: Stored results.
+    :param tolerance: Allowed relative slowdown - e.g. 0.25 means 25%.
+    :return: List of regressions - tuples of (benchmark_name, baseline_seconds, current_seconds).
+    """
+    regressions = list()
+    for name, result in results['results'].items():
+        baseline_result = baseline['results'].get(name)
+        if baseline_result is None:
+            continue
+        if result['seconds'] > baseline_result['seconds'] * (1 + tolerance):
+            regressions.append((name, baseline_result['seconds'], result['seconds']))
+    return regressions
+
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks of the property changed events mechanism.')
+    parser.add_argument('--output', help='Path of the JSON file to write the results to.')
+    parser.add_argument('--baseline', help='Path of the JSON file with results to compare with.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown compared to the baseline (default: 0.25).')
+    parser.add_argument('--quick', action='store_true', help='Skip the largest sizes.')
+    parser.add_argument('--filter', dest='name_filter', help='Run only benchmarks whose names contain this text.')
+    options = parser.parse_args(arguments)
+
+    results = runBenchmarks(options.quick, options.name_filter)
+
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compareWithBaseline(results, baseline, options.tolerance)
+        for name, baseline_seconds, current_seconds in regressions:
+            print('REGRESSION %-45s %12.3f us -> %12.3f us (x%.2f)' %
+                  (name, baseline_seconds * 1e6, current_seconds * 1e6, current_seconds / baseline_seconds))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import threading
+from collections import deque
+
+
+class Operator:
+    """
+    Base class of binding operators - steps transforming, dropping or aggregating the published values on the way to
+    the subscriber's setter. A chain of operators is passed to 'ObserverObject.subscribeToVariable' (with the
+    'operators' parameter), e.g.:
+
+    self.subscribeToVariable('label', 'setText', view_model, 'temperature',
+                             operators=[Filter(lambda value: value is not None), Window(10, statistics.mean),
+                                        DistinctUntilChanged(), Map('{:.1f} C'.format)])
+
+    Operators are specifications only - for every subscription the chain is fused into a single callable (see
+    'fuseOperators'), which holds the state of the stateful operators (distinct, buffer, window). So one chain can be
+    shared by many subscriptions.
+
+    Methods to implement:
+
+    - wrap
+    Creates the callable of the operator for a single subscription - accepting a value and passing the results to the
+    downstream callable (the next operator or the setter).
+    """
+
+    def wrap(self, downstream):
+        """
+        :param downstream: Function accepting the operator's output value.
+        :return: Function accepting the operator's input value.
+        """
+        raise NotImplementedError
+
+
+class Map(Operator):
+    """
+    Operator replacing every value with the result of given function - e.g. 'Map(str)' instead of a setter method that
+    only converts the value.
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    def wrap(self, downstream):
+        function = self.function
+        return lambda value: downstream(function(value))
+
+
+class Filter(Operator):
+    """
+    Operator passing on only the values for which given predicate returns True.
+    """
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    def wrap(self, downstream):
+        predicate = self.predicate
+
+        def filterValue(value):
+            if predicate(value):
+                downstream(value)
+
+        return filterValue
+
+
+class DistinctUntilChanged(Operator):
+    """
+    Operator dropping values equal to the previous one passed on - so e.g. a recomputed but unchanged text does not
+    reach the widget. Values are compared with '==' by default.
+    """
+
+    def __init__(self, comparator=None):
+        """
+        :param comparator: Function accepting the previous and the new value and returning True if they are the same.
+        """
+        self.comparator = comparator
+
+    def wrap(self, downstream):
+        comparator = self.comparator
+        no_value = object()
+        previous_value = no_value
+
+        def distinctValue(value):
+            nonlocal previous_value
+            if previous_value is not no_value:
+                try:
+                    same = comparator(previous_value, value) if comparator is not None else \
+                        previous_value is value or bool(previous_value == value)
+                except Exception:
+                    # E.g. element-wise comparisons of arrays
+                    same = False
+                if same:
+                    return
+            previous_value = value
+            downstream(value)
+
+        return distinctValue
+
+
+class Buffer(Operator):
+    """
+    Operator collecting the values into lists - a list is passed on when it holds 'count' values or when 'interval'
+    seconds have passed since its first value (whichever comes first). E.g. 'Buffer(count=100)' lets a table append
+    rows in batches instead of one by one.
+    """
+
+    def __init__(self, count: int = None, interval: float = None, scheduler=None):
+        """
+        :param count: Maximal number of values in a list.
+        :param interval: Maximal time (in seconds) a value waits in the buffer - requires a scheduler.
+        :param scheduler: Scheduler used to pass the lists on after the interval (see 'DeliveryPolicies' module) - the
+            lists are passed on the scheduler's event loop then.
+        """
+        if count is None and interval is None:
+            raise ValueError("Buffer operator requires 'count' or 'interval'!")
+        if interval is not None and scheduler is None:
+            raise ValueError('Buffer operator with interval requires a scheduler!')
+        self.count = count
+        self.interval = interval
+        self.scheduler = scheduler
+
+    def wrap(self, downstream):
+        count, interval, scheduler = self.count, self.interval, self.scheduler
+        buffer = list()
+        scheduled_call = None
+        lock = threading.Lock()
+
+        def flush():
+            nonlocal buffer, scheduled_call
+            with lock:
+                if scheduled_call is not None:
+                    scheduled_call.cancel()
+                    scheduled_call = None
+                values, buffer = buffer, list()
+            # Downstream is called outside the lock - it can publish further changes
+            if values:
+                downstream(values)
+
+        def bufferValue(value):
+            nonlocal scheduled_call
+            with lock:
+                buffer.append(value)
+                full = count is not None and len(buffer) >= count
+                if not full and interval is not None and scheduled_call is None:
+                    scheduled_call = scheduler.callLater(interval, flush)
+            if full:
+                flush()
+
+        return bufferValue
+
+
+class Window(Operator):
+    """
+    Operator passing on the aggregate of the sliding window of the newest values - e.g. 'Window(10, statistics.mean)'
+    for a moving average. Every value produces an output (also before the window is full, unless 'full_only' is set).
+    """
+
+    def __init__(self, size: int, aggregate=tuple, full_only: bool = False):
+        """
+        :param size: Number of values in the window.
+        :param aggregate: Function accepting the window's values (from the oldest to the newest) - by default the tuple
+            of the values is passed on.
+        :param full_only: If True, nothing is passed on until the window holds 'size' values.
+        """
+        if size < 1:
+            raise ValueError('Window size has to be positive!')
+        self.size = size
+        self.aggregate = aggregate
+        self.full_only = full_only
+
+    def wrap(self, downstream):
+        size, aggregate, full_only = self.size, self.aggregate, self.full_only
+        window = deque(maxlen=size)
+        lock = threading.Lock()
+
+        def windowValue(value):
+            with lock:
+                window.append(value)
+                if full_only and len(window) < size:
+                    return
+                aggregated_value = aggregate(window)
+            downstream(aggregated_value)
+
+        return windowValue
+
+
+def fuseOperators(operators, downstream):
+    """
+    Fuses the chain of operators into a single callable. Runs of stateless operators ('Map', 'Filter') are collapsed
+    into one function - so e.g. three maps cost one call instead of three hops.
+
+    :param operators: Sequence of 'Operator' objects - in order of processing.
+    :param downstream: Function accepting the output values of the chain (the setter).
+    :return: Function accepting the published values.
+    """
+    fused = downstream
+    steps = list()
+    # Operators are wrapped from the last one - every callable needs its downstream
+    for operator in reversed(list(operators)):
+        if type(operator) in (Map, Filter):
+            steps.append(operator)
+            continue
+        fused = _fuseStateless(steps, fused)
+        steps = list()
+        fused = operator.wrap(fused)
+    return _fuseStateless(steps, fused)
+
+
+def _fuseStateless(reversed_steps: list, downstream):
+    if not reversed_steps:
+        return downstream
+    if len(reversed_steps) == 1:
+        return reversed_steps[0].wrap(downstream)
+
+    steps = tuple((type(step) is Map, step.function if type(step) is Map else step.predicate)
+                  for step in reversed(reversed_steps))
+    if all(is_map for is_map, _ in steps):
+        functions = tuple(function for _, function in steps)
+
+        def mapValue(value):
+            for function in functions:
+                value = function(value)
+            downstream(value)
+
+        return mapValue
+
+    def processValue(value):
+        for is_map, function in steps:
+            if is_map:
+                value = function(value)
+            elif not function(value):
+                return
+        downstream(value)
+
+    return processValue
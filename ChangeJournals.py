@@ -0,0 +1,357 @@
+import mmap
+import os
+import pickle
+import reprlib
+import struct
+import threading
+import time
+
+from Utilities import PropertyChangedEventHandler as uPCEventHandler
+from Utilities import getEventHub as uGetEventHub
+
+
+class JournalRecord:
+    """
+    Single record read from a 'ChangeJournal' - publication of 'property_name' attribute of the publisher identified by
+    'publisher_id' (identity of the object in the recording process) and 'publisher_type' (name of its class).
+    'value' is the attribute's value at the moment of publication - if it could not be serialized, its (shortened)
+    'repr' text is stored instead and 'value_is_repr' is True. If it could not be read at all, 'has_value' is False.
+    """
+    __slots__ = ('timestamp', 'publisher_id', 'publisher_type', 'property_name', 'value', 'has_value',
+                 'value_is_repr')
+
+    def __init__(self, timestamp: float, publisher_id: int, publisher_type: str, property_name: str, value,
+                 has_value: bool, value_is_repr: bool):
+        self.timestamp = timestamp
+        self.publisher_id = publisher_id
+        self.publisher_type = publisher_type
+        self.property_name = property_name
+        self.value = value
+        self.has_value = has_value
+        self.value_is_repr = value_is_repr
+
+    def __repr__(self):
+        return 'JournalRecord(%.6f, %s#%x.%s=%r)' % (self.timestamp, self.publisher_type, self.publisher_id,
+                                                    self.property_name, self.value)
+
+
+class ChangeJournal:
+    """
+    Recorder of property changed events - fixed-size ring buffer of compact binary records, optionally backed by a
+    memory-mapped file (so the journal survives the process and can be inspected after a crash). When the buffer is
+    full, the oldest records are overwritten. Enabled per hub with 'PropertyChangedEventHandler.setJournal', e.g.:
+
+    journal = ChangeJournal(capacity=16 * 1024 * 1024, path='ui_events.journal')
+    PropertyChangedEventHandler.setJournal(journal)
+
+    Buffer layout: header (magic, head position, tail position, records count) followed by the data area. Positions
+    are absolute (ever-increasing) - the physical offset is 'position % capacity'. Every record is stored contiguously:
+
+    <I total_length> <d timestamp> <Q publisher_id> <B type_length> <H name_length> <B flags> type name value
+
+    Records that do not fit before the end of the data area are written at its beginning - the rest of the area is
+    skipped (marked with zero length, if there is room for it). Values are serialized with 'pickle' by default.
+    """
+    MAGIC = b'OOJ1'
+    HEADER = struct.Struct('<4sQQQ')
+    RECORD_HEADER = struct.Struct('<IdQBHB')
+    LENGTH = struct.Struct('<I')
+
+    FLAG_NO_VALUE = 1
+    FLAG_REPR = 2
+
+    def __init__(self, capacity: int = 4 * 1024 * 1024, path: str = None, serializer=None, deserializer=None,
+                 clock=time.time):
+        """
+        :param capacity: Size of the data area in bytes.
+        :param path: Path of the file backing the buffer. If the file contains a journal of the same capacity, it is
+            continued. If 'None', the buffer is kept in memory.
+        :param serializer: Function converting a value into bytes - 'pickle.dumps' by default.
+        :param deserializer: Function converting bytes into a value - 'pickle.loads' by default.
+        :param clock: Function returning current timestamp.
+        """
+        self.capacity = capacity
+        self.path = path
+        self._serialize = serializer if serializer is not None else \
+            (lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self._deserialize = deserializer if deserializer is not None else pickle.loads
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Encoded names - {name: bytes}, publisher type names and attribute names repeat all the time
+        self._encoded_names = dict()
+        # Types whose values could not be serialized - their values are stored as shortened 'repr' text right away
+        self._unserializable_types = set()
+        # 'repr' limiting the size of containers - a large value does not cost a full 'repr' on every publication
+        limited_repr = reprlib.Repr()
+        limited_repr.maxstring = limited_repr.maxother = 200
+        self._repr = limited_repr.repr
+        self.dropped_records = 0
+
+        size = self.HEADER.size + capacity
+        self._file = None
+        resized = False
+        if path is None:
+            self._buffer = bytearray(size)
+        else:
+            mode = 'r+b' if os.path.exists(path) else 'w+b'
+            self._file = open(path, mode)
+            if os.path.getsize(path) != size:
+                self._file.truncate(size)
+                resized = True
+            self._buffer = mmap.mmap(self._file.fileno(), size)
+
+        magic, self._head, self._tail, self.records_count = self.HEADER.unpack_from(self._buffer, 0)
+        # Journals of different capacity cannot be continued
+        if magic != self.MAGIC or resized:
+            self._head = self._tail = self.records_count = 0
+            self._writeHeader()
+
+    def __len__(self) -> int:
+        return self.records_count
+
+    def __iter__(self):
+        return iter(self.records())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, pub_obj, obj_property_name: str):
+        """
+        Appends the record of a publication - with the current value of the attribute.
+
+        :param pub_obj: Publisher.
+        :param obj_property_name: Name of the published attribute.
+        :return: None
+        """
+        flags = 0
+        try:
+            value = getattr(pub_obj, obj_property_name)
+        except Exception:
+            value_bytes, flags = b'', self.FLAG_NO_VALUE
+        else:
+            value_type = type(value)
+            try:
+                if value_type in self._unserializable_types:
+                    raise TypeError
+                value_bytes = self._serialize(value)
+            except Exception:
+                # Values of this type are not serialized again - a shortened repr is stored without another attempt
+                self._unserializable_types.add(value_type)
+                value_bytes, flags = self._repr(value).encode('utf-8', 'replace'), self.FLAG_REPR
+
+        type_bytes = self._encodeName(type(pub_obj).__name__)
+        name_bytes = self._encodeName(obj_property_name)
+        self.append(self._clock(), id(pub_obj), type_bytes, name_bytes, value_bytes, flags)
+
+    def append(self, timestamp: float, publisher_id: int, type_bytes: bytes, name_bytes: bytes, value_bytes: bytes,
+               flags: int = 0):
+        """
+        Appends a raw record - see 'record'.
+
+        :return: None
+        """
+        header_size = self.RECORD_HEADER.size
+        total_length = header_size + len(type_bytes) + len(name_bytes) + len(value_bytes)
+        if total_length > self.capacity:
+            self.dropped_records += 1
+            return
+
+        with self._lock:
+            start = self._head
+            offset = start % self.capacity
+            if offset + total_length > self.capacity:
+                # The record does not fit before the end of the area - continue from its beginning
+                if self.capacity - offset >= self.LENGTH.size:
+                    self._makeRoom(start, start + self.LENGTH.size)
+                    self.LENGTH.pack_into(self._buffer, self.HEADER.size + offset, 0)
+                start += self.capacity - offset
+                offset = 0
+            self._makeRoom(start, start + total_length)
+
+            position = self.HEADER.size + offset
+            self.RECORD_HEADER.pack_into(self._buffer, position, total_length, timestamp, publisher_id,
+                                         len(type_bytes), len(name_bytes), flags)
+            position += header_size
+            for data in (type_bytes, name_bytes, value_bytes):
+                self._buffer[position:position + len(data)] = data
+                position += len(data)
+
+            self._head = start + total_length
+            self.records_count += 1
+            self._writeHeader()
+
+    def records(self) -> list:
+        """
+        :return: List of 'JournalRecord' objects - from the oldest to the newest.
+        """
+        with self._lock:
+            raw_records = list(self._rawRecords())
+        return [self._decode(raw_record) for raw_record in raw_records]
+
+    def clear(self):
+        """
+        Removes all the records.
+
+        :return: None
+        """
+        with self._lock:
+            self._head = self._tail = self.records_count = 0
+            self._writeHeader()
+
+    def flush(self):
+        """
+        Flushes the memory-mapped file (if any) to the disk.
+
+        :return: None
+        """
+        if self._file is not None:
+            self._buffer.flush()
+
+    def close(self):
+        """
+        Closes the memory-mapped file (if any). The journal cannot be used afterwards.
+
+        :return: None
+        """
+        if self._file is not None:
+            self._buffer.flush()
+            self._buffer.close()
+            self._file.close()
+            self._file = None
+
+    def _encodeName(self, name: str) -> bytes:
+        encoded_name = self._encoded_names.get(name)
+        if encoded_name is None:
+            encoded_name = self._encoded_names[name] = name.encode('utf-8')
+        return encoded_name
+
+    def _writeHeader(self):
+        self.HEADER.pack_into(self._buffer, 0, self.MAGIC, self._head, self._tail, self.records_count)
+
+    def _nextRecordPosition(self, position: int):
+        """
+        :return: Tuple of (record_position, record_length) of the record stored at given position or after the skipped
+            end of the area.
+        """
+        offset = position % self.capacity
+        if self.capacity - offset >= self.LENGTH.size:
+            total_length = self.LENGTH.unpack_from(self._buffer, self.HEADER.size + offset)[0]
+            if total_length:
+                return position, total_length
+        # Skipped end of the area - the record is at the beginning
+        position += self.capacity - offset
+        return position, self.LENGTH.unpack_from(self._buffer, self.HEADER.size)[0]
+
+    def _makeRoom(self, start_position: int, end_position: int):
+        # Drops the oldest records overlapping the area that is going to be written (from 'start_position' up to
+        # 'end_position')
+        while self.records_count and end_position - self._tail > self.capacity:
+            position, total_length = self._nextRecordPosition(self._tail)
+            self._tail = position + total_length
+            self.records_count -= 1
+        if not self.records_count:
+            # The journal starts with the written area - which may follow a skipped end of the area, not the head
+            self._tail = start_position
+
+    def _rawRecords(self):
+        position = self._tail
+        for _ in range(self.records_count):
+            position, total_length = self._nextRecordPosition(position)
+            offset = self.HEADER.size + position % self.capacity
+            yield bytes(self._buffer[offset:offset + total_length])
+            position += total_length
+
+    def _decode(self, data: bytes) -> JournalRecord:
+        header_size = self.RECORD_HEADER.size
+        _, timestamp, publisher_id, type_length, name_length, flags = self.RECORD_HEADER.unpack_from(data, 0)
+        publisher_type = data[header_size:header_size + type_length].decode('utf-8')
+        name_start = header_size + type_length
+        property_name = data[name_start:name_start + name_length].decode('utf-8')
+        value_bytes = data[name_start + name_length:]
+
+        value = None
+        if flags & self.FLAG_REPR:
+            value = value_bytes.decode('utf-8', 'replace')
+        elif not flags & self.FLAG_NO_VALUE:
+            value = self._deserialize(value_bytes)
+        return JournalRecord(timestamp, publisher_id, publisher_type, property_name, value,
+                             not flags & self.FLAG_NO_VALUE, bool(flags & self.FLAG_REPR))
+
+
+class ChangeJournalReplayer:
+    """
+    Replays records of a 'ChangeJournal' - assigns the recorded values to target objects and publishes the changes
+    through an event hub. Targets are looked up by the recorded publisher id first and by the publisher's class name
+    next, so a recording from another process can be replayed on freshly created objects, e.g.:
+
+    replayer = ChangeJournalReplayer(journal.records(), {'ViewModel': view_model})
+    replayer.replay()
+
+    By default the records are replayed as fast as possible - so a recording can be used as a realistic load for
+    benchmarks. With 'realtime' set, the original intervals between the records are kept (scaled by 'speed').
+    """
+
+    def __init__(self, records, targets: dict, event_hub: uPCEventHandler = None):
+        """
+        :param records: Iterable of 'JournalRecord' objects (or a 'ChangeJournal').
+        :param targets: Dictionary - {publisher_id or publisher class name: target object}.
+        :param event_hub: Hub to publish the changes through. If 'None', the hub of every target is used.
+        """
+        self.records = list(records)
+        self.targets = targets
+        self.event_hub = event_hub
+
+    def replay(self, realtime: bool = False, speed: float = 1.0, apply_values: bool = True) -> int:
+        """
+        Replays the records.
+
+        :param realtime: If True, intervals between the records are kept.
+        :param speed: Replay speed multiplier used with 'realtime'.
+        :param apply_values: If True, recorded values are assigned to the targets' attributes before publishing.
+            Values stored as 'repr' text and read-only attributes are never assigned.
+        :return: Number of records replayed (records without a target are skipped).
+        """
+        replayed_count = 0
+        first_timestamp, replay_start = None, time.perf_counter()
+
+        for journal_record in self.records:
+            target = self.targets.get(journal_record.publisher_id)
+            if target is None:
+                target = self.targets.get(journal_record.publisher_type)
+            if target is None:
+                continue
+
+            if realtime:
+                if first_timestamp is None:
+                    first_timestamp = journal_record.timestamp
+                delay = (journal_record.timestamp - first_timestamp) / speed - (time.perf_counter() - replay_start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            self.replayRecord(journal_record, target, apply_values)
+            replayed_count += 1
+        return replayed_count
+
+    def replayRecord(self, journal_record: JournalRecord, target, apply_values: bool = True):
+        """
+        Replays a single record on given target.
+
+        :return: None
+        """
+        property_name = journal_record.property_name
+        event_hub = self.event_hub if self.event_hub is not None else uGetEventHub(target)
+
+        # Setters of observable properties and of plain properties (like 'ViewModel.model_x') publish the change
+        # themselves. Within a batch their publication and the explicit one are coalesced - subscribers receive the
+        # replayed value once, whether the setter publishes or not.
+        with event_hub.batch():
+            if apply_values and journal_record.has_value and not journal_record.value_is_repr:
+                try:
+                    setattr(target, property_name, journal_record.value)
+                except AttributeError:
+                    # Read-only (e.g. computed) attribute - only the publication is replayed
+                    pass
+            event_hub.publish(target, property_name)
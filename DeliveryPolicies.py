@@ -0,0 +1,435 @@
+import heapq
+import threading
+import time
+from functools import partial
+
+
+class ScheduledCall:
+    """
+    Class representing a callback scheduled with a 'Scheduler' - can be cancelled before it is called.
+    """
+    __slots__ = ('when', 'callback', 'cancelled', 'on_cancel')
+
+    def __init__(self, when: float, callback, on_cancel=None):
+        """
+        :param when: Time (in the scheduler's clock) when the callback is due.
+        :param callback: Function without arguments.
+        :param on_cancel: Function without arguments called when the call is cancelled - used by schedulers to release
+            their resources (e.g. timers).
+        """
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+        self.on_cancel = on_cancel
+
+    def cancel(self):
+        """
+        Cancels the call - the callback will not be called.
+
+        :return: None
+        """
+        if not self.cancelled:
+            self.cancelled = True
+            if self.on_cancel is not None:
+                self.on_cancel()
+
+    def run(self):
+        """
+        Calls the callback - unless the call has been cancelled.
+
+        :return: None
+        """
+        if not self.cancelled:
+            self.cancelled = True
+            self.callback()
+
+
+class Scheduler:
+    """
+    Base class of schedulers used by delivery policies to postpone deliveries of values to subscribers. Subclasses
+    adapt particular event loops (see 'QtScheduler', 'AsyncioScheduler') or simulate the time ('FakeClockScheduler').
+    Methods to implement:
+
+    - now
+    Returns current time in seconds (monotonic clock).
+
+    - callLater
+    Schedules a callback to be called after given delay, on the thread of the event loop. Has to be safe to call from
+    any thread - policies, background evaluations and process bridges schedule calls from the publishing or worker
+    threads.
+    """
+
+    def now(self) -> float:
+        """
+        :return: Current time in seconds.
+        """
+        raise NotImplementedError
+
+    def callLater(self, delay: float, callback) -> ScheduledCall:
+        """
+        Schedules the callback to be called after given delay.
+
+        :param delay: Delay in seconds.
+        :param callback: Function without arguments.
+        :return: 'ScheduledCall' object - can be used to cancel the call.
+        """
+        raise NotImplementedError
+
+    def callSoon(self, callback) -> ScheduledCall:
+        """
+        Schedules the callback to be called at the next tick of the event loop.
+
+        :param callback: Function without arguments.
+        :return: 'ScheduledCall' object - can be used to cancel the call.
+        """
+        return self.callLater(0, callback)
+
+
+class FakeClockScheduler(Scheduler):
+    """
+    Pure-python scheduler with simulated clock - for tests and headless benchmarks. The time moves only when
+    'advance' is called - then all the callbacks due are called, in order of their due times.
+    """
+
+    def __init__(self, start_time: float = 0.0):
+        """
+        :param start_time: Initial time of the clock.
+        """
+        self._time = start_time
+        # Heap of (due time, sequence number, call) - calls due at the same time are called in order of scheduling
+        self._calls = list()
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return self._time
+
+    def callLater(self, delay: float, callback) -> ScheduledCall:
+        scheduled_call = ScheduledCall(self._time + max(delay, 0), callback)
+        with self._lock:
+            self._sequence += 1
+            heapq.heappush(self._calls, (scheduled_call.when, self._sequence, scheduled_call))
+        return scheduled_call
+
+    def advance(self, seconds: float = 0.0):
+        """
+        Moves the clock forward by given number of seconds and calls all the callbacks that become due (also the ones
+        scheduled by the callbacks themselves).
+
+        :param seconds: Number of seconds.
+        :return: None
+        """
+        target_time = self._time + seconds
+        while True:
+            with self._lock:
+                if not self._calls or self._calls[0][0] > target_time:
+                    break
+                scheduled_call = heapq.heappop(self._calls)[2]
+            self._time = max(self._time, scheduled_call.when)
+            scheduled_call.run()
+        self._time = target_time
+
+    def pendingCount(self) -> int:
+        """
+        :return: Number of scheduled calls that have not been called nor cancelled yet.
+        """
+        with self._lock:
+            return sum(1 for _, _, scheduled_call in self._calls if not scheduled_call.cancelled)
+
+
+class QtScheduler(Scheduler):
+    """
+    Scheduler adapting PyQt5 event loop - callbacks are called by single-shot QTimers, on the thread of the Qt event
+    loop (so GUI widgets can be updated safely). Requires PyQt5 and 'QApplication' instance created.
+
+    The scheduler can be used from any thread - e.g. by publishers running on worker threads, by background evaluations
+    or by the receiver of a process bridge. A QTimer fires only on a thread running a Qt event loop, so calls scheduled
+    from other threads are passed to the GUI thread first (with a queued signal) and their timers are started there.
+    """
+
+    def __init__(self):
+        from PyQt5 import QtCore
+        self._QtCore = QtCore
+        # Thread of the Qt event loop and the object living on it (functions passed to its signal are called there) -
+        # found when the first call is scheduled, so the scheduler can be created before the 'QApplication'
+        self._gui_thread = None
+        self._dispatcher = None
+        self._lock = threading.Lock()
+        # Timers need to be referenced until they fire - accessed only on the GUI thread
+        self._timers = set()
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def callLater(self, delay: float, callback) -> ScheduledCall:
+        scheduled_call = ScheduledCall(self.now() + max(delay, 0), callback)
+        self._callOnGuiThread(self._startTimer, scheduled_call)
+        return scheduled_call
+
+    def _callOnGuiThread(self, function, *args):
+        if self._dispatcher is None:
+            self._createDispatcher()
+        if self._QtCore.QThread.currentThread() == self._gui_thread:
+            function(*args)
+        else:
+            self._dispatcher.requested.emit(partial(function, *args))
+
+    def _createDispatcher(self):
+        with self._lock:
+            if self._dispatcher is not None:
+                return
+            application = self._QtCore.QCoreApplication.instance()
+            if application is None:
+                raise RuntimeError('QtScheduler requires QApplication instance created!')
+            dispatcher = createQtDispatcher(self._QtCore)
+            dispatcher.moveToThread(application.thread())
+            self._gui_thread = application.thread()
+            self._dispatcher = dispatcher
+
+    def _startTimer(self, scheduled_call: ScheduledCall):
+        # The call could have been cancelled while waiting for the GUI thread
+        if scheduled_call.cancelled:
+            return
+        timer = self._QtCore.QTimer()
+        timer.setSingleShot(True)
+        timer.setTimerType(self._QtCore.Qt.PreciseTimer)
+
+        def stopTimer():
+            timer.stop()
+            self._timers.discard(timer)
+
+        def onTimeout():
+            self._timers.discard(timer)
+            scheduled_call.run()
+
+        timer.timeout.connect(onTimeout)
+        self._timers.add(timer)
+        scheduled_call.on_cancel = lambda: self._callOnGuiThread(stopTimer)
+        timer.start(max(int((scheduled_call.when - self.now()) * 1000), 0))
+
+
+def createQtDispatcher(QtCore):
+    """
+    Creates QObject calling the functions emitted with its 'requested' signal on the thread the object lives in (the
+    connection is queued, so the signal can be emitted from any thread). The class is defined here, so PyQt5 is imported
+    only when 'QtScheduler' is used.
+
+    :param QtCore: 'PyQt5.QtCore' module.
+    :return: QObject with 'requested' signal.
+    """
+
+    class QtDispatcher(QtCore.QObject):
+        requested = QtCore.pyqtSignal(object)
+
+        def __init__(self):
+            super().__init__()
+            self.requested.connect(self.callFunction, QtCore.Qt.QueuedConnection)
+
+        @QtCore.pyqtSlot(object)
+        def callFunction(self, function):
+            function()
+
+    return QtDispatcher()
+
+
+class AsyncioScheduler(Scheduler):
+    """
+    Scheduler adapting asyncio event loop - callbacks are called by the loop, also when scheduled from other threads.
+    """
+
+    def __init__(self, loop=None):
+        """
+        :param loop: Event loop to use. If 'None', the loop running when the scheduler is created is used.
+        """
+        import asyncio
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+
+    def now(self) -> float:
+        return self._loop.time()
+
+    def callLater(self, delay: float, callback) -> ScheduledCall:
+        scheduled_call = ScheduledCall(self.now() + max(delay, 0), callback)
+        self._loop.call_soon_threadsafe(self._scheduleOnLoop, scheduled_call)
+        return scheduled_call
+
+    def _scheduleOnLoop(self, scheduled_call: ScheduledCall):
+        handle = self._loop.call_at(scheduled_call.when, scheduled_call.run)
+        scheduled_call.on_cancel = handle.cancel
+
+
+class DeliveryPolicy:
+    """
+    Base class of delivery policies - specifications of how the values published for a subscription are delivered to
+    the subscriber's setter method. Policies are passed to 'ObserverObject.subscribeToVariable' (with the
+    'delivery_policy' parameter). For every subscription the policy creates separate delivery callable with 'wrap'
+    method, so one policy object can be shared by many subscriptions.
+
+    The base class delivers the values immediately - as if no policy was given.
+    """
+
+    def wrap(self, setter):
+        """
+        Creates the delivery callable for a single subscription.
+
+        :param setter: Function accepting new value - passes it to the subscriber.
+        :return: Function accepting new value - called for every publication instead of the setter.
+        """
+        return setter
+
+
+class ImmediateDelivery(DeliveryPolicy):
+    """
+    Delivery policy passing every published value to the subscriber immediately, on the publishing thread.
+    """
+
+
+class ScheduledDelivery(DeliveryPolicy):
+    """
+    Base class of delivery policies using a scheduler. Values published before the scheduled delivery takes place
+    replace each other - only the newest value is delivered.
+    """
+
+    def __init__(self, scheduler: Scheduler):
+        """
+        :param scheduler: Scheduler used to postpone the deliveries - e.g. 'QtScheduler' in GUI applications or
+            'FakeClockScheduler' in tests.
+        """
+        if scheduler is None:
+            raise ValueError('Scheduled delivery policy requires a scheduler!')
+        self.scheduler = scheduler
+
+    def wrap(self, setter):
+        return LatestValueDelivery(self, setter)
+
+    def onValue(self, delivery):
+        """
+        Called (under the delivery's lock) after new value has been stored - schedules its delivery if needed.
+
+        :param delivery: 'LatestValueDelivery' object of the subscription.
+        :return: True if the value should be delivered immediately.
+        """
+        raise NotImplementedError
+
+
+class LatestValueDelivery:
+    """
+    Delivery callable created by 'ScheduledDelivery' policies for a single subscription. Stores the newest published
+    value and lets the policy decide when it is passed to the subscriber's setter. Intermediate values are dropped.
+    """
+    __slots__ = ('policy', 'setter', 'value', 'has_value', 'scheduled_call', 'last_delivery_time', 'lock')
+
+    def __init__(self, policy: ScheduledDelivery, setter):
+        self.policy = policy
+        self.setter = setter
+        self.value = None
+        self.has_value = False
+        self.scheduled_call = None
+        self.last_delivery_time = None
+        self.lock = threading.Lock()
+
+    def __call__(self, new_value):
+        with self.lock:
+            self.value = new_value
+            self.has_value = True
+            deliver_now = self.policy.onValue(self)
+        # Setter is called outside the lock - it can publish further changes
+        if deliver_now:
+            self.deliver()
+
+    def schedule(self, delay: float):
+        """
+        Schedules delivery of the newest value after given delay - unless a delivery is scheduled already.
+
+        :param delay: Delay in seconds.
+        :return: None
+        """
+        if self.scheduled_call is None:
+            self.scheduled_call = self.policy.scheduler.callLater(delay, self.deliver)
+
+    def reschedule(self, delay: float):
+        """
+        Cancels the scheduled delivery (if any) and schedules it again after given delay.
+
+        :param delay: Delay in seconds.
+        :return: None
+        """
+        if self.scheduled_call is not None:
+            self.scheduled_call.cancel()
+            self.scheduled_call = None
+        self.schedule(delay)
+
+    def deliver(self):
+        """
+        Passes the newest value to the subscriber's setter.
+
+        :return: None
+        """
+        with self.lock:
+            self.scheduled_call = None
+            if not self.has_value:
+                return
+            new_value, self.value, self.has_value = self.value, None, False
+            self.last_delivery_time = self.policy.scheduler.now()
+        self.setter(new_value)
+
+
+class ThrottledDelivery(ScheduledDelivery):
+    """
+    Delivery policy limiting the rate of deliveries - the subscriber receives at most one value per 'interval'
+    seconds. The first value after a quiet period is delivered immediately, the following ones are coalesced and the
+    newest of them is delivered when the interval passes. E.g. 'ThrottledDelivery(QtScheduler(), max_rate=60)' caps
+    QLabel updates at 60 per second.
+    """
+
+    def __init__(self, scheduler: Scheduler, interval: float = None, max_rate: float = None):
+        """
+        :param scheduler: Scheduler used to postpone the deliveries.
+        :param interval: Minimal time between deliveries in seconds.
+        :param max_rate: Maximal number of deliveries per second - alternative to 'interval'.
+        """
+        super().__init__(scheduler)
+        if interval is None and max_rate is None:
+            raise ValueError("Throttled delivery policy requires 'interval' or 'max_rate'!")
+        self.interval = interval if interval is not None else 1.0 / max_rate
+
+    def onValue(self, delivery: LatestValueDelivery):
+        if delivery.scheduled_call is not None:
+            return False
+        now = self.scheduler.now()
+        if delivery.last_delivery_time is None or now - delivery.last_delivery_time >= self.interval:
+            # Leading edge - the value is delivered immediately. Delivery time is reserved here, so concurrent
+            # publications get scheduled instead of delivered as well.
+            delivery.last_delivery_time = now
+            return True
+        delivery.schedule(delivery.last_delivery_time + self.interval - now)
+        return False
+
+
+class DebouncedDelivery(ScheduledDelivery):
+    """
+    Delivery policy postponing deliveries until the values stop changing - the newest value is delivered when no new
+    value has been published for 'delay' seconds (e.g. after the user stops typing).
+    """
+
+    def __init__(self, scheduler: Scheduler, delay: float):
+        """
+        :param scheduler: Scheduler used to postpone the deliveries.
+        :param delay: Quiet period in seconds.
+        """
+        super().__init__(scheduler)
+        self.delay = delay
+
+    def onValue(self, delivery: LatestValueDelivery):
+        delivery.reschedule(self.delay)
+        return False
+
+
+class NextTickDelivery(ScheduledDelivery):
+    """
+    Delivery policy passing only the newest value to the subscriber, at the next tick of the scheduler's event loop -
+    all values published in the meantime are coalesced into one delivery.
+    """
+
+    def onValue(self, delivery: LatestValueDelivery):
+        delivery.schedule(0)
+        return False
@@ -0,0 +1,289 @@
+import logging
+import math
+import threading
+import weakref
+from collections import deque
+from functools import partial
+
+from Utilities import makeReference as uMakeReference
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations with logarithmic buckets - every bucket covers durations up to twice as long as the
+    previous one, starting at 1 microsecond. Recording is O(1) and the memory used does not depend on the number of
+    recorded durations.
+    """
+    __slots__ = ('buckets', 'count', 'total_seconds', 'max_seconds')
+
+    def __init__(self):
+        # {upper_bound_in_microseconds: count}
+        self.buckets = dict()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float):
+        """
+        :param seconds: Duration to record.
+        :return: None
+        """
+        microseconds = seconds * 1e6
+        upper_bound = 1 if microseconds <= 1 else 2 ** math.ceil(math.log2(microseconds))
+        self.buckets[upper_bound] = self.buckets.get(upper_bound, 0) + 1
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        :param fraction: Fraction of recorded durations - e.g. 0.99 for the 99th percentile.
+        :return: Upper bound (in seconds) of the bucket containing the percentile - 0 if nothing has been recorded.
+        """
+        threshold = fraction * self.count
+        accumulated = 0
+        for upper_bound in sorted(self.buckets):
+            accumulated += self.buckets[upper_bound]
+            if accumulated >= threshold:
+                return upper_bound / 1e6
+        return 0.0
+
+    def snapshot(self) -> dict:
+        """
+        :return: Dictionary with keys: 'count', 'total_seconds', 'mean_seconds', 'max_seconds', 'p50_seconds',
+            'p99_seconds' and 'buckets_us' ({upper_bound_in_microseconds: count}).
+        """
+        return {'count': self.count, 'total_seconds': self.total_seconds,
+                'mean_seconds': self.total_seconds / self.count if self.count else 0.0,
+                'max_seconds': self.max_seconds, 'p50_seconds': self.percentile(0.5),
+                'p99_seconds': self.percentile(0.99), 'buckets_us': dict(sorted(self.buckets.items()))}
+
+
+class BindingStats:
+    """
+    Statistics of a single binding (subscription) - number of deliveries and time spent in the getter (shared by all
+    the bindings of its group - see 'PropertyBindings') and in the setter.
+    """
+    __slots__ = ('label', 'calls', 'getter_seconds', 'setter_seconds', 'max_setter_seconds', 'slow_calls')
+
+    def __init__(self, label: str):
+        self.label = label
+        self.calls = 0
+        self.getter_seconds = 0.0
+        self.setter_seconds = 0.0
+        self.max_setter_seconds = 0.0
+        self.slow_calls = 0
+
+    def snapshot(self) -> dict:
+        return {'binding': self.label, 'calls': self.calls, 'getter_seconds': self.getter_seconds,
+                'setter_seconds': self.setter_seconds, 'max_setter_seconds': self.max_setter_seconds,
+                'slow_calls': self.slow_calls}
+
+
+class PublicationStats:
+    """
+    Statistics of publications of a single attribute - latency histogram and fan-out sizes.
+    """
+    __slots__ = ('label', 'latency', 'getter_seconds', 'total_fan_out', 'max_fan_out')
+
+    def __init__(self, label: str):
+        self.label = label
+        self.latency = LatencyHistogram()
+        self.getter_seconds = 0.0
+        self.total_fan_out = 0
+        self.max_fan_out = 0
+
+    def snapshot(self) -> dict:
+        count = self.latency.count
+        return {'attribute': self.label, 'publications': count, 'getter_seconds': self.getter_seconds,
+                'mean_fan_out': self.total_fan_out / count if count else 0.0, 'max_fan_out': self.max_fan_out,
+                'latency': self.latency.snapshot()}
+
+
+def describeBinding(binding_plan) -> str:
+    """
+    :param binding_plan: 'Utilities.BindingPlan' object.
+    :return: Readable description of the binding, e.g. 'MainView.label.setText <- ViewModel.presented_data'.
+    """
+    dst_obj, src_obj = binding_plan.destination_object, binding_plan.source_object
+    destination = type(dst_obj).__name__ if dst_obj is not None else '<collected>'
+    source = type(src_obj).__name__ if src_obj is not None else '<collected>'
+    for name in (binding_plan.dst_property_name, binding_plan.setter_method_name):
+        if name is not None:
+            destination += '.' + name
+    source += '.' + binding_plan.src_property_name
+    if binding_plan.getter_method_name is not None:
+        source += '.' + binding_plan.getter_method_name
+    return destination + ' <- ' + source
+
+
+class DispatchInstrumentation:
+    """
+    Class collecting statistics of property changed events dispatched by an event hub. Enabled per hub with
+    'PropertyChangedEventHandler.setInstrumentation', e.g.:
+
+    instrumentation = DispatchInstrumentation(slow_threshold=0.004, sinks=[LoggingSink()])
+    PropertyChangedEventHandler.setInstrumentation(instrumentation)
+    ...
+    print(instrumentation.snapshot()['slowest_bindings'])
+
+    Records per-binding call counts and getter/setter times, fan-out sizes and latency histograms per published
+    attribute. Deliveries slower than 'slow_threshold' are counted and reported to the sinks. Every publication is
+    reported to the sinks as well - sinks are objects with 'onPublication(event)' and 'onSlowSubscriber(event)'
+    methods (see 'InMemorySink', 'LoggingSink'), events are dictionaries.
+
+    Statistics of bindings are dropped together with the bindings (they are stored in a weak dictionary) and
+    statistics of publications together with their publishers. Publishers not supporting weak references are kept
+    alive (with their statistics) until 'reset' is called.
+    """
+
+    def __init__(self, slow_threshold: float = None, sinks: list = ()):
+        """
+        :param slow_threshold: Setter duration (in seconds) above which the subscriber is considered slow. If 'None',
+            slow subscribers are not detected.
+        :param sinks: Objects receiving the events.
+        """
+        self.slow_threshold = slow_threshold
+        self.sinks = list(sinks)
+        self._bindings = weakref.WeakKeyDictionary()
+        # {id(publisher): (reference to the publisher, {attribute_name: PublicationStats})}
+        self._publications = dict()
+        # (id(publisher), reference) of collected publishers - the garbage collector can call back in a thread holding
+        # the lock, so their statistics are dropped by the next operation taking it
+        self._collected_publishers = deque()
+        self._lock = threading.Lock()
+
+    def recordDelivery(self, binding_plan, getter_seconds: float, setter_seconds: float):
+        """
+        Records a single delivery of a value to a subscriber.
+
+        :param binding_plan: Plan of the binding.
+        :param getter_seconds: Time of the evaluation of the getter shared by the binding's group.
+        :param setter_seconds: Time of the setter call.
+        :return: None
+        """
+        with self._lock:
+            stats = self._bindings.get(binding_plan)
+            if stats is None:
+                stats = self._bindings[binding_plan] = BindingStats(describeBinding(binding_plan))
+            stats.calls += 1
+            stats.getter_seconds += getter_seconds
+            stats.setter_seconds += setter_seconds
+            if setter_seconds > stats.max_setter_seconds:
+                stats.max_setter_seconds = setter_seconds
+            is_slow = self.slow_threshold is not None and setter_seconds > self.slow_threshold
+            if is_slow:
+                stats.slow_calls += 1
+
+        if is_slow:
+            event = {'binding': stats.label, 'setter_seconds': setter_seconds, 'threshold': self.slow_threshold}
+            for sink in self.sinks:
+                sink.onSlowSubscriber(event)
+
+    def recordPublication(self, pub_obj, obj_property_name: str, fan_out: int, getter_seconds: float,
+                          total_seconds: float):
+        """
+        Records a single dispatched publication.
+
+        :param pub_obj: Publisher.
+        :param obj_property_name: Name of the published attribute.
+        :param fan_out: Number of subscribers the value has been delivered to.
+        :param getter_seconds: Total time of getters' evaluation.
+        :param total_seconds: Total time of the publication.
+        :return: None
+        """
+        key = id(pub_obj)
+        with self._lock:
+            self._dropCollectedPublishers()
+            entry = self._publications.get(key)
+            # Identifiers could have been reused by other objects - compare the objects themselves
+            if entry is None or entry[0]() is not pub_obj:
+                entry = self._publications[key] = (uMakeReference(pub_obj, partial(self._onPublisherCollected, key)),
+                                                   dict())
+            stats = entry[1].get(obj_property_name)
+            if stats is None:
+                stats = entry[1][obj_property_name] = PublicationStats(type(pub_obj).__name__ + '.' +
+                                                                       obj_property_name)
+            stats.latency.record(total_seconds)
+            stats.getter_seconds += getter_seconds
+            stats.total_fan_out += fan_out
+            if fan_out > stats.max_fan_out:
+                stats.max_fan_out = fan_out
+
+        if self.sinks:
+            event = {'attribute': stats.label, 'fan_out': fan_out, 'getter_seconds': getter_seconds,
+                     'seconds': total_seconds}
+            for sink in self.sinks:
+                sink.onPublication(event)
+
+    def snapshot(self, top: int = 10) -> dict:
+        """
+        :param top: Number of the slowest bindings to list.
+        :return: Dictionary with keys: 'publications' (list of publication statistics per attribute), 'bindings'
+            (list of statistics per binding) and 'slowest_bindings' (bindings with the highest total setter time).
+        """
+        with self._lock:
+            self._dropCollectedPublishers()
+            publications = [stats.snapshot() for _, attributes in self._publications.values()
+                            for stats in attributes.values()]
+            bindings = [stats.snapshot() for stats in self._bindings.values()]
+        slowest_bindings = sorted(bindings, key=lambda stats: stats['setter_seconds'], reverse=True)[:top]
+        return {'publications': publications, 'bindings': bindings, 'slowest_bindings': slowest_bindings}
+
+    def reset(self):
+        """
+        Drops all the statistics collected.
+
+        :return: None
+        """
+        with self._lock:
+            self._bindings.clear()
+            self._publications.clear()
+            self._collected_publishers.clear()
+
+    def _onPublisherCollected(self, key: int, reference):
+        self._collected_publishers.append((key, reference))
+
+    def _dropCollectedPublishers(self):
+        # Called with the lock held
+        while self._collected_publishers:
+            key, reference = self._collected_publishers.popleft()
+            entry = self._publications.get(key)
+            # The entry could have been replaced by the one of another publisher with the same identifier
+            if entry is not None and entry[0] is reference:
+                del self._publications[key]
+
+
+class InMemorySink:
+    """
+    Sink storing the events in memory - at most 'max_events' newest events of each kind.
+    """
+
+    def __init__(self, max_events: int = 10000):
+        self.publications = deque(maxlen=max_events)
+        self.slow_subscribers = deque(maxlen=max_events)
+
+    def onPublication(self, event: dict):
+        self.publications.append(event)
+
+    def onSlowSubscriber(self, event: dict):
+        self.slow_subscribers.append(event)
+
+
+class LoggingSink:
+    """
+    Sink writing the events to a logger - slow subscribers with WARNING level, publications with DEBUG level.
+    """
+
+    def __init__(self, logger: logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger('ObservableObjects.instrumentation')
+
+    def onPublication(self, event: dict):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Published %s to %d subscriber(s) in %.1f us', event['attribute'], event['fan_out'],
+                              event['seconds'] * 1e6)
+
+    def onSlowSubscriber(self, event: dict):
+        self.logger.warning('Slow subscriber %s - setter took %.1f ms (threshold %.1f ms)', event['binding'],
+                            event['setter_seconds'] * 1e3, event['threshold'] * 1e3)
@@ -0,0 +1,585 @@
+import operator
+import threading
+from collections.abc import MutableMapping, MutableSequence
+from enum import *
+
+from Utilities import getEventHub as uGetEventHub
+from Utilities import makeReference as uMakeReference
+
+
+class ChangeKind(Enum):
+    """
+    Kinds of changes recorded by observable collections.
+    """
+    INSERT = 'insert'
+    REMOVE = 'remove'
+    REPLACE = 'replace'
+    # The whole content has changed - the record carries the complete content
+    RESET = 'reset'
+
+
+class ListChange:
+    """
+    Change record of 'ObservableList':
+
+    - INSERT - 'items' have been inserted at index 'start',
+    - REMOVE - 'removed' items have been removed from index 'start',
+    - REPLACE - 'removed' items starting at index 'start' have been replaced with 'items' (the same number of them),
+    - RESET - the list has been rebuilt - 'items' is the whole content.
+    """
+    __slots__ = ('kind', 'start', 'items', 'removed')
+
+    def __init__(self, kind: ChangeKind, start: int, items: tuple = (), removed: tuple = ()):
+        self.kind = kind
+        self.start = start
+        self.items = items
+        self.removed = removed
+
+    def __repr__(self):
+        return 'ListChange(%s, start=%d, items=%r, removed=%r)' % (self.kind.value, self.start, self.items,
+                                                                   self.removed)
+
+
+class DictChange:
+    """
+    Change record of 'ObservableDict':
+
+    - INSERT - new 'key' has been set to 'value',
+    - REPLACE - existing 'key' has been changed from 'old_value' to 'value',
+    - REMOVE - 'key' with 'old_value' has been deleted,
+    - RESET - the dictionary has been rebuilt - 'value' is a copy of the whole content ('key' is None).
+    """
+    __slots__ = ('kind', 'key', 'value', 'old_value')
+
+    def __init__(self, kind: ChangeKind, key=None, value=None, old_value=None):
+        self.kind = kind
+        self.key = key
+        self.value = value
+        self.old_value = old_value
+
+    def __repr__(self):
+        return 'DictChange(%s, key=%r, value=%r, old_value=%r)' % (self.kind.value, self.key, self.value,
+                                                                   self.old_value)
+
+
+class ObservableCollection:
+    """
+    Base class of observable collections. The collection is stored in an attribute of its owner (an
+    'ObservableObject') - every modification records change records and publishes the owner's attribute. Subscribers
+    of the attribute choose what they receive with the getter method:
+
+    - getter 'None' ('getattr') - the whole collection, as for any other attribute,
+    - getter 'getChanges' (owned by the collection) - tuple of change records made since the previous publication,
+      e.g.:
+
+    view.subscribeToVariable(dst_property_name=None, setter_method_name='applyRowChanges', src_obj=view_model,
+                             src_property_name='data_models', getter_method_name='getChanges')
+
+    Plans using the same getter are grouped (see 'Utilities.PropertyBindings'), so the change records are taken once
+    per publication and shared by all diff-aware subscribers. When there are no recorded changes (e.g. the attribute
+    has been assigned a new collection or 'updateAllBindings' is called), 'getChanges' returns a single RESET record
+    with the whole content. Inside a batch of publications the records of all modifications are accumulated and
+    delivered together.
+
+    Diff-aware subscriptions should not use delivery policies that drop intermediate values (see 'DeliveryPolicies').
+    Collections without an owner do not record changes.
+    Pickled collections are restored without their owners.
+    """
+
+    def __init__(self, owner=None, owner_property_name: str = None):
+        """
+        :param owner: Object storing the collection in its attribute.
+        :param owner_property_name: Name of the owner's attribute.
+        """
+        self._changes = list()
+        self._lock = threading.RLock()
+        self._owner_reference = None
+        self._owner_property_name = None
+        if owner is not None:
+            self.attachOwner(owner, owner_property_name)
+
+    def attachOwner(self, owner, owner_property_name: str):
+        """
+        Attaches the collection to the owner's attribute - modifications are published as changes of this attribute.
+
+        :param owner: Object storing the collection in its attribute.
+        :param owner_property_name: Name of the owner's attribute.
+        :return: None
+        """
+        with self._lock:
+            self._owner_reference = uMakeReference(owner)
+            self._owner_property_name = owner_property_name
+            self._changes.clear()
+
+    def getChanges(self) -> tuple:
+        """
+        Takes the change records made since the previous call - getter method for diff-aware subscribers.
+
+        :return: Tuple of change records - or a single RESET record if no changes have been recorded.
+        """
+        with self._lock:
+            if not self._changes:
+                return (self._resetChange(),)
+            changes, self._changes = tuple(self._changes), list()
+            return changes
+
+    def _resetChange(self):
+        raise NotImplementedError
+
+    def _recordChange(self, change):
+        # Called under the lock
+        if self._owner_reference is not None:
+            self._changes.append(change)
+
+    def _publish(self):
+        owner = self._owner_reference() if self._owner_reference is not None else None
+        if owner is None:
+            return
+        event_hub = uGetEventHub(owner)
+        event_hub.publish(owner, self._owner_property_name)
+        # Outside a batch the publication has been dispatched - records not taken by any subscriber are dropped.
+        # Inside a batch they are kept until the batch is committed.
+        if not event_hub.isBatching():
+            with self._lock:
+                self._changes.clear()
+
+
+class ObservableList(ObservableCollection, MutableSequence):
+    """
+    List publishing its modifications as 'ListChange' records - see 'ObservableCollection'. Consecutive appends made
+    before the records are taken (e.g. inside a batch) are merged into one INSERT record.
+    """
+
+    def __init__(self, iterable=(), owner=None, owner_property_name: str = None):
+        """
+        :param iterable: Initial content.
+        :param owner: Object storing the list in its attribute.
+        :param owner_property_name: Name of the owner's attribute.
+        """
+        ObservableCollection.__init__(self, owner, owner_property_name)
+        self._items = list(iterable)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ObservableList):
+            return self._items == other._items
+        return self._items == other
+
+    def __repr__(self):
+        return 'ObservableList(%r)' % self._items
+
+    def __reduce__(self):
+        # Pickled (e.g. by a change journal or a process bridge) as a detached copy - without owner and change records
+        with self._lock:
+            return type(self), (list(self._items),)
+
+    def __setitem__(self, index, value):
+        with self._lock:
+            if isinstance(index, slice):
+                start, stop, step = index.indices(len(self._items))
+                value = list(value)
+                if step != 1:
+                    self._items[index] = value
+                    self._recordChange(self._resetChange())
+                else:
+                    stop = max(start, stop)
+                    removed = tuple(self._items[start:stop])
+                    self._items[start:stop] = value
+                    self._recordSliceChange(start, removed, tuple(value))
+            else:
+                index = self._normalizeIndex(index)
+                removed = self._items[index]
+                self._items[index] = value
+                self._recordChange(ListChange(ChangeKind.REPLACE, index, (value,), (removed,)))
+        self._publish()
+
+    def __delitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                start, stop, step = index.indices(len(self._items))
+                if step != 1:
+                    del self._items[index]
+                    self._recordChange(self._resetChange())
+                elif stop > start:
+                    removed = tuple(self._items[start:stop])
+                    del self._items[start:stop]
+                    self._recordChange(ListChange(ChangeKind.REMOVE, start, removed=removed))
+            else:
+                index = self._normalizeIndex(index)
+                removed = self._items.pop(index)
+                self._recordChange(ListChange(ChangeKind.REMOVE, index, removed=(removed,)))
+        self._publish()
+
+    def insert(self, index: int, value):
+        with self._lock:
+            index = min(max(index + len(self._items) if index < 0 else index, 0), len(self._items))
+            self._items.insert(index, value)
+            self._recordInsert(index, (value,))
+        self._publish()
+
+    def append(self, value):
+        self.insert(len(self._items), value)
+
+    def extend(self, values):
+        values = tuple(values)
+        if not values:
+            return
+        with self._lock:
+            start = len(self._items)
+            self._items.extend(values)
+            self._recordInsert(start, values)
+        self._publish()
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def clear(self):
+        with self._lock:
+            if not self._items:
+                return
+            removed, self._items = tuple(self._items), list()
+            self._recordChange(ListChange(ChangeKind.REMOVE, 0, removed=removed))
+        self._publish()
+
+    def sort(self, key=None, reverse: bool = False):
+        with self._lock:
+            self._items.sort(key=key, reverse=reverse)
+            self._recordChange(self._resetChange())
+        self._publish()
+
+    def reverse(self):
+        with self._lock:
+            self._items.reverse()
+            self._recordChange(self._resetChange())
+        self._publish()
+
+    def copy(self) -> list:
+        """
+        :return: Plain list with the content.
+        """
+        return list(self._items)
+
+    def _normalizeIndex(self, index: int) -> int:
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError('ObservableList index out of range')
+        return index
+
+    def _resetChange(self) -> ListChange:
+        return ListChange(ChangeKind.RESET, 0, tuple(self._items))
+
+    def _recordInsert(self, start: int, items: tuple):
+        last_change = self._changes[-1] if self._changes else None
+        # Merge with the previous insertion if the new items directly follow it (e.g. consecutive appends)
+        if last_change is not None and last_change.kind is ChangeKind.INSERT and \
+                last_change.start + len(last_change.items) == start:
+            last_change.items += items
+        else:
+            self._recordChange(ListChange(ChangeKind.INSERT, start, items))
+
+    def _recordSliceChange(self, start: int, removed: tuple, inserted: tuple):
+        if len(removed) == len(inserted):
+            if removed:
+                self._recordChange(ListChange(ChangeKind.REPLACE, start, inserted, removed))
+            return
+        if removed:
+            self._recordChange(ListChange(ChangeKind.REMOVE, start, removed=removed))
+        if inserted:
+            self._recordChange(ListChange(ChangeKind.INSERT, start, inserted))
+
+
+class ObservableDict(ObservableCollection, MutableMapping):
+    """
+    Dictionary publishing its modifications as 'DictChange' records - see 'ObservableCollection'. Bulk modifications
+    ('update', 'clear') are published once.
+    """
+
+    def __init__(self, mapping=(), owner=None, owner_property_name: str = None, **kwargs):
+        """
+        :param mapping: Initial content - mapping or iterable of (key, value) pairs.
+        :param owner: Object storing the dictionary in its attribute.
+        :param owner_property_name: Name of the owner's attribute.
+        """
+        ObservableCollection.__init__(self, owner, owner_property_name)
+        self._items = dict(mapping, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ObservableDict):
+            return self._items == other._items
+        return self._items == other
+
+    def __repr__(self):
+        return 'ObservableDict(%r)' % self._items
+
+    def __reduce__(self):
+        # Pickled (e.g. by a change journal or a process bridge) as a detached copy - without owner and change records
+        with self._lock:
+            return type(self), (dict(self._items),)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._setItem(key, value)
+        self._publish()
+
+    def __delitem__(self, key):
+        with self._lock:
+            old_value = self._items.pop(key)
+            self._recordChange(DictChange(ChangeKind.REMOVE, key, old_value=old_value))
+        self._publish()
+
+    def update(self, mapping=(), **kwargs):
+        items = dict(mapping, **kwargs)
+        if not items:
+            return
+        with self._lock:
+            for key, value in items.items():
+                self._setItem(key, value)
+        self._publish()
+
+    def clear(self):
+        with self._lock:
+            if not self._items:
+                return
+            self._items.clear()
+            self._recordChange(self._resetChange())
+        self._publish()
+
+    def copy(self) -> dict:
+        """
+        :return: Plain dictionary with the content.
+        """
+        return dict(self._items)
+
+    def _setItem(self, key, value):
+        if key in self._items:
+            old_value = self._items[key]
+            self._items[key] = value
+            self._recordChange(DictChange(ChangeKind.REPLACE, key, value, old_value))
+        else:
+            self._items[key] = value
+            self._recordChange(DictChange(ChangeKind.INSERT, key, value))
+
+    def _resetChange(self) -> DictChange:
+        return DictChange(ChangeKind.RESET, value=dict(self._items))
+
+
+class ArrayChange:
+    """
+    Change record of 'ObservableArray' - elements (rows of the first axis) from 'start' to 'stop' (exclusive) have
+    changed. 'values' is a view of these elements (e.g. NumPy view) - no data is copied, so the view reflects the
+    array's content at the moment it is read. RESET record covers the whole array.
+    """
+    __slots__ = ('kind', 'start', 'stop', 'values')
+
+    def __init__(self, kind: ChangeKind, start: int, stop: int, values):
+        self.kind = kind
+        self.start = start
+        self.stop = stop
+        self.values = values
+
+    def __repr__(self):
+        return 'ArrayChange(%s, start=%d, stop=%d)' % (self.kind.value, self.start, self.stop)
+
+
+class ObservableArray(ObservableCollection):
+    """
+    Wrapper of a fixed-size array (NumPy array or any object supporting slice views and slice assignment, e.g.
+    'memoryview') publishing which ranges of elements have changed - see 'ObservableCollection'. Ranges changed
+    before the records are taken (e.g. inside a batch) are merged, and subscribers using 'getChanges' getter receive
+    'ArrayChange' records with zero-copy views of the changed regions only. For multidimensional arrays the ranges
+    refer to the first axis.
+
+    Many elements can be written at once with 'setValues' (vectorized with NumPy) - with a single publication.
+    Modifications made directly on 'data' need to be reported with 'markChanged'.
+    """
+
+    def __init__(self, data, owner=None, owner_property_name: str = None):
+        """
+        :param data: Array to wrap - it is not copied.
+        :param owner: Object storing the array in its attribute.
+        :param owner_property_name: Name of the owner's attribute.
+        """
+        ObservableCollection.__init__(self, owner, owner_property_name)
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __repr__(self):
+        return 'ObservableArray(%r)' % (self.data,)
+
+    def __reduce__(self):
+        # Pickled (e.g. by a change journal or a process bridge) as a detached copy - without owner and change records
+        with self._lock:
+            return type(self), (self.data,)
+
+    def __setitem__(self, index, value):
+        with self._lock:
+            self.data[index] = value
+            # Ranges refer to the first axis of multidimensional arrays
+            if isinstance(index, tuple):
+                index = index[0] if index else slice(None)
+            if isinstance(index, slice):
+                start, stop, step = index.indices(len(self.data))
+                if step < 0:
+                    start, stop = stop + 1, start + 1
+                self._recordRange(start, stop)
+            else:
+                index = index + len(self.data) if index < 0 else index
+                self._recordRange(index, index + 1)
+        self._publish()
+
+    def setValues(self, indices, values):
+        """
+        Writes many elements at once and publishes the change once. With NumPy the write is vectorized and the changed
+        indices are grouped into ranges without a Python loop over them.
+
+        :param indices: Sequence (or NumPy array) of indices.
+        :param values: Values to write - a sequence of the same length as 'indices' or a single value.
+        :return: None
+        """
+        numpy = self._numpyFor(self.data)
+        with self._lock:
+            length = len(self.data)
+            if numpy is not None:
+                indices = numpy.asarray(indices)
+                # NumPy checks the bounds of all the indices before writing
+                self.data[indices] = values
+                for start, stop in self._numpyRuns(numpy, indices, length):
+                    self._recordRange(start, stop)
+            else:
+                # Indices are checked (and negative ones normalized) before anything is written
+                indices = [self._normalizeIndex(index, length) for index in indices]
+                values = [values] * len(indices) if not hasattr(values, '__len__') else values
+                for index, value in zip(indices, values):
+                    self.data[index] = value
+                for start, stop in self._runs(indices):
+                    self._recordRange(start, stop)
+        self._publish()
+
+    def update(self, start: int, values):
+        """
+        Writes a contiguous block of elements and publishes the change once.
+
+        :param start: Index of the first element to write.
+        :param values: Values to write.
+        :return: None
+        """
+        self[start:start + len(values)] = values
+
+    def markChanged(self, start: int = 0, stop: int = None):
+        """
+        Records and publishes a change of given range - for modifications made directly on 'data'.
+
+        :param start: Index of the first changed element.
+        :param stop: Index after the last changed element. If 'None', the range ends at the end of the array.
+        :return: None
+        """
+        with self._lock:
+            self._recordRange(start, len(self.data) if stop is None else stop)
+        self._publish()
+
+    def getChanges(self) -> tuple:
+        """
+        Takes the ranges changed since the previous call - getter method for diff-aware subscribers. Overlapping and
+        adjacent ranges are merged.
+
+        :return: Tuple of 'ArrayChange' records - or a single RESET record if no changes have been recorded.
+        """
+        with self._lock:
+            if not self._changes:
+                return (self._resetChange(),)
+            ranges, self._changes = sorted(self._changes), list()
+
+        merged_ranges = [list(ranges[0])]
+        for start, stop in ranges[1:]:
+            if start <= merged_ranges[-1][1]:
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], stop)
+            else:
+                merged_ranges.append([start, stop])
+        return tuple(ArrayChange(ChangeKind.REPLACE, start, stop, self.data[start:stop])
+                     for start, stop in merged_ranges)
+
+    def _resetChange(self) -> ArrayChange:
+        return ArrayChange(ChangeKind.RESET, 0, len(self.data), self.data[:])
+
+    def _recordRange(self, start: int, stop: int):
+        # Called under the lock - ranges are stored as (start, stop) tuples, extending the last one if possible
+        if stop <= start:
+            return
+        if self._changes:
+            last_start, last_stop = self._changes[-1]
+            if start <= last_stop and stop >= last_start:
+                self._changes[-1] = (min(start, last_start), max(stop, last_stop))
+                return
+        self._recordChange((start, stop))
+
+    @staticmethod
+    def _numpyFor(data):
+        # NumPy is optional - it is used only for NumPy arrays
+        if type(data).__module__ != 'numpy':
+            return None
+        import numpy
+        return numpy
+
+    @staticmethod
+    def _normalizeIndex(index: int, length: int) -> int:
+        index = operator.index(index)
+        if not -length <= index < length:
+            raise IndexError('ObservableArray index %d out of range (length %d)' % (index, length))
+        return index + length if index < 0 else index
+
+    @staticmethod
+    def _numpyRuns(numpy, indices, length: int) -> list:
+        if indices.dtype == bool:
+            indices = numpy.flatnonzero(indices)
+        # Negative indices refer to the same elements as their non-negative counterparts
+        indices = numpy.unique(numpy.where(indices < 0, indices + length, indices).ravel())
+        if not indices.size:
+            return []
+        # Positions where consecutive indices are not adjacent split the indices into runs
+        breaks = numpy.flatnonzero(numpy.diff(indices) != 1)
+        starts = numpy.concatenate(([indices[0]], indices[breaks + 1]))
+        stops = numpy.concatenate((indices[breaks], [indices[-1]])) + 1
+        return list(zip(starts.tolist(), stops.tolist()))
+
+    @staticmethod
+    def _runs(indices) -> list:
+        runs = list()
+        for index in sorted(set(indices)):
+            if runs and runs[-1][1] == index:
+                runs[-1][1] = index + 1
+            else:
+                runs.append([index, index + 1])
+        return runs
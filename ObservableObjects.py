@@ -1,4 +1,27 @@
 from Utilities import PropertyChangedEventHandler as uPCEventHandler
+from Utilities import getEventHub as uGetEventHub
+from Utilities import DependencyGraph as uDependencyGraph
+from Utilities import ComputationNode as uComputationNode
+from Utilities import BindingTemplate as uBindingTemplate
+from Utilities import findClassAttribute as uFindClassAttribute
+from Utilities import CacheMode
+
+
+def valuesEqual(old_value, new_value) -> bool:
+    """
+    Default comparator of 'ObservableProperty' - checks whether the new value is the same as the old one (identical or
+    equal). Values that cannot be compared to a single boolean (e.g. NumPy arrays) are considered different.
+
+    :param old_value: Value stored before assignment.
+    :param new_value: Value being assigned.
+    :return: True if the values are the same and no property changed event is needed.
+    """
+    if old_value is new_value:
+        return True
+    try:
+        return bool(old_value == new_value)
+    except Exception:
+        return False
 
 
 class ObservableObject(object):
@@ -11,7 +34,25 @@ class ObservableObject(object):
     Accepts the name of given object's attribute and triggers the 'PropertyChangedEventHandler' class to spread this
     attribute's new value to all subscribers - by invoking relevant methods on subscriber's objects specified during
     subscriptions creations.
+
+    - publishPropertyChangesAsync
+    Awaitable variant of 'publishPropertyChanges' - returns when all (also asynchronous) subscribers are updated.
+
+    - markPropertyChanged
+    Records that the attribute has changed without notifying subscribers - they are updated by the next
+    'PropertyChangedEventHandler.updateAllBindings(changed_only=True)' call.
+
+    - batchPropertyChanges
+    Returns context manager that groups publications - each changed attribute is published once, when the outermost
+    batch ends.
+
+    - attachEventHub
+    Attaches given 'PropertyChangedEventHandler' instance (event hub) to the object - publications go through this hub
+    instead of the default one.
     """
+    __slots__ = ()
+    # Event hub used by the object - 'None' means the default hub ('PropertyChangedEventHandler.default_hub')
+    event_hub = None
 
     def publishPropertyChanges(self, property_name: str):
         """
@@ -20,8 +61,52 @@ class ObservableObject(object):
         :param property_name: Name of the object's attribute which the callbacks will be invoked for.
         :return: None
         """
-        event_args = uPCEventHandler.returnPropChangedEventPubArgs(self, property_name)
-        uPCEventHandler.triggerBindingUpdate(event_args)
+        uGetEventHub(self).publish(self, property_name)
+
+    async def publishPropertyChangesAsync(self, property_name: str, max_concurrency: int = None):
+        """
+        Awaitable variant of 'publishPropertyChanges'. Deliveries to asynchronous subscribers (whose setter methods are
+        coroutine functions) run concurrently on the current event loop - see
+        'PropertyChangedEventHandler.publishAsync'.
+
+        :param property_name: Name of the object's attribute which the callbacks will be invoked for.
+        :param max_concurrency: Maximal number of asynchronous deliveries running at the same time. If 'None', there is
+            no limit.
+        :return: None
+        """
+        await uGetEventHub(self).publishAsync(self, property_name, max_concurrency)
+
+    def markPropertyChanged(self, property_name: str):
+        """
+        Records that the attribute specified has changed without notifying subscribers - useful during bulk reloads of
+        data. See 'PropertyChangedEventHandler.markChanged'.
+
+        :param property_name: Name of the object's changed attribute.
+        :return: None
+        """
+        uGetEventHub(self).markChanged(self, property_name)
+
+    def attachEventHub(self, event_hub: uPCEventHandler):
+        """
+        Attaches given event hub to the object - see 'PropertyChangedEventHandler.attach'.
+
+        :param event_hub: 'PropertyChangedEventHandler' instance.
+        :return: None
+        """
+        event_hub.attach(self)
+
+    def batchPropertyChanges(self):
+        """
+        Returns context manager grouping property changed events. Inside the 'with' block publications are only queued
+        (and de-duplicated per object and attribute) and they are dispatched once, when the outermost batch ends, e.g.:
+
+        with view_model.batchPropertyChanges():
+            view_model.model_x = 'x'
+            view_model.model_y = 'y'
+
+        :return: Context manager - see 'PropertyChangedEventHandler.batch'.
+        """
+        return uGetEventHub(self).batch()
 
 
 class ObserverObject(object):
@@ -37,10 +122,67 @@ class ObserverObject(object):
     Updates value of specified variable based on the source attribute given, using getter and setter methods specified.
     Can be used e.g. inside PyQt5 signal slots, e.g.:
     someQLineEdit.textChanged.connect(lambda: self.updateVariableBasedOnObject(param1, ...)).
+
+    - applyBindings
+    Creates the bindings declared in the 'bindings' class attribute - see 'BindingDeclaration'.
+
+    - disposeSubscriptions
+    Removes all subscriptions of the object - e.g. before a dynamically created widget is destroyed.
+
+    - refreshSubscriptions
+    Re-resolves setter methods of this object's subscriptions - needed after replacing attribute objects that own them.
+
+    - attachEventHub
+    Attaches given 'PropertyChangedEventHandler' instance (event hub) to the object - subscriptions are created in this
+    hub, unless the source object has its own hub attached.
     """
+    __slots__ = ()
+    # Event hub used by the object - 'None' means the default hub ('PropertyChangedEventHandler.default_hub')
+    event_hub = None
+    # Bindings declared by the class and its base classes - validated and compiled when the class is created, see
+    # 'BindingDeclaration'
+    binding_records = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        declarations = cls.__dict__.get('bindings')
+        if declarations is None:
+            return
+
+        # Records are collected from the base classes, not from 'cls.binding_records' - the class can be created again
+        # from its own namespace (e.g. by 'observableProperties'), which contains the records built the first time
+        records, keys = list(), set()
+        for base in reversed(cls.__mro__[1:]):
+            for record in base.__dict__.get('binding_records', ()):
+                if record.key not in keys:
+                    keys.add(record.key)
+                    records.append(record)
+        for declaration in declarations:
+            if not isinstance(declaration, BindingDeclaration):
+                raise TypeError("Items of '{0}.bindings' have to be 'BindingDeclaration' objects - got {1!r}!"
+                                .format(cls.__name__, declaration))
+            declaration.validate(cls)
+            if declaration.key in keys:
+                raise ValueError("Binding {0!r} is declared twice in '{1}'!".format(declaration, cls.__name__))
+            keys.add(declaration.key)
+            records.append(declaration)
+        cls.binding_records = tuple(records)
+
+    def applyBindings(self) -> list:
+        """
+        Creates the bindings declared in the class attribute 'bindings' (and in the base classes) - see
+        'BindingDeclaration'. To be called when the attributes the bindings refer to are set, e.g. at the end of the
+        constructor. The declarations have been validated and compiled when the class was created, so this method does
+        not resolve any names.
+
+        :return: List of the handles ('Subscription', 'TwoWayBinding' or 'PropertyPathBinding' objects) - in order of
+            declarations.
+        """
+        return [record.bind(self) for record in self.binding_records]
 
     def subscribeToVariable(self, dst_property_name: str = None, setter_method_name: str = None,
-                            src_obj=None, src_property_name: str = None, getter_method_name: str = None):
+                            src_obj=None, src_property_name: str = None, getter_method_name: str = None,
+                            delivery_policy=None, value_cache=None, evaluation_policy=None, operators=None):
         """
         Creates subscription to changes of specified attribute for given subscriber's attribute object.
 
@@ -49,19 +191,75 @@ class ObserverObject(object):
             is considered as a property of the attribute itself). If this is a property of whole object pass 'None' for
             'dst_property_name' parameter.
             If the method should be 'setattr', then pass 'None' for this parameter.
+            The method can be a coroutine function - then the coroutine is scheduled on the event loop running when
+            the subscription is created (or the loop of the publishing thread) and the publisher does not wait for it.
         :param src_obj: Object containing attribute that the subscription is made for.
-        :param src_property_name: Name of the attribute from 'src_obj' used as a source for subscription.
+        :param src_property_name: Name of the attribute from 'src_obj' used as a source for subscription - or a path
+            of attributes separated with dots (e.g. 'current_model.x'). Every link of the path is tracked - when an
+            intermediate object is replaced (and published), only the rest of the path is subscribed again and its new
+            value is delivered.
         :param getter_method_name: Name of the method used to get the value from source attribute. By default, this
             method is considered as a property of the attribute itself. Only if there is no such method assigned to this
             attribute, function tries to get the method directly from source main object (specified by 'src_obj'
             parameter).
             If the method should be 'getattr', then pass 'None' for this parameter.
-        :return: None
+        :param delivery_policy: Object deciding when the published values are delivered - e.g.
+            'ThrottledDelivery(QtScheduler(), max_rate=60)' to limit the number of widget repaints (see
+            'DeliveryPolicies' module). By default, values are delivered immediately.
+        :param value_cache: Way of detecting unchanged values - 'CacheMode' value (e.g. 'CacheMode.EQUALITY') or a
+            function accepting the last delivered and the new value and returning True if they are the same. If given,
+            the setter is not called when the value has been delivered already. By default, every value is delivered.
+        :param evaluation_policy: Object evaluating the getter on a thread or process pool instead of the publishing
+            thread - e.g. 'BackgroundEvaluation(QtScheduler())' for expensive formatting getters (see
+            'BackgroundEvaluations' module). Only the newest result is delivered. By default, the getter is called
+            during publication.
+        :param operators: Chain of operators transforming, filtering or aggregating the values on the way to the
+            setter - e.g. '[Filter(bool), Map(str)]' (see 'BindingOperators' module). The chain is fused into a single
+            callable when the subscription is created. By default, values are delivered as read.
+        :return: 'Subscription' handle - removes the subscription with 'unsubscribe' or when used as a context manager.
+            Subscribing again with the same arguments does not create a second subscription - the handle refers to the
+            existing one.
+        """
+
+        # The subscription has to be registered in the hub the source object publishes its changes to
+        return uGetEventHub(src_obj, self).subscribe(self, dst_property_name, setter_method_name, src_obj,
+                                                     src_property_name, getter_method_name,
+                                                     delivery_policy=delivery_policy, value_cache=value_cache,
+                                                     evaluation_policy=evaluation_policy, operators=operators)
+
+    def subscribeTwoWay(self, dst_property_name: str = None, setter_method_name: str = None,
+                        dst_getter_method_name: str = None, src_obj=None, src_property_name: str = None,
+                        src_setter_method_name: str = None, getter_method_name: str = None, value_cache=None):
         """
+        Creates two-way binding between given subscriber's attribute object and the source attribute. Changes of the
+        source are delivered as with 'subscribeToVariable'; the subscriber's value is transferred to the source with
+        'updateSource' method of the returned handle - e.g. connected to the widget's signal. The echo of a transfer in
+        one direction (e.g. 'textChanged' emitted by 'setText') does not trigger the other one.
 
-        callback_data = uPCEventHandler.returnSubscriptionCallbackData(self, dst_property_name, setter_method_name,
-                                                                       src_obj, src_property_name, getter_method_name)
-        uPCEventHandler.subscribeToAttribute(callback_data)
+        :param dst_property_name: Name of attribute bound to the source - see 'subscribeToVariable'.
+        :param setter_method_name: Name of the method used to set the value of the attribute (e.g. 'setText').
+        :param dst_getter_method_name: Name of the method used to get the value of the attribute (e.g. 'text').
+        :param src_obj: Object containing the source attribute.
+        :param src_property_name: Name of the source attribute.
+        :param src_setter_method_name: Name of the method used to set the source attribute. If 'None', 'setattr' is
+            used - the source should publish the change itself (e.g. in the property's setter).
+        :param getter_method_name: Name of the method used to get the value from source attribute.
+        :param value_cache: Way of detecting unchanged values of the source - see 'subscribeToVariable'.
+        :return: 'TwoWayBinding' handle - removes the binding with 'unsubscribe' or when used as a context manager.
+        """
+        return uGetEventHub(src_obj, self).subscribeTwoWay(self, dst_property_name, setter_method_name,
+                                                           dst_getter_method_name, src_obj, src_property_name,
+                                                           src_setter_method_name, getter_method_name,
+                                                           value_cache=value_cache)
+
+    def disposeSubscriptions(self):
+        """
+        Removes all subscriptions of this object - in every event hub.
+
+        :return: None
+        """
+        for event_hub in uPCEventHandler.eventHubs():
+            event_hub.unsubscribeAll(self)
 
     def updateObjectFromAttribute(self, dst_obj=None, dst_property_name: str = None, setter_method_name: str = None,
                                   src_property_name: str = None, getter_method_name: str = None):
@@ -83,3 +281,404 @@ class ObserverObject(object):
         """
         uPCEventHandler.updateSubscriberObject(dst_obj, dst_property_name, setter_method_name,
                                                self, src_property_name, getter_method_name)
+
+    def refreshSubscriptions(self):
+        """
+        Re-resolves getter and setter methods of all subscriptions made by this object. Subscriptions are compiled once,
+        when they are created, so this method needs to be called after replacing an attribute object that owns the
+        setter method used by a subscription (e.g. assigning new QLabel to the attribute subscribed with 'setText').
+
+        :return: None
+        """
+        uGetEventHub(self).refreshBindings(self)
+
+    def attachEventHub(self, event_hub: uPCEventHandler):
+        """
+        Attaches given event hub to the object - see 'PropertyChangedEventHandler.attach'.
+
+        :param event_hub: 'PropertyChangedEventHandler' instance.
+        :return: None
+        """
+        event_hub.attach(self)
+
+
+# Marker of attributes not defined by a class - see 'BindingDeclaration.validate'
+_UNDEFINED = object()
+
+
+class BindingDeclaration(object):
+    """
+    Declaration of a subscription listed in the 'bindings' class attribute of an 'ObserverObject' subclass - instead of
+    'subscribeToVariable' calls repeated for every instance, e.g.:
+
+    class RowView(qtw.QWidget, ObserverObject):
+        view_model: ViewModel
+
+        bindings = (
+            BindingDeclaration('label', 'setText', 'view_model', 'presented_data', value_cache=CacheMode.EQUALITY),
+            TwoWayBindingDeclaration('input', 'setText', 'text', 'view_model', 'model_x', signal='textChanged'),
+        )
+
+        def __init__(self, view_model):
+            ...
+            self.applyBindings()
+
+    The publisher is given by the name of the subscriber's attribute referencing it ('None' for the subscriber itself).
+    Declarations are validated and compiled once, when the class is created: the names are checked and the lookups that
+    do not depend on the instances are made (see 'BindingTemplate') - so 'ObserverObject.applyBindings' only reads the
+    publisher and builds the subscription's plan with references to the instance's objects. If the class of the
+    publisher is known - the subscriber's own class or the class annotated for the source attribute (like 'view_model'
+    above) - the publisher's attribute has to be defined by that class (as a class attribute, property, slot or
+    annotation).
+
+    A declaration holds no per-instance state, so delivery policies, evaluation policies and operators given to it are
+    shared by the subscriptions of all the instances (each subscription wraps them separately).
+    """
+    __slots__ = ('dst_property_name', 'setter_method_name', 'source_name', 'src_property_name', 'getter_method_name',
+                 'options', 'key', 'template')
+    # Keyword arguments of 'subscribeToVariable' accepted as options
+    option_names = frozenset(('delivery_policy', 'value_cache', 'evaluation_policy', 'operators'))
+
+    def __init__(self, dst_property_name: str = None, setter_method_name: str = None, source_name: str = None,
+                 src_property_name: str = None, getter_method_name: str = None, **options):
+        """
+        :param dst_property_name: Name of the subscriber's attribute - see 'ObserverObject.subscribeToVariable'.
+        :param setter_method_name: Name of the setter method.
+        :param source_name: Name of the subscriber's attribute referencing the publisher. If 'None', the subscriber
+            itself is the publisher.
+        :param src_property_name: Name of the publisher's attribute - or a property path (names separated with dots).
+        :param getter_method_name: Name of the getter method.
+        :param options: Other arguments of 'subscribeToVariable' - 'delivery_policy', 'value_cache',
+            'evaluation_policy', 'operators'.
+        """
+        self.dst_property_name = dst_property_name
+        self.setter_method_name = setter_method_name
+        self.source_name = source_name
+        self.src_property_name = src_property_name
+        self.getter_method_name = getter_method_name
+        self.options = options
+        self.key = (type(self).__name__, dst_property_name, setter_method_name, source_name, src_property_name,
+                    getter_method_name)
+        # Built by 'validate' - shared by the subscriptions of all the classes declaring the binding
+        self.template = None
+
+    def __repr__(self):
+        return '{0}{1!r}'.format(type(self).__name__, self.key[1:])
+
+    def validate(self, owner):
+        """
+        Checks the declaration and compiles its template - called when the class declaring it is created.
+
+        :param owner: Class declaring the binding.
+        :return: None
+        """
+        unknown_options = set(self.options) - self.option_names
+        if unknown_options:
+            raise TypeError('Unknown options of {0!r}: {1}'.format(self, ', '.join(sorted(unknown_options))))
+        if not self.src_property_name:
+            raise ValueError('Source attribute of {0!r} is not given!'.format(self))
+        names = (self.dst_property_name, self.setter_method_name, self.source_name, self.getter_method_name)
+        for name in names + tuple(self.src_property_name.split('.')):
+            if name is not None and not (isinstance(name, str) and name.isidentifier()):
+                raise ValueError('Invalid attribute name {0!r} in {1!r}!'.format(name, self))
+
+        source_type = self.sourceType(owner)
+        if source_type is not None:
+            self.checkAttribute(source_type, self.src_property_name.split('.')[0])
+        if self.dst_property_name is None and self.setter_method_name is not None:
+            self.checkAttribute(owner, self.setter_method_name)
+
+        # Property paths are subscribed link by link - see 'PropertyPathBinding'
+        if self.template is None and '.' not in self.src_property_name:
+            self.template = uBindingTemplate(self.dst_property_name, self.setter_method_name, self.src_property_name,
+                                             self.getter_method_name)
+        if self.template is not None:
+            self.template.prepare(dst_type=owner, src_type=source_type)
+
+    def sourceType(self, owner):
+        """
+        :param owner: Class declaring the binding.
+        :return: Class of the publisher - the owner itself or the class annotated for the source attribute in the owner
+            (or its base classes). 'None' if not known.
+        """
+        if self.source_name is None:
+            return owner
+        for base in owner.__mro__:
+            annotation = base.__dict__.get('__annotations__', {}).get(self.source_name)
+            if annotation is not None:
+                return annotation if isinstance(annotation, type) else None
+        return None
+
+    def checkAttribute(self, cls, name: str):
+        """
+        Checks whether given class defines the attribute - as a class attribute (also a property, method or slot) or
+        an annotation.
+
+        :param cls: Class of the object expected to have the attribute.
+        :param name: Name of the attribute.
+        :return: None
+        """
+        if uFindClassAttribute(cls, name, _UNDEFINED) is not _UNDEFINED or \
+                any(name in base.__dict__.get('__annotations__', ()) for base in cls.__mro__):
+            return
+        raise AttributeError("'{0}' does not define attribute {1!r} used by {2!r} - if it is set by the constructor, "
+                             "annotate it in the class".format(cls.__name__, name, self))
+
+    def bind(self, obj):
+        """
+        Creates the declared subscription for given subscriber.
+
+        :param obj: Subscriber - instance of the class declaring the binding.
+        :return: Handle returned by 'subscribeToVariable'.
+        """
+        src_obj = obj if self.source_name is None else getattr(obj, self.source_name)
+        return uGetEventHub(src_obj, obj).subscribe(obj, self.dst_property_name, self.setter_method_name, src_obj,
+                                                    self.src_property_name, self.getter_method_name,
+                                                    template=self.template, **self.options)
+
+
+class TwoWayBindingDeclaration(BindingDeclaration):
+    """
+    Declaration of a two-way binding - see 'BindingDeclaration' and 'ObserverObject.subscribeTwoWay'. If a signal name
+    is given, the signal of the subscriber's attribute (e.g. 'textChanged' of a QLineEdit) is connected to the
+    binding's 'updateSource' method.
+    """
+    __slots__ = ('dst_getter_method_name', 'src_setter_method_name', 'signal', 'backward_template')
+    option_names = frozenset(('value_cache',))
+
+    def __init__(self, dst_property_name: str = None, setter_method_name: str = None,
+                 dst_getter_method_name: str = None, source_name: str = None, src_property_name: str = None,
+                 src_setter_method_name: str = None, getter_method_name: str = None, signal: str = None, **options):
+        """
+        :param dst_property_name: Name of the subscriber's attribute - see 'ObserverObject.subscribeTwoWay'.
+        :param setter_method_name: Name of the attribute's setter method (e.g. 'setText').
+        :param dst_getter_method_name: Name of the attribute's getter method (e.g. 'text').
+        :param source_name: Name of the subscriber's attribute referencing the publisher - see 'BindingDeclaration'.
+        :param src_property_name: Name of the publisher's attribute.
+        :param src_setter_method_name: Name of the publisher attribute's setter method.
+        :param getter_method_name: Name of the publisher attribute's getter method.
+        :param signal: Name of the signal of the subscriber's attribute emitted when its value changes. If 'None',
+            'updateSource' of the returned handle has to be called by the subscriber.
+        :param options: Other arguments of 'subscribeTwoWay' - 'value_cache'.
+        """
+        super().__init__(dst_property_name, setter_method_name, source_name, src_property_name, getter_method_name,
+                         **options)
+        self.dst_getter_method_name = dst_getter_method_name
+        self.src_setter_method_name = src_setter_method_name
+        self.signal = signal
+        # Template of the target -> source direction - built by 'validate'
+        self.backward_template = None
+
+    def validate(self, owner):
+        if self.src_property_name and '.' in self.src_property_name:
+            raise ValueError('Two-way binding {0!r} cannot use a property path!'.format(self))
+        # The subscriber's attribute is the source of the target -> source direction
+        if self.dst_property_name is None:
+            raise ValueError('Two-way binding {0!r} requires the subscriber\'s attribute name!'.format(self))
+        for name in (self.dst_getter_method_name, self.src_setter_method_name, self.signal):
+            if name is not None and not (isinstance(name, str) and name.isidentifier()):
+                raise ValueError('Invalid attribute name {0!r} in {1!r}!'.format(name, self))
+        super().validate(owner)
+
+        source_type = self.sourceType(owner)
+        if self.backward_template is None:
+            self.backward_template = uBindingTemplate(self.src_property_name, self.src_setter_method_name,
+                                                      self.dst_property_name, self.dst_getter_method_name)
+        self.backward_template.prepare(dst_type=source_type, src_type=owner)
+
+    def bind(self, obj):
+        src_obj = obj if self.source_name is None else getattr(obj, self.source_name)
+        binding = uGetEventHub(src_obj, obj).subscribeTwoWay(obj, self.dst_property_name, self.setter_method_name,
+                                                             self.dst_getter_method_name, src_obj,
+                                                             self.src_property_name, self.src_setter_method_name,
+                                                             self.getter_method_name,
+                                                             templates=(self.template, self.backward_template),
+                                                             **self.options)
+        if self.signal is not None:
+            getattr(getattr(obj, self.dst_property_name), self.signal).connect(binding.updateSource)
+        return binding
+
+
+class ObservableProperty(object):
+    """
+    Data descriptor for attributes of 'ObservableObject' subclasses that publish their changes automatically, e.g.:
+
+    class A(ObservableObject):
+        a = ObservableProperty(1)
+
+    Every assignment ('A_instance.a = 2') triggers property changed event for the attribute - but only if the new value
+    differs from the stored one (according to the comparator given). The name of the attribute is fixed when the class
+    is created (with '__set_name__'), so publishing does not need any name resolution at runtime.
+
+    The value is stored in the instance under the '_<attribute_name>' name - in the instance's '__dict__' or, for
+    classes decorated with 'observableProperties' that define '__slots__', in a slot.
+    """
+
+    def __init__(self, default=None, comparator=valuesEqual, doc: str = None):
+        """
+        :param default: Value returned before the first assignment.
+        :param comparator: Function accepting old and new value and returning True if they are the same - in such case
+            the assignment does not trigger property changed event. By default, 'valuesEqual' function is used.
+        :param doc: Documentation string of the attribute.
+        """
+        self.default = default
+        self.comparator = comparator
+        self.name = None
+        self.storage_name = None
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.storage_name = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        # Let the computed attribute being evaluated know that it depends on this attribute
+        if uDependencyGraph.computations.stack:
+            uDependencyGraph.recordRead(obj, self.name)
+        try:
+            return getattr(obj, self.storage_name)
+        except AttributeError:
+            return self.default
+
+    def __set__(self, obj, value):
+        if self.comparator(getattr(obj, self.storage_name, self.default), value):
+            return
+        setattr(obj, self.storage_name, value)
+        obj.publishPropertyChanges(self.name)
+
+
+class ComputedProperty(object):
+    """
+    Read-only descriptor for attributes of 'ObservableObject' subclasses whose values are computed from other
+    attributes, e.g.:
+
+    class ViewModel(ObservableObject):
+        x = ObservableProperty('')
+        y = ObservableProperty('')
+
+        def get_presented_data(self):
+            return self.x + ' ' + self.y
+
+        presented_data = ComputedProperty(get_presented_data)
+
+    The attributes read by the getter are recorded automatically ('ObservableProperty' and 'ComputedProperty'
+    attributes) - other attributes the value depends on (e.g. plain python properties publishing their changes by hand)
+    can be listed in 'depends_on' parameter. The value is memoized until any of these attributes is published -
+    then the 'PropertyChangedEventHandler' recomputes it (once, in topological order of dependencies) and publishes
+    the change of the computed attribute - only if its value differs from the previous one.
+
+    The state of the attribute (see 'Utilities.ComputationNode') is stored in the instance under the
+    '_<attribute_name>_state' name.
+    """
+
+    def __init__(self, getter, depends_on: tuple = (), comparator=valuesEqual, doc: str = None):
+        """
+        :param getter: Function accepting the object and returning the value of the attribute.
+        :param depends_on: Names of the object's attributes the value depends on, that are not recorded automatically.
+        :param comparator: Function accepting old and new value and returning True if they are the same - in such case
+            property changed event is not triggered for the attribute. By default, 'valuesEqual' function is used.
+        :param doc: Documentation string of the attribute. By default, the getter's documentation string is used.
+        """
+        self.getter = getter
+        self.depends_on = tuple(depends_on)
+        self.comparator = comparator
+        self.name = None
+        self.storage_name = None
+        self.__doc__ = doc if doc is not None else getter.__doc__
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.storage_name = '_' + name + '_state'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        node = self.getNode(obj)
+        value = node.getValue()
+        # Let the computed attribute being evaluated know that it depends on this attribute
+        if uDependencyGraph.computations.stack:
+            uDependencyGraph.recordRead(obj, self.name, node.rank)
+        return value
+
+    def __set__(self, obj, value):
+        raise AttributeError("Attribute '{0}' is computed - it is read only!".format(self.name))
+
+    def getNode(self, obj) -> uComputationNode:
+        """
+        :param obj: Object owning the attribute.
+        :return: Node storing the state of the attribute for given object - created if it does not exist yet.
+        """
+        try:
+            return getattr(obj, self.storage_name)
+        except AttributeError:
+            node = uComputationNode(obj, self.name, self._compute, self.comparator)
+            setattr(obj, self.storage_name, node)
+            return node
+
+    def trackDependencies(self, obj):
+        """
+        Computes the attribute for given object if it has never been computed - so its dependencies are recorded.
+        Errors raised by the getter are ignored - the dependencies are then recorded during the first successful
+        computation.
+
+        :param obj: Object owning the attribute.
+        :return: None
+        """
+        node = self.getNode(obj)
+        if not node.computed:
+            try:
+                node.recompute()
+            except Exception:
+                node.dirty = True
+
+    def _compute(self, obj):
+        for obj_property_name in self.depends_on:
+            descriptor = getattr(type(obj), obj_property_name, None)
+            rank = descriptor.getNode(obj).rank if isinstance(descriptor, ComputedProperty) else 0
+            uDependencyGraph.recordRead(obj, obj_property_name, rank)
+        return self.getter(obj)
+
+
+def observableProperties(cls):
+    """
+    Class decorator for 'ObservableObject' subclasses using 'ObservableProperty' and 'ComputedProperty' attributes.
+    For classes defining '__slots__' the class is re-created with additional slots storing the values of these attributes
+    (and with '__weakref__' slot, so the instances can be referenced weakly by the 'PropertyChangedEventHandler').
+    Other classes are returned unchanged, e.g.:
+
+    @observableProperties
+    class Point(ObservableObject):
+        __slots__ = ()
+        x = ObservableProperty(0)
+        y = ObservableProperty(0)
+
+    :param cls: Decorated class.
+    :return: Class with storage for observable attributes' values.
+    """
+    if '__slots__' not in cls.__dict__:
+        return cls
+
+    slots = cls.__dict__['__slots__']
+    slots = (slots,) if isinstance(slots, str) else tuple(slots)
+    # Names already provided by the base classes cannot be declared again
+    inherited_slots = {slot for base in cls.__mro__[1:] for slot in base.__dict__.get('__slots__', ())}
+    if any('__weakref__' in base.__dict__ for base in cls.__mro__[1:]):
+        inherited_slots.add('__weakref__')
+
+    new_slots = [attribute.storage_name for attribute in cls.__dict__.values()
+                 if isinstance(attribute, (ObservableProperty, ComputedProperty))] + ['__weakref__']
+    new_slots = slots + tuple(slot for slot in new_slots if slot not in slots and slot not in inherited_slots)
+
+    # Slots can be defined only when the class is created - build the class again (the same way 'dataclasses' does)
+    cls_dict = dict(cls.__dict__)
+    for slot in slots:
+        cls_dict.pop(slot, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = new_slots
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
@@ -0,0 +1,405 @@
+import copy
+import pickle
+import struct
+import threading
+
+from ObservableObjects import ObservableObject, ObserverObject
+from Utilities import getEventHub as uGetEventHub
+
+
+class BridgeMessage:
+    """
+    Wire format of the messages exchanged by 'PropertyBridgeSender' and 'PropertyBridgeReceiver' over a
+    'multiprocessing' connection. A message is a batch of updates - list of (object_name, property_name, value) tuples
+    (or 'None' when the sender closes). It is pickled with protocol 5, so large buffers (e.g. NumPy arrays) are not
+    copied into the pickle - they are sent as separate chunks right after it and received into writable memory
+    (non-contiguous buffers are pickled in-band):
+
+    <I buffers_count> <Q buffer_size> * buffers_count pickle, then one chunk per buffer
+    """
+    COUNT = struct.Struct('<I')
+    SIZE = struct.Struct('<Q')
+
+    @classmethod
+    def send(cls, connection, batch):
+        """
+        :param connection: 'multiprocessing.connection.Connection' object.
+        :param batch: List of updates or 'None'.
+        :return: None
+        """
+        raw_buffers = list()
+
+        def collectBuffer(buffer: pickle.PickleBuffer) -> bool:
+            try:
+                raw_buffers.append(buffer.raw())
+            except BufferError:
+                # Non-contiguous buffer - pickled in-band
+                return True
+            return False
+
+        payload = pickle.dumps(batch, protocol=5, buffer_callback=collectBuffer)
+        header = cls.COUNT.pack(len(raw_buffers)) + b''.join(cls.SIZE.pack(raw.nbytes) for raw in raw_buffers)
+        connection.send_bytes(header + payload)
+        for raw in raw_buffers:
+            connection.send_bytes(raw)
+
+    @classmethod
+    def receive(cls, connection):
+        """
+        :param connection: 'multiprocessing.connection.Connection' object.
+        :return: List of updates or 'None' - see 'send'.
+        """
+        data = connection.recv_bytes()
+        buffers_count = cls.COUNT.unpack_from(data, 0)[0]
+        position = cls.COUNT.size
+        buffers = list()
+        for _ in range(buffers_count):
+            buffer = bytearray(cls.SIZE.unpack_from(data, position)[0])
+            if buffer:
+                connection.recv_bytes_into(buffer)
+            else:
+                connection.recv_bytes()
+            buffers.append(buffer)
+            position += cls.SIZE.size
+        return pickle.loads(memoryview(data)[position:], buffers=buffers)
+
+
+def snapshotValue(value):
+    """
+    Copies mutable buffers (objects supporting the buffer protocol with writable memory - e.g. NumPy arrays,
+    bytearrays) - so their later in-place modifications do not affect the copy. Other values are returned as they are.
+    Memory views cannot be pickled - their contents are copied into 'bytes'.
+
+    :param value: Published value.
+    :return: Value safe to be pickled later.
+    """
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return value
+    if type(value) is memoryview:
+        return view.tobytes()
+    if view.readonly:
+        return value
+    if type(value) is bytearray:
+        return bytearray(view)
+    try:
+        return copy.copy(value)
+    except TypeError:
+        # The type does not support copying (e.g. 'mmap') - only its contents are sent
+        return view.tobytes()
+
+
+class BridgeChannel(ObserverObject):
+    """
+    Subscriber of a single shared attribute - passes every published value to its 'PropertyBridgeSender'.
+    """
+
+    def __init__(self, sender, object_name: str, property_name: str):
+        self.sender = sender
+        self.key = (object_name, property_name)
+
+    def enqueue(self, value):
+        self.sender.enqueue(self.key, value)
+
+
+class PropertyBridgeSender:
+    """
+    Publishing side of a bridge mirroring attributes of observable objects into another process. Shared attributes
+    are subscribed to - their published values are stored per attribute and sent in batches by a background thread, so
+    publishers never wait for the other process. When the other process falls behind (the pipe is full), only the
+    newest value of every attribute is kept.
+
+    Values are pickled on the background thread, so mutable buffers (e.g. NumPy arrays, bytearrays) are copied when
+    they are published - an array modified in place right after its publication is not sent torn. Other values
+    (including buffers nested in containers) are sent as they are at the moment of sending. E.g.:
+
+    receiving_end, sending_end = multiprocessing.Pipe(duplex=False)
+    sender = PropertyBridgeSender(sending_end)
+    sender.share(data_model, 'model', ['x', 'y'])
+    # in the other process
+    receiver = PropertyBridgeReceiver(receiving_end)
+    label_updater.subscribeToVariable('text', None, receiver.mirror('model'), 'x')
+    receiver.start()
+    """
+
+    def __init__(self, connection):
+        """
+        :param connection: Sending end of a 'multiprocessing.Pipe' (or any 'multiprocessing' connection).
+        """
+        self.connection = connection
+        # {(object_name, property_name): newest value not sent yet} - insertion ordered
+        self._pending = dict()
+        self._condition = threading.Condition()
+        self._sending = False
+        self._closed = False
+        # {object_name: list of (channel, subscription)}
+        self._channels = dict()
+        self.sent_batches = 0
+        self.coalesced_values = 0
+        self.dropped_values = 0
+        self._thread = threading.Thread(target=self._sendLoop, name='PropertyBridgeSender', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def share(self, obj: ObservableObject, object_name: str, property_names):
+        """
+        Mirrors given attributes of the object into the other process - their current values are sent immediately and
+        every published change afterwards.
+
+        :param obj: Publisher.
+        :param object_name: Name identifying the object in the other process - see 'PropertyBridgeReceiver.mirror'.
+        :param property_names: Names of the attributes to share.
+        :return: None
+        """
+        channels = self._channels.setdefault(object_name, list())
+        for property_name in property_names:
+            channel = BridgeChannel(self, object_name, property_name)
+            subscription = channel.subscribeToVariable(None, 'enqueue', obj, property_name)
+            channels.append((channel, subscription))
+            try:
+                channel.enqueue(getattr(obj, property_name))
+            except AttributeError:
+                # Attribute not set yet - it is sent when published
+                pass
+
+    def unshare(self, object_name: str):
+        """
+        Stops mirroring attributes of the object shared with given name.
+
+        :param object_name: Name given to 'share'.
+        :return: None
+        """
+        for _, subscription in self._channels.pop(object_name, ()):
+            subscription.unsubscribe()
+
+    def enqueue(self, key: tuple, value):
+        """
+        Stores the value to be sent - replacing the value of the same attribute that has not been sent yet.
+
+        :param key: Tuple of (object_name, property_name).
+        :param value: New value of the attribute.
+        :return: None
+        """
+        value = snapshotValue(value)
+        with self._condition:
+            if self._closed:
+                return
+            if key in self._pending:
+                self.coalesced_values += 1
+            self._pending[key] = value
+            self._condition.notify()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until all the stored values are sent.
+
+        :param timeout: Maximal time to wait in seconds. If 'None', there is no limit.
+        :return: True if everything has been sent.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._closed or not (self._pending or self._sending), timeout)
+
+    def close(self):
+        """
+        Sends the remaining values, notifies the other process and closes the connection.
+
+        :return: None
+        """
+        for object_name in list(self._channels):
+            self.unshare(object_name)
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.connection.close()
+
+    def _sendLoop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                # Take the whole batch - values published while it is being sent are coalesced in the next one
+                batch = [key + (value,) for key, value in self._pending.items()]
+                self._pending.clear()
+                closing = self._closed
+                self._sending = bool(batch)
+            try:
+                if batch:
+                    self._sendBatch(batch)
+                if closing:
+                    BridgeMessage.send(self.connection, None)
+                    return
+            except (OSError, EOFError):
+                # The other process has closed its end - nothing more can be sent
+                with self._condition:
+                    self._closed = True
+                    self._pending.clear()
+                return
+            except Exception:
+                # Unexpected error of the batch - it is dropped, the bridge keeps sending the next ones
+                self.dropped_values += len(batch)
+            finally:
+                # 'flush' waits for this - it must not stay set whatever happens to the batch
+                with self._condition:
+                    self._sending = False
+                    self._condition.notify_all()
+
+    def _sendBatch(self, batch: list):
+        try:
+            BridgeMessage.send(self.connection, batch)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Some of the values cannot be pickled - they are dropped, the rest is sent
+            picklable_batch = list()
+            for update in batch:
+                try:
+                    pickle.dumps(update[2], protocol=5)
+                except Exception:
+                    self.dropped_values += 1
+                    continue
+                picklable_batch.append(update)
+            if not picklable_batch:
+                return
+            BridgeMessage.send(self.connection, picklable_batch)
+        self.sent_batches += 1
+
+
+class RemoteObservable(ObservableObject):
+    """
+    Mirror of an object shared by a 'PropertyBridgeSender' from another process. Its attributes hold the newest received
+    values and their changes are published, so local objects can subscribe to them with 'subscribeToVariable' as if the
+    publisher were local.
+    """
+
+    def __init__(self, object_name: str):
+        self.object_name = object_name
+
+
+class PropertyBridgeReceiver:
+    """
+    Receiving side of a bridge - see 'PropertyBridgeSender'. Received values are assigned to the attributes of mirror
+    objects ('RemoteObservable') and published - every received batch within a single batch of publications.
+
+    Messages can be processed by calling 'poll' (e.g. from a QTimer) or by a background thread started with 'start'.
+    If the thread is given a scheduler (see 'DeliveryPolicies' module, e.g. 'QtScheduler' - schedulers accept calls from
+    the receiving thread and pass them to their event loop), the values are applied on the scheduler's event loop -
+    values received while the loop is busy are coalesced, only the newest value of every attribute is applied.
+    """
+
+    def __init__(self, connection, event_hub=None):
+        """
+        :param connection: Receiving end of a 'multiprocessing.Pipe' (or any 'multiprocessing' connection).
+        :param event_hub: Hub the mirror objects publish their changes to. If 'None', the default hub is used.
+        """
+        self.connection = connection
+        self.event_hub = event_hub
+        self._mirrors = dict()
+        self._lock = threading.Lock()
+        # {(object_name, property_name): value} - values waiting for the scheduler
+        self._pending = dict()
+        self._scheduled_call = None
+        self._thread = None
+        self.closed = False
+        self.received_batches = 0
+
+    def mirror(self, object_name: str) -> RemoteObservable:
+        """
+        :param object_name: Name the object has been shared with - see 'PropertyBridgeSender.share'.
+        :return: Mirror object - created if needed, also before any value has been received.
+        """
+        with self._lock:
+            mirror = self._mirrors.get(object_name)
+            if mirror is None:
+                mirror = self._mirrors[object_name] = RemoteObservable(object_name)
+                if self.event_hub is not None:
+                    mirror.attachEventHub(self.event_hub)
+            return mirror
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """
+        Applies all the batches received so far.
+
+        :param timeout: Time to wait for the first batch in seconds. If 'None', waits until a batch is received.
+        :return: Number of batches applied.
+        """
+        applied_count = 0
+        while not self.closed and self.connection.poll(timeout):
+            self.apply(self._receive())
+            applied_count += 1
+            timeout = 0.0
+        return applied_count
+
+    def start(self, scheduler=None):
+        """
+        Starts the background thread receiving the batches.
+
+        :param scheduler: Scheduler used to apply the values on its event loop. If 'None', the values are applied (and
+            published) on the receiving thread.
+        :return: None
+        """
+        self._thread = threading.Thread(target=self._receiveLoop, args=(scheduler,), name='PropertyBridgeReceiver',
+                                        daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: float = None):
+        """
+        Waits until the background thread ends - i.e. the sender closes the bridge.
+
+        :param timeout: Maximal time to wait in seconds.
+        :return: None
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def apply(self, batch: list):
+        """
+        Assigns the values to the mirror objects' attributes and publishes the changes.
+
+        :param batch: List of (object_name, property_name, value) tuples.
+        :return: None
+        """
+        if not batch:
+            return
+        with uGetEventHub(self.mirror(batch[0][0])).batch():
+            for object_name, property_name, value in batch:
+                mirror = self.mirror(object_name)
+                setattr(mirror, property_name, value)
+                mirror.publishPropertyChanges(property_name)
+
+    def _receive(self):
+        try:
+            batch = BridgeMessage.receive(self.connection)
+        except (OSError, EOFError):
+            batch = None
+        if batch is None:
+            self.closed = True
+            return None
+        self.received_batches += 1
+        return batch
+
+    def _receiveLoop(self, scheduler):
+        while not self.closed:
+            batch = self._receive()
+            if batch is None:
+                break
+            if scheduler is None:
+                self.apply(batch)
+                continue
+            with self._lock:
+                for object_name, property_name, value in batch:
+                    self._pending[(object_name, property_name)] = value
+                if self._scheduled_call is None:
+                    self._scheduled_call = scheduler.callSoon(self._applyPending)
+
+    def _applyPending(self):
+        with self._lock:
+            batch = [key + (value,) for key, value in self._pending.items()]
+            self._pending.clear()
+            self._scheduled_call = None
+        self.apply(batch)
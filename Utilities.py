@@ -1,40 +1,1850 @@
+import asyncio
+import concurrent.futures
+import inspect
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
 from enum import *
+from functools import partial, update_wrapper
+from operator import attrgetter
+from types import MethodType
+
+from BindingOperators import fuseOperators as uFuseOperators
 
 
 class PublicationArguments(Enum):
     """
-    Enum class to store types of event publication arguments. Used to build dictionaries of arguments that are passed
-    to some PropertyChangedEventHandler's functions. Particular enum values acts as keys for dictionaries.
+    Enum class to store types of event publication arguments. Used to build dictionaries of arguments that are passed
+    to some PropertyChangedEventHandler's functions. Particular enum values acts as keys for dictionaries.
+
+    Values:
+
+    - PUB_OBJ - key for storing publisher object reference
+    - OBJ_PROP_NAME - key for storing publisher object's attribute name
+    """
+    PUB_OBJ = 0
+    OBJ_PROP_NAME = 1
+
+
+class CallbackData(Enum):
+    """
+    Enum class to store types of information needed during callbacks execution. Used to build dictionaries containing
+    callbacks' execution parameters. Particular enum values acts as keys for dictionaries.
+
+    Values:
+
+    - DESTINATION_OBJECT - key for subscriber object - whose attribute is to receive new value
+    - DST_PROPERTY_NAME - key for subscriber object's attribute name
+    - SET_METHOD_NAME - key for the name of the setter method used to set new value to the subscriber's attribute
+    - SOURCE_OBJECT -  key for publisher object - whose attribute is to produce new value
+    - SRC_PROPERTY_NAME - key for publisher object's attribute name
+    - GET_METHOD_NAME - key for the name of the getter method used to get new value from the publisher's attribute
+    """
+    DESTINATION_OBJECT = 0
+    DST_PROPERTY_NAME = 1
+    SET_METHOD_NAME = 2
+    SOURCE_OBJECT = 3
+    SRC_PROPERTY_NAME = 4
+    GET_METHOD_NAME = 5
+
+
+class CacheMode(Enum):
+    """
+    Enum class to store the ways a binding's last delivered value is compared with a new one - see 'DeliveredValueCache'.
+
+    Values:
+
+    - IDENTITY - the value is the same object as the delivered one ('is'). Cheapest, but misses equal copies (and must
+    not be used for objects modified in place, e.g. observable collections)
+    - EQUALITY - the value is identical or equal ('==') to the delivered one
+    - HASH - the value has the same hash as the delivered one - only the hash is stored, not the value itself
+    """
+    IDENTITY = 0
+    EQUALITY = 1
+    HASH = 2
+
+
+class StrongReference:
+    """
+    Class imitating 'weakref.ref' interface for objects that do not support weak references (e.g. instances of classes
+    defining '__slots__' without '__weakref__'). Calling the object returns the referenced object - which is kept alive
+    as long as the reference exists.
+    """
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __call__(self):
+        return self._obj
+
+
+def makeReference(obj, callback=None):
+    """
+    Returns weak reference to given object (with optional callback invoked when the object is garbage-collected). If
+    the object cannot be referenced weakly, 'StrongReference' is returned instead and the callback is never invoked.
+
+    :param obj: Object to be referenced.
+    :param callback: Function accepting the reference object - called after the object has been collected.
+    :return: 'weakref.ref' or 'StrongReference' object.
+    """
+    try:
+        return weakref.ref(obj, callback)
+    except TypeError:
+        return StrongReference(obj)
+
+
+# Marker of attributes not found by 'findClassAttribute'
+_MISSING = object()
+
+
+def findClassAttribute(cls, name: str, default=None):
+    """
+    Finds the attribute in the namespaces of the class and its base classes - without invoking descriptors (like
+    'inspect.getattr_static', but without its checks of metaclasses and shadowed '__dict__' attributes, which make it
+    the main cost of compiling a binding).
+
+    :param cls: Class to search.
+    :param name: Name of the attribute.
+    :param default: Value returned if the attribute is not found.
+    :return: Raw attribute - e.g. 'staticmethod' object rather than the function it wraps.
+    """
+    for base in cls.__mro__:
+        namespace = base.__dict__
+        if name in namespace:
+            return namespace[name]
+    return default
+
+
+def hasAttributeDefined(obj, name: str) -> bool:
+    """
+    Checks whether the attribute is defined by the object itself or by its class (the names listed by 'dir', except
+    those added by custom '__dir__' methods) - without building the list of all the names.
+
+    :param obj: Object to check.
+    :param name: Name of the attribute.
+    :return: True if the attribute is defined.
+    """
+    if name in getattr(obj, '__dict__', ()):
+        return True
+    return findClassAttribute(type(obj), name, _MISSING) is not _MISSING
+
+
+def compileMethodCall(owner, method_name: str, arguments_count: int = None):
+    """
+    Resolves the method of given object into a callable that does not keep the object alive. Methods defined in the
+    object's class are called through the class (with the object obtained from a weak reference), so the callable does
+    not hold a bound method - and therefore a strong reference to the object. If the object has been collected,
+    calling the callable does nothing.
+    Callables stored directly in the object's '__dict__', static methods and class methods are returned as they are.
+
+    :param owner: Object owning the method.
+    :param method_name: Name of the method.
+    :param arguments_count: Number of arguments the callable is called with - if 0 or 1, the callable accepts exactly
+        that many arguments and does not pack them into a tuple on every call.
+    :return: Callable accepting the same arguments as the method.
+    """
+    bound_method = getattr(owner, method_name)
+
+    if method_name in getattr(owner, '__dict__', ()) or \
+            isinstance(findClassAttribute(type(owner), method_name), (staticmethod, classmethod)):
+        return bound_method
+
+    owner_reference = makeReference(owner)
+    if isinstance(owner_reference, StrongReference):
+        return bound_method
+
+    return callThroughReference(owner_reference, getattr(type(owner), method_name), arguments_count)
+
+
+def callThroughReference(owner_reference, unbound_method, arguments_count: int = None):
+    """
+    Builds the callable calling given method of the object obtained from the reference - see 'compileMethodCall'.
+
+    :param owner_reference: Reference to the object owning the method - see 'makeReference'.
+    :param unbound_method: Method taken from the object's class.
+    :param arguments_count: Number of arguments the callable is called with - see 'compileMethodCall'.
+    :return: Callable accepting the same arguments as the method (without the object).
+    """
+    # The owner can be collected by another thread while the call is being dispatched - then there is nothing to do
+    if arguments_count == 0:
+        def callMethod():
+            owner_obj = owner_reference()
+            if owner_obj is not None:
+                return unbound_method(owner_obj)
+
+        return callMethod
+
+    if arguments_count == 1:
+        def callMethod(argument):
+            owner_obj = owner_reference()
+            if owner_obj is not None:
+                return unbound_method(owner_obj, argument)
+
+        return callMethod
+
+    def callMethod(*args):
+        owner_obj = owner_reference()
+        if owner_obj is not None:
+            return unbound_method(owner_obj, *args)
+
+    return callMethod
+
+
+class AsyncDeliveries:
+    """
+    Class scheduling and tracking deliveries of values to asynchronous subscribers - subscriptions whose setter method
+    is a coroutine function. The coroutine is scheduled on the event loop the subscription was created in (or, if it
+    was created outside any loop, on the loop running in the publishing thread): directly, when the loop runs in the
+    publishing thread, or thread-safely otherwise. Publishing never waits for asynchronous subscribers - use 'wait' to
+    await completion of the scheduled deliveries.
+    """
+
+    def __init__(self):
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(self, coroutine, loop: asyncio.AbstractEventLoop = None):
+        """
+        Schedules the coroutine delivering a value to asynchronous subscriber.
+
+        :param coroutine: Coroutine object returned by the subscriber's setter method.
+        :param loop: Event loop of the subscriber. If 'None', the loop running in the current thread is used.
+        :return: 'asyncio.Task' (for the loop running in the current thread) or 'concurrent.futures.Future'.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if loop is None or loop.is_closed():
+            loop = running_loop
+        if loop is None:
+            coroutine.close()
+            raise RuntimeError('Cannot deliver value to asynchronous subscriber - there is no event loop to run it!')
+
+        if loop is running_loop:
+            future = loop.create_task(coroutine)
+        else:
+            future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    async def wait(self):
+        """
+        Awaits all deliveries scheduled so far (and the ones scheduled in the meantime) - those running on the current
+        event loop and those scheduled thread-safely on other loops.
+
+        :return: None
+        """
+        current_loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                futures = [asyncio.wrap_future(future) if isinstance(future, concurrent.futures.Future) else future
+                           for future in self._pending
+                           if isinstance(future, concurrent.futures.Future) or future.get_loop() is current_loop]
+            if not futures:
+                return
+
+            results = await asyncio.gather(*futures, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise RuntimeError('Cannot complete asynchronous binding due to some error! ' + str(result)) \
+                        from result
+
+    def _discard(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+
+class DeliveredValueCache:
+    """
+    Class storing the last value delivered by a binding - so the setter call can be skipped when a publication (or
+    resynchronization) carries the value the destination already holds (e.g. 'QLabel.setText' with identical text still
+    costs a relayout). Values are compared according to 'CacheMode' or with a custom comparator. Counts the deliveries
+    and the skipped ones.
+    """
+    __slots__ = ('mode', 'comparator', 'value', 'has_value', 'delivered_count', 'skipped_count')
+
+    def __init__(self, mode=CacheMode.EQUALITY):
+        """
+        :param mode: 'CacheMode' value or a function accepting the delivered and the new value and returning True if
+            they are the same.
+        """
+        if isinstance(mode, CacheMode):
+            self.mode, self.comparator = mode, None
+        elif callable(mode):
+            self.mode, self.comparator = None, mode
+        else:
+            raise ValueError('Value cache mode has to be a CacheMode value or a comparator function!')
+        self.value = None
+        self.has_value = False
+        self.delivered_count = 0
+        self.skipped_count = 0
+
+    def matches(self, new_value) -> bool:
+        """
+        :param new_value: Value about to be delivered.
+        :return: True if it is the same as the delivered one - comparison errors count as a difference.
+        """
+        if not self.has_value:
+            return False
+        try:
+            if self.mode is CacheMode.IDENTITY:
+                return self.value is new_value
+            if self.mode is CacheMode.EQUALITY:
+                return self.value is new_value or bool(self.value == new_value)
+            if self.mode is CacheMode.HASH:
+                return self.value == hash(new_value)
+            return bool(self.comparator(self.value, new_value))
+        except Exception:
+            # E.g. unhashable values or element-wise comparisons of arrays
+            return False
+
+    def store(self, new_value):
+        """
+        Remembers the delivered value.
+
+        :param new_value: Value passed to the setter.
+        :return: None
+        """
+        self.delivered_count += 1
+        if self.mode is CacheMode.HASH:
+            try:
+                self.value, self.has_value = hash(new_value), True
+            except TypeError:
+                self.value, self.has_value = None, False
+            return
+        self.value, self.has_value = new_value, True
+
+    def reset(self):
+        """
+        Forgets the delivered value - the next value is delivered whatever it is.
+
+        :return: None
+        """
+        self.value, self.has_value = None, False
+
+
+class BindingCycleError(RuntimeError):
+    """
+    Exception raised when publications feed back into themselves without converging (an attribute is published again
+    more times than the hub allows while its own publication is being dispatched) or when the propagation gets deeper
+    than the hub's limit. 'chain' lists the publications leading to it - from the outermost one, e.g.
+    ['ViewModel.model_x', 'MainView.input_1', 'ViewModel.model_x', ...].
+    """
+
+    def __init__(self, message: str, chain: list):
+        super().__init__(message + ': ' + ' -> '.join(chain))
+        self.chain = chain
+
+
+class GuardState(threading.local):
+    """
+    Class storing the state of a 'ReentrancyGuard' in the current thread.
+    """
+    active = False
+
+
+class ReentrancyGuard:
+    """
+    Guard shared by binding plans that must not be delivered while any of them is delivering in the same thread - e.g.
+    both directions of a two-way binding (see 'TwoWayBinding'). A guarded plan reached during the delivery of another
+    plan of the guard is an echo - it is suppressed before its getter is called.
+
+    Only the synchronous part of a delivery is guarded - values postponed by a delivery policy or evaluated in the
+    background are delivered outside the guard.
+    """
+    __slots__ = ('state', 'suppressed_count')
+
+    def __init__(self):
+        self.state = GuardState()
+        self.suppressed_count = 0
+
+
+# Value read by a guarded plan whose guard is active - see 'BindingPlan.guard'
+SUPPRESSED = object()
+
+
+class BindingTemplate:
+    """
+    Class storing the parts of binding plans that do not depend on the subscribed objects - shared by the plans of many
+    subscriptions of the same shape, e.g. of every instance of a class declaring its bindings (see
+    'ObservableObjects.BindingDeclaration'). Plans built with a template ('BindingPlan' argument 'template') skip the
+    lookups made for every new plan otherwise:
+
+    - attribute getters are built once, with the template,
+    - whether the getter method belongs to the source attribute is decided once per class of the attribute,
+    - methods (and whether they are coroutine functions) are looked up once per class of the object owning them.
+
+    The plan only creates the callables referring to its objects then. Methods stored in the object's own '__dict__',
+    static methods and class methods are resolved as without the template.
+    """
+    __slots__ = ('dst_property_name', 'setter_method_name', 'src_property_name', 'getter_method_name',
+                 'attribute_getter', 'attribute_method_getter', '_getter_owners', '_methods')
+
+    def __init__(self, dst_property_name: str, setter_method_name: str, src_property_name: str,
+                 getter_method_name: str):
+        """
+        Arguments are the same as in 'BindingPlan' - the plans built with the template have to use the same names.
+        """
+        self.dst_property_name, self.setter_method_name = dst_property_name, setter_method_name
+        self.src_property_name, self.getter_method_name = src_property_name, getter_method_name
+        self.attribute_getter = attrgetter(src_property_name)
+        self.attribute_method_getter = None if getter_method_name is None else \
+            attrgetter(src_property_name + '.' + getter_method_name)
+        # {class_of_source_attribute: True if it defines the getter method, ...}
+        self._getter_owners = dict()
+        # {(class, method_name): (unbound_method or None, True if it is a coroutine function), ...}
+        self._methods = dict()
+
+    def prepare(self, dst_type: type = None, src_type: type = None):
+        """
+        Looks up the methods of given classes in advance - e.g. when the class declaring the binding is created.
+
+        :param dst_type: Class of the subscribers. Its setter method is looked up if the method belongs to the
+            subscriber itself.
+        :param src_type: Class of the publishers. Its getter method is looked up if the class defines it.
+        :return: None
+        """
+        if dst_type is not None and self.dst_property_name is None and self.setter_method_name is not None:
+            self.findMethod(dst_type, self.setter_method_name)
+        if src_type is not None and self.getter_method_name is not None and \
+                findClassAttribute(src_type, self.getter_method_name, _MISSING) is not _MISSING:
+            self.findMethod(src_type, self.getter_method_name)
+
+    def findMethod(self, cls, method_name: str) -> tuple:
+        """
+        :param cls: Class of the object owning the method.
+        :param method_name: Name of the method.
+        :return: Tuple (unbound_method, is_coroutine_function). The method is 'None' if it has to be resolved on the
+            object - when the class does not define it, or defines a static or class method.
+        """
+        key = (cls, method_name)
+        method = self._methods.get(key)
+        if method is None:
+            unbound_method = None
+            raw_method = findClassAttribute(cls, method_name, _MISSING)
+            if raw_method is not _MISSING and not isinstance(raw_method, (staticmethod, classmethod)):
+                unbound_method = getattr(cls, method_name)
+            method = self._methods[key] = (unbound_method, inspect.iscoroutinefunction(unbound_method))
+        return method
+
+    def compileMethodCall(self, owner, method_name: str, arguments_count: int, owner_reference=None) -> tuple:
+        """
+        Variant of 'compileMethodCall' using the methods looked up already.
+
+        :param owner: Object owning the method.
+        :param method_name: Name of the method.
+        :param arguments_count: Number of arguments the callable is called with - see 'compileMethodCall'.
+        :param owner_reference: Reference to the owner - if the caller has one already.
+        :return: Tuple (callable, is_coroutine_function).
+        """
+        unbound_method, is_coroutine = self.findMethod(type(owner), method_name)
+        if unbound_method is None or method_name in getattr(owner, '__dict__', ()):
+            return compileMethodCall(owner, method_name, arguments_count), \
+                inspect.iscoroutinefunction(getattr(owner, method_name))
+        if owner_reference is None:
+            owner_reference = makeReference(owner)
+        if isinstance(owner_reference, StrongReference):
+            return getattr(owner, method_name), is_coroutine
+        return callThroughReference(owner_reference, unbound_method, arguments_count), is_coroutine
+
+    def isGetterOwnedByAttribute(self, src_property) -> bool:
+        """
+        :param src_property: Value of the source attribute.
+        :return: True if the getter method belongs to the attribute - see 'BindingPlan'.
+        """
+        if self.getter_method_name in getattr(src_property, '__dict__', ()):
+            return True
+        cls = type(src_property)
+        owned = self._getter_owners.get(cls)
+        if owned is None:
+            owned = self._getter_owners[cls] = \
+                findClassAttribute(cls, self.getter_method_name, _MISSING) is not _MISSING
+        return owned
+
+
+class BindingPlan:
+    """
+    Class representing a single subscription compiled into a ready-to-call form. All the decisions that
+    'PropertyChangedEventHandler.updateSubscriberObject' used to make on every callback (which object owns the getter
+    method, which object owns the setter method, whether 'getattr'/'setattr' is used) are made once - when the plan is
+    built - and stored as two callables:
+
+    - getter - callable without arguments returning the current value of the source attribute,
+    - setter - callable accepting one argument (new value) and passing it to the destination.
+
+    Performing the callback is then reduced to a single call: 'plan.execute()'.
+
+    If the setter method is a coroutine function, 'async_setter' stores the callable returning the coroutine, while
+    'setter' schedules the coroutine on the subscriber's event loop (see 'AsyncDeliveries') - so synchronous
+    publications do not wait for asynchronous subscribers.
+
+    The plan refers to the source and destination objects weakly, so it never keeps a publisher or a subscriber alive.
+    When the destination object is garbage-collected, the 'on_collected' callback (if given) is called with the plan
+    - so the registry storing the plan can drop it.
+
+    If a delivery policy is given (see 'DeliveryPolicies' module), 'setter' is the delivery callable created by the
+    policy - it decides when the values are passed to 'target_setter', which calls the setter method directly.
+
+    If a value cache is given ('value_cache' - see 'DeliveredValueCache'), values the destination has received already
+    are not passed to 'target_setter' at all - the check takes place at the moment of delivery (after the delivery
+    policy). The cache is reset whenever the plan is resolved again, as the destination may have been replaced.
+
+    If operators are given (see 'BindingOperators' module), the values pass through 'pipeline' - the chain of operators
+    fused into a single callable - before they reach the delivery. The pipeline (with the state of its operators) is
+    created once, like the delivery callable.
+
+    If a reentrancy guard is given ('guard' - see 'ReentrancyGuard'), 'getter' returns 'SUPPRESSED' while the guard is
+    active and 'setter' drops such values, otherwise it activates the guard for the time of the delivery. Guarded
+    plans form their own groups in 'PropertyBindings', so suppressing them does not affect other plans.
+
+    If an evaluation policy is given (see 'BackgroundEvaluations' module), the source value is not read during
+    publication at all - 'setter' is the evaluation callable, which computes the value with 'source_getter' on a worker
+    thread (or process) and passes the newest result to the delivery. 'getter' then returns a placeholder only, and
+    such plans form their own groups in 'PropertyBindings' ('group_key'), so they never share the evaluation with
+    plans reading the value synchronously.
+
+    The setter method owned by the destination attribute (e.g. 'setText' of a QLabel stored as 'self.label') is
+    resolved against the attribute object that is assigned at the moment of resolving. If that attribute object is
+    replaced later, call 'resolve' (or 'PropertyChangedEventHandler.refreshBindings') to compile the plan again.
+    If the plan cannot be resolved when it is built (e.g. the attributes do not exist yet), resolving is postponed
+    until the first execution.
+
+    If a template is given ('template' - see 'BindingTemplate'), the lookups depending only on the classes of the
+    objects are taken from it instead of being made for every plan.
+
+    Plans are compact records ('__slots__') - large registries do not pay for per-plan dictionaries.
+    """
+    __slots__ = ('dst_property_name', 'setter_method_name', 'src_property_name', 'getter_method_name',
+                 '_dst_reference', '_src_reference', '_on_collected', '_async_deliveries', 'subscriber_id',
+                 'subscription_key', 'delivered_version', 'scheduled_version', 'deferred', 'getter', 'setter',
+                 'target_setter', 'async_setter', 'loop', 'delivery_policy', 'delivery', 'value_cache', 'pipeline',
+                 'source_getter', 'evaluation', 'guard', 'group_key', 'template', '__weakref__')
+
+    def __init__(self, dst_obj, dst_property_name: str, setter_method_name: str, src_obj, src_property_name: str,
+                 getter_method_name: str, on_collected=None, async_deliveries: AsyncDeliveries = None,
+                 delivery_policy=None, value_cache=None, evaluation_policy=None, operators=None, guard=None,
+                 template: BindingTemplate = None):
+        """
+        :param dst_obj: Subscriber - object containing attribute that needs to be updated.
+        :param dst_property_name: Name of the destination attribute.
+        :param setter_method_name: Name of the setter method - see 'PropertyChangedEventHandler.updateSubscriberObject'.
+        :param src_obj: Publisher - object containing an attribute with a source value.
+        :param src_property_name: Name of the source attribute.
+        :param getter_method_name: Name of the getter method - see 'PropertyChangedEventHandler.updateSubscriberObject'.
+        :param on_collected: Function accepting the plan - called when the destination object is garbage-collected.
+        :param async_deliveries: Object scheduling deliveries to asynchronous setter methods. If 'None', deliveries are
+            scheduled without tracking.
+        :param delivery_policy: Object deciding when the published values are delivered to the destination - e.g.
+            'DeliveryPolicies.ThrottledDelivery'. If 'None', values are delivered immediately.
+        :param value_cache: 'CacheMode' value or comparator function - see 'DeliveredValueCache'. If 'None', every
+            value is passed to the setter.
+        :param evaluation_policy: Object evaluating the source value off the publishing thread - e.g.
+            'BackgroundEvaluations.BackgroundEvaluation'. If 'None', the value is read during publication.
+        :param operators: Sequence of operators processing the values before delivery - see 'BindingOperators'
+            module. If 'None' (or empty), values are delivered as read.
+        :param guard: 'ReentrancyGuard' object shared with the plans whose deliveries must not trigger this one (and
+            vice versa). If 'None', the plan is not guarded.
+        :param template: 'BindingTemplate' built for the same attribute and method names - shared by the plans of
+            subscriptions of the same shape. If 'None', all the lookups are made for this plan.
+        """
+        self.dst_property_name, self.setter_method_name = dst_property_name, setter_method_name
+        self.src_property_name, self.getter_method_name = src_property_name, getter_method_name
+
+        # If destination or source objects are None, return exception error
+        if dst_obj is None or src_obj is None:
+            raise ValueError('Destination and source objects cannot be None!')
+        # If source property name is none, return error - there cannot be registered a variable without name
+        if self.src_property_name is None:
+            raise ValueError("Source property's name cannot be None")
+
+        self._on_collected = on_collected
+        # Identifies the subscription among the subscriber's subscriptions - identical subscriptions are collapsed
+        self.subscriber_id = id(dst_obj)
+        self.subscription_key = (self.dst_property_name, self.setter_method_name, id(src_obj), self.src_property_name,
+                                 self.getter_method_name)
+        self.guard = guard
+        self.template = template
+        if guard is not None:
+            # Guarded plan does not replace an identical unguarded subscription
+            self.subscription_key += (id(guard),)
+        if delivery_policy is not None or value_cache is not None or evaluation_policy is not None or operators:
+            # Subscriptions differing in options are different subscriptions - the options are kept in the key (they
+            # are compared by identity), so they cannot be collected and their identifiers reused by other objects
+            self.subscription_key += (delivery_policy, value_cache, evaluation_policy,
+                                      tuple(operators) if operators else None)
+        # Version of the source attribute ('PropertyBindings.version') the destination has received last
+        self.delivered_version = 0
+        # Version passed to a deferred delivery (see 'deferred') - it becomes the delivered one when the delivery
+        # takes place
+        self.scheduled_version = 0
+        self._async_deliveries = AsyncDeliveries() if async_deliveries is None else async_deliveries
+        self.async_setter = None
+        # Event loop of the subscriber - the one running when the subscription is created
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop = None
+        self._dst_reference = makeReference(dst_obj, self._onDestinationCollected if on_collected else None)
+        self._src_reference = makeReference(src_obj)
+        # Delivery callable is created once - so its state (e.g. scheduled delivery) survives re-resolving of the plan
+        self.delivery_policy = delivery_policy
+        self.delivery = None if delivery_policy is None else delivery_policy.wrap(self._deliverScheduled)
+        self.value_cache = None if value_cache is None else DeliveredValueCache(value_cache)
+        self.pipeline = None
+        if operators:
+            self.pipeline = uFuseOperators(operators, self._deliverProcessed)
+        self.evaluation = None if evaluation_policy is None else \
+            evaluation_policy.wrap(self._evaluateSource, self._deliverEvaluated, self.loop)
+        # Calling the setter of a deferred plan only schedules the delivery - the plan stamps 'delivered_version' itself
+        # when the value reaches the destination, so a dropped or failed delivery is repeated by the resynchronization
+        self.deferred = self.delivery is not None or self.evaluation is not None
+        # Plans are grouped by the getter method - but background evaluations and guarded plans are never shared
+        self.group_key = self.getter_method_name if self.evaluation is None and guard is None else \
+            (self.getter_method_name, id(self))
+
+        try:
+            self.resolve()
+        except AttributeError:
+            # Some of the attributes or methods do not exist yet - resolve the plan during first execution
+            self.source_getter = self._resolvingGetter
+            self.getter = self._selectGetter()
+            self.target_setter = self._resolvingSetter
+            self.setter = self._selectSetter()
+
+    @classmethod
+    def fromCallbackData(cls, callback_data: dict, **options):
+        """
+        Builds the plan from the dictionary of subscription arguments - compatibility with the dictionary-based API.
+
+        :param callback_data: Dictionary of arguments built with
+            'PropertyChangedEventHandler.returnSubscriptionCallbackData' method. Contains keys that conform
+            'CallbackData' enum values.
+        :param options: Keyword arguments of the constructor ('on_collected', 'async_deliveries', 'delivery_policy',
+            'value_cache', 'evaluation_policy', 'operators', 'guard', 'template').
+        :return: 'BindingPlan' object.
+        """
+        return cls(*PropertyChangedEventHandler.extractSubscriptionCallbackData(callback_data), **options)
+
+    @property
+    def destination_object(self):
+        return self._dst_reference()
+
+    @property
+    def source_object(self):
+        return self._src_reference()
+
+    @property
+    def callback_data(self) -> dict:
+        """
+        Dictionary of arguments the plan has been built from - see
+        'PropertyChangedEventHandler.returnSubscriptionCallbackData'.
+        """
+        return PropertyChangedEventHandler.returnSubscriptionCallbackData(
+            self.destination_object, self.dst_property_name, self.setter_method_name,
+            self.source_object, self.src_property_name, self.getter_method_name)
+
+    def resolve(self):
+        """
+        Compiles (or re-compiles) the getter and setter callables based on the subscription data stored.
+
+        :return: None
+        """
+        dst_obj, src_obj = self._dst_reference(), self._src_reference()
+        if dst_obj is None or src_obj is None:
+            raise ValueError('Cannot resolve binding plan - destination or source object no longer exists!')
+
+        self.source_getter = self._compileGetter(src_obj, self.src_property_name, self.getter_method_name)
+        self.getter = self._selectGetter()
+        self.target_setter = self._compileSetter(dst_obj, self.dst_property_name, self.setter_method_name)
+        self.setter = self._selectSetter()
+        if self.value_cache is not None:
+            self.value_cache.reset()
+
+    def execute(self):
+        """
+        Transfers the current value of the source attribute to the destination.
+
+        :return: None
+        """
+        self.setter(self.getter())
+
+    def _compileGetter(self, src_obj, src_property_name: str, getter_method_name: str):
+        """
+        Builds the callable returning the value of the source attribute.
+
+        :param src_obj: Object containing an attribute with a source value.
+        :param src_property_name: Name of the source attribute.
+        :param getter_method_name: Name of the getter method - see 'PropertyChangedEventHandler.updateSubscriberObject'.
+        :return: Callable without arguments.
+        """
+        src_reference, template = self._src_reference, self.template
+
+        # When getter method is a 'getattr'
+        if getter_method_name is None:
+            attribute_getter = attrgetter(src_property_name) if template is None else template.attribute_getter
+            return lambda: attribute_getter(src_reference())
+
+        # When getter method is custom - decide once whether it belongs to the source attribute or to the source object
+        src_property = getattr(src_obj, src_property_name)
+        if hasAttributeDefined(src_property, getter_method_name) if template is None else \
+                template.isGetterOwnedByAttribute(src_property):
+            # The attribute itself can be replaced by the publisher before publishing changes, so it is read again
+            # every time - only the decision about the method's owner is cached.
+            attribute_method_getter = attrgetter(src_property_name + '.' + getter_method_name) if template is None \
+                else template.attribute_method_getter
+            return lambda: attribute_method_getter(src_reference())()
+
+        if template is None:
+            return compileMethodCall(src_obj, getter_method_name, 0)
+        return template.compileMethodCall(src_obj, getter_method_name, 0, src_reference)[0]
+
+    def _compileSetter(self, dst_obj, dst_property_name: str, setter_method_name: str):
+        """
+        Builds the callable passing new value to the destination.
+
+        :param dst_obj: Object containing attribute that needs to be updated.
+        :param dst_property_name: Name of the destination attribute.
+        :param setter_method_name: Name of the setter method - see 'PropertyChangedEventHandler.updateSubscriberObject'.
+        :return: Callable accepting new value as the only argument.
+        """
+        # When setter method is a 'setattr'
+        if setter_method_name is None:
+            dst_reference = self._dst_reference
+
+            def setAttribute(new_value):
+                dst_obj_alive = dst_reference()
+                if dst_obj_alive is not None:
+                    setattr(dst_obj_alive, dst_property_name, new_value)
+
+            return setAttribute
+
+        # When setter method is custom - get it from destination object or destination object's attribute
+        setter_method_owner = dst_obj if dst_property_name is None else getattr(dst_obj, dst_property_name)
+        if self.template is None:
+            setter_method = compileMethodCall(setter_method_owner, setter_method_name, 1)
+            is_coroutine = inspect.iscoroutinefunction(getattr(setter_method_owner, setter_method_name))
+        else:
+            setter_method, is_coroutine = self.template.compileMethodCall(
+                setter_method_owner, setter_method_name, 1, self._dst_reference if dst_property_name is None else None)
+
+        self.async_setter = None
+        if is_coroutine:
+            # Asynchronous setter - the synchronous 'setter' only schedules the coroutine on subscriber's event loop
+            self.async_setter = setter_method
+            schedule, loop = self._async_deliveries.schedule, self.loop
+            return lambda new_value: schedule(setter_method(new_value), loop)
+
+        return setter_method
+
+    def _resolvingGetter(self):
+        self.resolve()
+        return self.source_getter()
+
+    def _resolvingSetter(self, new_value):
+        self.resolve()
+        self.target_setter(new_value)
+
+    def _selectGetter(self):
+        if self.guard is not None:
+            return self._guardedGetter
+        # Value of a plan evaluated in the background is not needed during publication
+        return self.source_getter if self.evaluation is None else self._placeholderValue
+
+    @staticmethod
+    def _placeholderValue():
+        return None
+
+    def _guardedGetter(self):
+        # Echo - the value is not read at all
+        if self.guard.state.active:
+            return SUPPRESSED
+        return self.source_getter() if self.evaluation is None else None
+
+    def _selectSetter(self):
+        if self.guard is not None:
+            return self._guardedSetter
+        return self._selectUnguardedSetter()
+
+    def _guardedSetter(self, new_value):
+        guard = self.guard
+        if new_value is SUPPRESSED or guard.state.active:
+            guard.suppressed_count += 1
+            return
+        guard.state.active = True
+        try:
+            self._selectUnguardedSetter()(new_value)
+        finally:
+            guard.state.active = False
+
+    def _selectUnguardedSetter(self):
+        # The fastest callable doing the job - plain setter method call when there is neither a policy nor a cache
+        if self.evaluation is not None:
+            return self.evaluation
+        if self.pipeline is not None:
+            return self.pipeline
+        if self.delivery is not None:
+            return self.delivery
+        if self.value_cache is not None:
+            return self._deliverToTarget
+        return self.target_setter
+
+    def _deliverToTarget(self, new_value):
+        value_cache = self.value_cache
+        if value_cache is None:
+            self.target_setter(new_value)
+            return
+        if value_cache.matches(new_value):
+            value_cache.skipped_count += 1
+            return
+        self.target_setter(new_value)
+        # Stored only when the setter succeeds - a failed delivery is retried with the same value
+        value_cache.store(new_value)
+
+    def _evaluateSource(self):
+        return self.source_getter()
+
+    def _deliverEvaluated(self, new_value):
+        if self.pipeline is not None:
+            self.pipeline(new_value)
+        else:
+            self._deliverProcessed(new_value)
+        if self.delivery is None:
+            self.delivered_version = self.scheduled_version
+
+    def _deliverScheduled(self, new_value):
+        # Called by the delivery policy - when the value is passed to the destination
+        self._deliverToTarget(new_value)
+        self.delivered_version = self.scheduled_version
+
+    def _deliverProcessed(self, new_value):
+        if self.delivery is not None:
+            self.delivery(new_value)
+        else:
+            self._deliverToTarget(new_value)
+
+    def _onDestinationCollected(self, reference):
+        self._on_collected(self)
+
+
+class PropertyBindings:
+    """
+    Class storing binding plans of a single registered attribute. Plans are grouped by the getter method they use to
+    read the source value ('BindingPlan.group_key') - all plans in a group read exactly the same value, so during publication the value is
+    evaluated once per group and passed to every plan's setter.
+
+    The groups are exposed as an immutable snapshot - tuple of (plans_group_tuple, ...). Modifications (done by the
+    'SubscriptionRegistry' under its lock) only drop the snapshot - it is rebuilt (copy-on-write) under the lock by the
+    first reader afterwards. Publishing threads therefore read the snapshot without taking any lock.
+
+    The 'version' counter identifies the state of the source attribute - it is increased on every publication and on
+    every change recorded without publication ('PropertyChangedEventHandler.markChanged'). Every plan stores
+    the version it has received last ('BindingPlan.delivered_version'), so plans that are out of date can be found
+    without evaluating any getter. Plans with deferred deliveries ('BindingPlan.deferred') store it when the delivery
+    takes place - their attributes stay in the registry's dirty set until then.
+    """
+    __slots__ = ('_groups', '_snapshot', '_lock', 'version')
+
+    def __init__(self, lock):
+        """
+        :param lock: Lock of the registry storing the object - guards modifications and rebuilding of the snapshot.
+        """
+        # {group_key: {binding_plan: None, ...}} - dictionaries act as insertion-ordered sets
+        self._groups = dict()
+        self._snapshot = ()
+        self._lock = lock
+        # New plans have 'delivered_version' = 0 - they are out of date until they receive a value
+        self.version = 1
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self.snapshot())
+
+    def __iter__(self):
+        return iter(plan for group in self.snapshot() for plan in group)
+
+    def __contains__(self, binding_plan) -> bool:
+        group = self._groups.get(binding_plan.group_key)
+        return group is not None and binding_plan in group
+
+    def append(self, binding_plan):
+        """
+        Adds binding plan to the group of plans using the same getter method.
+
+        :param binding_plan: 'BindingPlan' object.
+        :return: None
+        """
+        with self._lock:
+            group = self._groups.get(binding_plan.group_key)
+            if group is None:
+                group = self._groups[binding_plan.group_key] = dict()
+            group[binding_plan] = None
+            self._snapshot = None
+
+    def remove(self, binding_plan):
+        """
+        Removes binding plan from its group.
+
+        :param binding_plan: 'BindingPlan' object.
+        :return: None
+        """
+        with self._lock:
+            group = self._groups[binding_plan.group_key]
+            del group[binding_plan]
+            if not group:
+                del self._groups[binding_plan.group_key]
+            self._snapshot = None
+
+    def snapshot(self) -> tuple:
+        """
+        :return: Tuple of groups - every group is a tuple of binding plans sharing the same getter method.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(tuple(group) for group in self._groups.values())
+        return snapshot
+
+    def outdated(self) -> tuple:
+        """
+        :return: Tuple of groups (as in 'snapshot') containing only plans that have not received the current version of
+            the source attribute. Empty groups are skipped.
+        """
+        version = self.version
+        groups = (tuple(plan for plan in group if plan.delivered_version != version) for group in self.snapshot())
+        return tuple(group for group in groups if group)
+
+    def memoryUsage(self) -> int:
+        """
+        :return: Size (in bytes) of the containers used to store the plans - without the plans themselves.
+        """
+        with self._lock:
+            return sys.getsizeof(self) + sys.getsizeof(self._groups) + sys.getsizeof(self._snapshot) + \
+                sum(sys.getsizeof(group) for group in self._groups.values())
+
+
+class PublisherEntry:
+    """
+    Class storing registry data of a single publisher object: the reference to the publisher (weak, if possible) and
+    the dictionary of its registered attributes - {attribute_name: PropertyBindings( <'BindingPlan' objects > )}.
+    """
+    __slots__ = ('reference', 'properties')
+
+    def __init__(self, reference):
+        self.reference = reference
+        self.properties = dict()
+
+
+class SubscriptionRegistry:
+    """
+    Class being a central database of the whole event mechanism - stores binding plans of every registered attribute.
+    Publishers are identified by their identity ('id'), not by hashing, so they do not need to be hashable and
+    custom '__eq__' methods are never called. Publishers and subscribers are referenced weakly - when any of them is
+    garbage-collected, all the related entries are removed automatically.
+
+    The registry is safe to use from many threads. All modifications are done under the registry's lock, while
+    looking the bindings up ('getBindings') and reading their snapshots never takes the lock - so publishing does not
+    serialize the threads. Garbage collector callbacks only queue the removals - they are applied by the next
+    operation on the registry (they can be triggered at any moment, also in the middle of a modification).
+
+    Attributes whose bindings may be out of date (new plans, changes recorded without publication, failed deliveries)
+    are kept in the dirty set - so resynchronization ('PropertyChangedEventHandler.updateAllBindings' with
+    'changed_only' set) visits only them instead of walking the whole registry.
+
+    Plans are indexed also by their subscribers - {id(subscriber): {subscription_key: plan}} - so identical
+    subscriptions are detected and all subscriptions of an object can be removed without scanning the registry.
+
+    The registry has the following structure:
+
+    {
+        id(publisher_object_1) : PublisherEntry(
+            reference = <weak reference to publisher_object_1>,
+            properties = {
+                publisher_object_attribute_name_1 : PropertyBindings( <'BindingPlan' objects > ),
+
+                publisher_object_attribute_name_2 : PropertyBindings( <'BindingPlan' objects > ),
+
+                ...
+            }
+        ),
+
+        id(publisher_object_2) : PublisherEntry( ... ),
+
+        ...
+    }
+    """
+
+    def __init__(self):
+        self._entries = dict()
+        self._lock = threading.RLock()
+        # Removals requested by garbage collector callbacks - tuples of (removal_function, argument)
+        self._pending_removals = deque()
+        # Attributes with possibly outdated bindings - {(id(publisher), attribute_name): PublisherEntry}
+        self._dirty = dict()
+        # Plans of every subscriber - {id(subscriber): {subscription_key: plan}}
+        self._subscribers = dict()
+
+    def __len__(self) -> int:
+        self._applyPendingRemovals()
+        return len(self._entries)
+
+    def __contains__(self, pub_obj) -> bool:
+        return self.getEntry(pub_obj) is not None
+
+    def __getitem__(self, pub_obj) -> dict:
+        entry = self.getEntry(pub_obj)
+        if entry is None:
+            raise KeyError(pub_obj)
+        return entry.properties
+
+    def items(self) -> list:
+        """
+        Returns a snapshot of living publishers and their registered attributes.
+
+        :return: List of tuples - (publisher object, {attribute_name: PropertyBindings( <'BindingPlan' objects > )}).
+        """
+        self._applyPendingRemovals()
+        with self._lock:
+            entries = [(entry.reference(), dict(entry.properties)) for entry in self._entries.values()]
+        return [(pub_obj, properties) for pub_obj, properties in entries if pub_obj is not None]
+
+    def register(self, pub_obj, obj_property_name: str) -> PropertyBindings:
+        """
+        Registers given attribute of given publisher - if not registered yet.
+
+        :param pub_obj: Reference to the object containing attribute that the property changed event is triggered for.
+        :param obj_property_name: Name of the changing attribute.
+        :return: 'PropertyBindings' object storing binding plans assigned to the attribute.
+        """
+        self._applyPendingRemovals()
+        with self._lock:
+            entry = self.getEntry(pub_obj)
+            if entry is None:
+                key = id(pub_obj)
+                entry = PublisherEntry(makeReference(pub_obj, partial(self._onPublisherCollected, key)))
+                self._entries[key] = entry
+
+            binding_plans = entry.properties.get(obj_property_name)
+            if binding_plans is None:
+                binding_plans = entry.properties[obj_property_name] = PropertyBindings(self._lock)
+            return binding_plans
+
+    def addBinding(self, pub_obj, obj_property_name: str, binding_plan: BindingPlan) -> BindingPlan:
+        """
+        Registers given attribute (if not registered yet) and adds the binding plan to it - atomically. If the
+        subscriber already has an identical subscription (the same 'subscription_key'), the plan is not added.
+
+        :param pub_obj: Reference to the publisher object.
+        :param obj_property_name: Name of the attribute.
+        :param binding_plan: Plan to be added.
+        :return: The plan registered for the subscription - given one or the one added before.
+        """
+        with self._lock:
+            subscriber_plans = self._subscribers.get(binding_plan.subscriber_id)
+            if subscriber_plans is None:
+                subscriber_plans = self._subscribers[binding_plan.subscriber_id] = dict()
+
+            existing_plan = subscriber_plans.get(binding_plan.subscription_key)
+            # Identifiers could have been reused by other objects - compare the objects themselves
+            if existing_plan is not None and existing_plan.destination_object is binding_plan.destination_object \
+                    and existing_plan.source_object is pub_obj:
+                return existing_plan
+
+            self.register(pub_obj, obj_property_name).append(binding_plan)
+            subscriber_plans[binding_plan.subscription_key] = binding_plan
+            # The new plan has not received any value yet
+            self._dirty[(id(pub_obj), obj_property_name)] = self.getEntry(pub_obj)
+            return binding_plan
+
+    def unregister(self, pub_obj, obj_property_name: str = None):
+        """
+        Removes given attribute of given publisher together with all its binding plans. The publisher's entry is
+        removed when there are no more attributes registered for it.
+
+        :param pub_obj: Reference to the publisher object.
+        :param obj_property_name: Name of the attribute. If 'None' - all attributes of the publisher are removed.
+        :return: None
+        """
+        self._applyPendingRemovals()
+        with self._lock:
+            entry = self.getEntry(pub_obj)
+            if entry is None:
+                return
+
+            if obj_property_name is None:
+                removed_bindings = list(entry.properties.values())
+                entry.properties.clear()
+            else:
+                removed_bindings = [entry.properties.pop(obj_property_name, ())]
+            for binding_plans in removed_bindings:
+                self._forgetPlans(binding_plans)
+
+            if not entry.properties:
+                del self._entries[id(pub_obj)]
+
+    def getEntry(self, pub_obj):
+        """
+        :param pub_obj: Reference to the publisher object.
+        :return: 'PublisherEntry' of given publisher or 'None' if the publisher is not registered.
+        """
+        entry = self._entries.get(id(pub_obj))
+        # The identifier could have been reused by another object after the previous publisher was collected
+        if entry is not None and entry.reference() is pub_obj:
+            return entry
+        return None
+
+    def getBindings(self, pub_obj, obj_property_name: str):
+        """
+        Looks the bindings up without taking the registry's lock.
+
+        :param pub_obj: Reference to the publisher object.
+        :param obj_property_name: Name of the attribute.
+        :return: 'PropertyBindings' object assigned to the attribute or 'None' if the attribute is not registered.
+        """
+        if self._pending_removals:
+            self._applyPendingRemovals()
+        entry = self._entries.get(id(pub_obj))
+        if entry is None or entry.reference() is not pub_obj:
+            return None
+        return entry.properties.get(obj_property_name)
+
+    def markDirty(self, pub_obj, obj_property_name: str):
+        """
+        Adds given attribute to the dirty set - if it is registered.
+
+        :param pub_obj: Reference to the publisher object.
+        :param obj_property_name: Name of the attribute.
+        :return: None
+        """
+        with self._lock:
+            entry = self.getEntry(pub_obj)
+            if entry is not None and obj_property_name in entry.properties:
+                self._dirty[(id(pub_obj), obj_property_name)] = entry
+
+    def takeDirty(self) -> list:
+        """
+        Empties the dirty set.
+
+        :return: List of tuples - (publisher object, attribute_name, PropertyBindings) - for attributes of living
+            publishers that are still registered.
+        """
+        self._applyPendingRemovals()
+        with self._lock:
+            dirty, self._dirty = self._dirty, dict()
+            taken = list()
+            for (key, obj_property_name), entry in dirty.items():
+                pub_obj = entry.reference()
+                binding_plans = entry.properties.get(obj_property_name)
+                # The attribute could have been unregistered (or the publisher collected) since it was marked
+                if pub_obj is not None and binding_plans and self._entries.get(key) is entry:
+                    taken.append((pub_obj, obj_property_name, binding_plans))
+            return taken
+
+    def containsBinding(self, binding_plan: BindingPlan) -> bool:
+        """
+        :param binding_plan: Binding plan.
+        :return: True if the plan is registered.
+        """
+        entry = self.getEntry(binding_plan.source_object)
+        if entry is None:
+            return False
+        binding_plans = entry.properties.get(binding_plan.src_property_name)
+        return binding_plans is not None and binding_plan in binding_plans
+
+    def subscriberBindings(self, dst_obj) -> list:
+        """
+        :param dst_obj: Subscriber object.
+        :return: List of binding plans registered for given subscriber.
+        """
+        self._applyPendingRemovals()
+        with self._lock:
+            subscriber_plans = self._subscribers.get(id(dst_obj), {})
+            return [plan for plan in subscriber_plans.values() if plan.destination_object is dst_obj]
+
+    def discardSubscriber(self, dst_obj):
+        """
+        Removes all binding plans of given subscriber from the registry.
+
+        :param dst_obj: Subscriber object.
+        :return: None
+        """
+        with self._lock:
+            for binding_plan in self.subscriberBindings(dst_obj):
+                self.discardBinding(binding_plan)
+
+    def discardBinding(self, binding_plan: BindingPlan):
+        """
+        Removes given binding plan from the registry.
+
+        :param binding_plan: Plan to be removed.
+        :return: None
+        """
+        with self._lock:
+            self._forgetPlans((binding_plan,))
+            entry = self.getEntry(binding_plan.source_object)
+            if entry is None:
+                return
+            binding_plans = entry.properties.get(binding_plan.src_property_name)
+            if binding_plans is not None and binding_plan in binding_plans:
+                binding_plans.remove(binding_plan)
+                if not binding_plans:
+                    del entry.properties[binding_plan.src_property_name]
+                if not entry.properties:
+                    del self._entries[id(binding_plan.source_object)]
+
+    def onSubscriberCollected(self, binding_plan: BindingPlan):
+        """
+        Garbage collector callback - queues removal of the binding plan whose subscriber has been collected.
+
+        :param binding_plan: Plan to be removed.
+        :return: None
+        """
+        self._pending_removals.append((self.discardBinding, binding_plan))
+
+    def clear(self):
+        """
+        Removes all entries from the registry.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._pending_removals.clear()
+            self._dirty.clear()
+            self._subscribers.clear()
+
+    def memoryUsage(self) -> dict:
+        """
+        Measures the memory held by the registry. Sizes are computed with 'sys.getsizeof' for every container,
+        reference and binding plan stored - objects that the registry only refers to (publishers, subscribers) are not
+        included.
+
+        :return: Dictionary with keys: 'publishers', 'properties', 'bindings' (numbers of entries) and 'bytes'.
+        """
+        self._applyPendingRemovals()
+        publishers_count = properties_count = bindings_count = 0
+
+        with self._lock:
+            total_size = sys.getsizeof(self) + sys.getsizeof(self._entries)
+            for entry in self._entries.values():
+                publishers_count += 1
+                total_size += sys.getsizeof(entry) + sys.getsizeof(entry.reference) + sys.getsizeof(entry.properties)
+                for binding_plans in entry.properties.values():
+                    properties_count += 1
+                    total_size += binding_plans.memoryUsage()
+                    for binding_plan in binding_plans:
+                        bindings_count += 1
+                        total_size += sys.getsizeof(binding_plan)
+
+        return {'publishers': publishers_count, 'properties': properties_count, 'bindings': bindings_count,
+                'bytes': total_size}
+
+    def _applyPendingRemovals(self):
+        while self._pending_removals:
+            try:
+                removal_function, argument = self._pending_removals.popleft()
+            except IndexError:
+                return
+            removal_function(argument)
+
+    def _forgetPlans(self, binding_plans):
+        # Removes the plans from the subscribers' index - called under the lock
+        for binding_plan in binding_plans:
+            subscriber_plans = self._subscribers.get(binding_plan.subscriber_id)
+            if subscriber_plans is not None and subscriber_plans.get(binding_plan.subscription_key) is binding_plan:
+                del subscriber_plans[binding_plan.subscription_key]
+                if not subscriber_plans:
+                    del self._subscribers[binding_plan.subscriber_id]
+
+    def _removePublisherEntry(self, key_and_reference: tuple):
+        key, reference = key_and_reference
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.reference is reference:
+                del self._entries[key]
+                for binding_plans in entry.properties.values():
+                    self._forgetPlans(binding_plans)
+
+    def _onPublisherCollected(self, key: int, reference):
+        self._pending_removals.append((self._removePublisherEntry, (key, reference)))
+
+
+class Subscription:
+    """
+    Handle of a single subscription - returned by 'PropertyChangedEventHandler.subscribe' (and
+    'ObserverObject.subscribeToVariable'). Removes the subscription in constant time with 'unsubscribe' and can be
+    used as a context manager - the subscription is removed when the 'with' block ends:
+
+    with view.subscribeToVariable(...):
+        ...
+
+    Identical subscriptions share one binding plan, so their handles remove the same subscription.
+    """
+    __slots__ = ('_registry', 'binding_plan')
+
+    def __init__(self, registry: SubscriptionRegistry, binding_plan: BindingPlan):
+        """
+        :param registry: Registry storing the subscription.
+        :param binding_plan: Plan of the subscription.
+        """
+        self._registry = registry
+        self.binding_plan = binding_plan
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+    @property
+    def active(self) -> bool:
+        """
+        True if the subscription is still registered.
+        """
+        return self._registry.containsBinding(self.binding_plan)
+
+    def unsubscribe(self):
+        """
+        Removes the subscription - the subscriber stops receiving values. Calling it again has no effect.
+
+        :return: None
+        """
+        self._registry.discardBinding(self.binding_plan)
+
+
+class TwoWayBinding:
+    """
+    Handle of a two-way binding - returned by 'PropertyChangedEventHandler.subscribeTwoWay'. The source -> target
+    direction is a regular subscription, delivered on every publication of the source attribute. The target -> source
+    direction is performed by 'updateSource' - e.g. connected to the widget's signal:
+
+    binding = view.subscribeTwoWay('input_1', 'setText', 'text', view_model, 'model_x')
+    view.input_1.textChanged.connect(lambda: binding.updateSource())
+
+    Both directions share a 'ReentrancyGuard', so the echo of a delivery (the target's change notification caused by
+    the source -> target delivery, or the source's publication caused by 'updateSource') is suppressed before any
+    getter or setter is called.
+    """
+    __slots__ = ('guard', 'forward', 'backward_plan', '_event_hub')
+
+    def __init__(self, event_hub, guard: ReentrancyGuard, forward: Subscription, backward_plan: BindingPlan):
+        """
+        :param event_hub: Hub the source -> target subscription is registered in.
+        :param guard: Guard shared by both directions.
+        :param forward: Subscription of the target to the source attribute.
+        :param backward_plan: Plan transferring the target's value to the source attribute.
+        """
+        self._event_hub = event_hub
+        self.guard = guard
+        self.forward = forward
+        self.backward_plan = backward_plan
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+    @property
+    def active(self) -> bool:
+        return self.forward.active
+
+    @property
+    def binding_plan(self) -> BindingPlan:
+        """
+        Plan of the source -> target direction.
+        """
+        return self.forward.binding_plan
+
+    @property
+    def suppressed_count(self) -> int:
+        """
+        Number of echoes suppressed in both directions.
+        """
+        return self.guard.suppressed_count
+
+    def updateSource(self, *_):
+        """
+        Transfers the target's current value to the source attribute - unless it is an echo of the source -> target
+        delivery. Does nothing after 'unsubscribe'. Arguments (e.g. of the signal the method is connected to) are
+        ignored.
+
+        :return: None
+        """
+        if not self.forward.active:
+            return
+        try:
+            self.backward_plan.execute()
+        except Exception as E:
+            if isinstance(E, BindingCycleError):
+                raise
+            raise RuntimeError('Cannot complete gui -> variable binding due to some error! ' + str(E)) from E
+
+    def updateTarget(self):
+        """
+        Transfers the source attribute's current value to the target - see 'PropertyChangedEventHandler.publish'.
+
+        :return: None
+        """
+        source_object = self.forward.binding_plan.source_object
+        if source_object is not None:
+            self._event_hub.publish(source_object, self.forward.binding_plan.src_property_name)
+
+    def unsubscribe(self):
+        """
+        Removes the binding in both directions. Calling it again has no effect.
+
+        :return: None
+        """
+        self.forward.unsubscribe()
+
+
+class PathLink:
+    """
+    Subscriber of a single intermediate link of a property path - e.g. 'current_model' in 'current_model.x'. Receives
+    the new object stored in the link's attribute and lets its 'PropertyPathBinding' rewire the rest of the path.
+    """
+    __slots__ = ('path_binding', 'index', '__weakref__')
+
+    def __init__(self, path_binding, index: int):
+        self.path_binding = path_binding
+        self.index = index
+
+    def onLinkChanged(self, new_obj):
+        self.path_binding.onLinkChanged(self.index, new_obj)
+
+
+class PropertyPathBinding:
+    """
+    Subscription to a property path - e.g. 'current_model.x' of a view model. Every intermediate link of the path (the
+    'current_model' attribute of the view model) is subscribed to by a 'PathLink', and the last attribute (the 'x'
+    attribute of the current model) by a regular subscription of the destination. When an intermediate object is
+    replaced and published, only the links after it are subscribed again - and the new value of the path is delivered
+    once. If any link of the path is 'None' (or does not exist), nothing is delivered until the path is complete again.
+
+    Returned by 'PropertyChangedEventHandler.subscribe' for source attribute names containing dots - it works as the
+    'Subscription' handle. The hub keeps the path bindings alive as long as their destination objects live.
+    """
+
+    def __init__(self, event_hub, dst_obj, dst_property_name: str, setter_method_name: str, src_obj, path: str,
+                 getter_method_name: str, options: dict = None):
+        """
+        :param event_hub: Hub the path binding is registered in.
+        :param dst_obj: Subscriber - object containing attribute that needs to be updated.
+        :param dst_property_name: Name of the destination attribute.
+        :param setter_method_name: Name of the setter method.
+        :param src_obj: Root object of the path.
+        :param path: Names of the attributes separated with dots.
+        :param getter_method_name: Name of the getter method used with the last attribute of the path.
+        :param options: Keyword arguments of 'PropertyChangedEventHandler.subscribe' used for the last attribute
+            ('delivery_policy', 'value_cache', 'evaluation_policy', 'operators').
+        """
+        self.segments = path.split('.')
+        if not all(self.segments):
+            raise ValueError('Invalid property path: ' + repr(path))
+        self.path = path
+        self.dst_property_name, self.setter_method_name = dst_property_name, setter_method_name
+        self.getter_method_name = getter_method_name
+        self.options = options or dict()
+        self._event_hub = event_hub
+        self._dst_reference = makeReference(dst_obj)
+        self.subscriber_id = id(dst_obj)
+        self._links = [PathLink(self, index) for index in range(len(self.segments) - 1)]
+        # Objects along the path - root object first; 'None' marks the end of an incomplete path
+        self._objects = list()
+        # Subscriptions of the intermediate links and of the last attribute
+        self._link_subscriptions = list()
+        self.leaf_subscription = None
+        self.active = True
+        self.rewired_links_count = 0
+        self._lock = threading.RLock()
+        with self._lock:
+            self._rewire(0, src_obj)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+    @property
+    def binding_plan(self):
+        """
+        Plan of the subscription to the last attribute of the path - 'None' if the path is incomplete.
+        """
+        leaf_subscription = self.leaf_subscription
+        return None if leaf_subscription is None else leaf_subscription.binding_plan
+
+    @property
+    def destination_object(self):
+        return self._dst_reference()
+
+    def unsubscribe(self):
+        """
+        Removes the subscriptions of all the links of the path. Calling it again has no effect.
+
+        :return: None
+        """
+        with self._lock:
+            if not self.active:
+                return
+            self.active = False
+            self._dropLinks(0)
+        self._event_hub.forgetPathBinding(self)
+
+    def onLinkChanged(self, index: int, new_obj):
+        """
+        Called when the attribute of the link with given index is published - rewires the path after the link and
+        delivers the new value of the path.
+
+        :param index: Index of the link whose attribute has changed.
+        :param new_obj: New object stored in the link's attribute.
+        :return: None
+        """
+        with self._lock:
+            if not self.active:
+                return
+            # The same object has been published again - the rest of the path still holds
+            if len(self._objects) > index + 1 and self._objects[index + 1] is new_obj:
+                return
+            self._dropLinks(index + 1)
+            self._rewire(index + 1, new_obj)
+            leaf_subscription = self.leaf_subscription
+        if leaf_subscription is not None:
+            leaf_subscription.binding_plan.execute()
+
+    def _dropLinks(self, index: int):
+        # Removes subscriptions of the links starting with given one (and of the last attribute)
+        for subscription in self._link_subscriptions[index:]:
+            subscription.unsubscribe()
+        del self._link_subscriptions[index:]
+        del self._objects[index:]
+        if self.leaf_subscription is not None:
+            self.leaf_subscription.unsubscribe()
+            self.leaf_subscription = None
+
+    def _rewire(self, index: int, obj):
+        # Subscribes the links starting with given one - 'obj' is the object the link's attribute belongs to
+        dst_obj = self._dst_reference()
+        if dst_obj is None:
+            return
+        for link_index in range(index, len(self._links)):
+            self._objects.append(obj)
+            if obj is None:
+                return
+            segment = self.segments[link_index]
+            self._link_subscriptions.append(getEventHub(obj, dst_obj).subscribe(
+                self._links[link_index], None, 'onLinkChanged', obj, segment, None))
+            self.rewired_links_count += 1
+            obj = getattr(obj, segment, None)
+
+        self._objects.append(obj)
+        if obj is None:
+            return
+        self.leaf_subscription = getEventHub(obj, dst_obj).subscribe(
+            dst_obj, self.dst_property_name, self.setter_method_name, obj, self.segments[-1], self.getter_method_name,
+            **self.options)
+        self.rewired_links_count += 1
+
+
+class ComputationNode:
+    """
+    Class storing the state of a single computed attribute of a single object (see 'ObservableObjects.ComputedProperty'):
+    memoized value, the attributes read during the last computation (sources) and the rank of the node - the length of
+    the longest path to plain (not computed) source attributes. Nodes are recomputed in the order of ranks, which is a
+    topological order of the dependency graph.
+    """
+    __slots__ = ('owner_reference', 'name', 'compute', 'comparator', 'value', 'computed', 'dirty', 'changed', 'rank',
+                 'sources', '__weakref__')
+
+    def __init__(self, owner, name: str, compute, comparator):
+        """
+        :param owner: Object owning the computed attribute.
+        :param name: Name of the computed attribute.
+        :param compute: Function accepting the owner object and returning the attribute's value.
+        :param comparator: Function accepting old and new value and returning True if they are the same.
+        """
+        self.owner_reference = makeReference(owner)
+        self.name = name
+        self.compute = compute
+        self.comparator = comparator
+        self.value = None
+        self.computed = False
+        # 'dirty' - memoized value is not valid; 'changed' - value changed since the last propagation
+        self.dirty = True
+        self.changed = False
+        self.rank = 1
+        # {(id(source_object), source_attribute_name): source_object_reference}
+        self.sources = dict()
+
+    def getValue(self):
+        """
+        :return: Memoized value of the attribute - computed again only if any of its sources changed.
+        """
+        if self.dirty:
+            self.recompute()
+        return self.value
+
+    def recompute(self):
+        """
+        Computes the value of the attribute, recording the attributes read by the getter as the node's sources.
+
+        :return: None
+        """
+        owner = self.owner_reference()
+        reads = dict()
+
+        computation_stack = DependencyGraph.computations.stack
+        computation_stack.append(reads)
+        try:
+            new_value = self.compute(owner)
+        finally:
+            computation_stack.pop()
+
+        DependencyGraph.updateSources(self, reads)
+        # The first computed value is not a change - nobody could observe any value before
+        if self.computed and not self.comparator(self.value, new_value):
+            self.changed = True
+        self.value = new_value
+        self.computed = True
+        self.dirty = False
+
+
+class DependencyGraph:
+    """
+    Class storing the dependencies between computed attributes and the attributes they read. Used by the
+    'PropertyChangedEventHandler' to propagate property changed events to computed attributes:
+
+    - when an attribute is published, every computed attribute depending on it (directly or not) is invalidated - so
+      nobody can read a value computed from outdated inputs,
+    - after the attribute's subscribers are updated, the invalidated attributes are processed in topological order -
+      each of them is recomputed at most once, and only if any of its sources really changed; property changed event
+      is dispatched for it only if its value changed.
+
+    The dependents are stored in the same form as subscriptions - identity keyed, with weak references to the source
+    objects: {id(source_object): PublisherEntry(properties={attribute_name: {ComputationNode: None}})}.
+    Modifications of the graph are done under the 'lock'; garbage collector callbacks only queue removals of entries.
+    """
+    dependents = dict()
+    lock = threading.RLock()
+    # Computations in progress in the current thread - see 'ComputationState'
+    computations = None
+    _pending_removals = deque()
+
+    @classmethod
+    def recordRead(cls, obj, obj_property_name: str, rank: int = 0):
+        """
+        Records that the innermost computation in progress has read given attribute.
+
+        :param obj: Object owning the attribute read.
+        :param obj_property_name: Name of the attribute read.
+        :param rank: Rank of the attribute - 0 for plain attributes, rank of the node for computed ones.
+        :return: None
+        """
+        computation_stack = cls.computations.stack
+        if computation_stack:
+            computation_stack[-1][(id(obj), obj_property_name)] = (obj, obj_property_name, rank)
+
+    @classmethod
+    def updateSources(cls, node: ComputationNode, reads: dict):
+        """
+        Replaces the sources of given node with the attributes read during its last computation.
+
+        :param node: Recomputed node.
+        :param reads: Dictionary built by 'recordRead' calls - {(id(obj), name): (obj, name, rank)}.
+        :return: None
+        """
+        with cls.lock:
+            cls._applyPendingRemovals()
+            cls._updateSources(node, reads)
+
+    @classmethod
+    def _updateSources(cls, node: ComputationNode, reads: dict):
+        for key in node.sources.keys() - reads.keys():
+            entry = cls.dependents.get(key[0])
+            if entry is not None and entry.reference is node.sources[key]:
+                nodes = entry.properties.get(key[1], {})
+                nodes.pop(node, None)
+                if not nodes:
+                    entry.properties.pop(key[1], None)
+                if not entry.properties:
+                    del cls.dependents[key[0]]
+            del node.sources[key]
+
+        rank = 0
+        for key, (obj, obj_property_name, source_rank) in reads.items():
+            rank = max(rank, source_rank)
+            if key not in node.sources:
+                entry = cls.dependents.get(key[0])
+                if entry is None or entry.reference() is not obj:
+                    entry = cls.dependents[key[0]] = \
+                        PublisherEntry(makeReference(obj, partial(cls._onSourceCollected, key[0])))
+                entry.properties.setdefault(obj_property_name, dict())[node] = None
+                node.sources[key] = entry.reference
+        node.rank = rank + 1
+
+    @classmethod
+    def invalidate(cls, publications, mark_dirty: bool = True) -> list:
+        """
+        Invalidates all computed attributes depending (directly or not) on the published attributes.
+
+        :param publications: Iterable of (publisher, attribute_name) tuples.
+        :param mark_dirty: If False, the nodes are only collected - used when they have been invalidated already
+            (e.g. during a batch of publications) and could have been recomputed since then.
+        :return: List of (node, was_dirty) tuples sorted topologically - 'was_dirty' tells whether the node's value had
+            been invalid already before.
+        """
+        affected_nodes = dict()
+        pending = [(id(pub_obj), obj_property_name) for pub_obj, obj_property_name in publications]
+
+        with cls.lock:
+            cls._applyPendingRemovals()
+            cls._collectDependents(pending, affected_nodes, mark_dirty)
+
+        return sorted(affected_nodes.items(), key=lambda node_state: node_state[0].rank)
+
+    @classmethod
+    def _collectDependents(cls, pending: list, affected_nodes: dict, mark_dirty: bool):
+        while pending:
+            object_id, obj_property_name = pending.pop()
+            entry = cls.dependents.get(object_id)
+            if entry is None:
+                continue
+
+            for node in tuple(entry.properties.get(obj_property_name, ())):
+                if node in affected_nodes:
+                    continue
+                owner = node.owner_reference()
+                if owner is None:
+                    continue
+                affected_nodes[node] = node.dirty
+                if mark_dirty:
+                    node.dirty = True
+                pending.append((id(owner), node.name))
+
+    @classmethod
+    def hasDependents(cls, obj, obj_property_name: str) -> bool:
+        """
+        :param obj: Object owning the attribute.
+        :param obj_property_name: Name of the attribute.
+        :return: True if any computed attribute depends on given attribute.
+        """
+        entry = cls.dependents.get(id(obj))
+        return entry is not None and entry.reference() is obj and bool(entry.properties.get(obj_property_name))
+
+    @classmethod
+    def trackDependencies(cls, obj, obj_property_name: str):
+        """
+        Computes given attribute once, if it is a computed attribute never computed before - so its dependencies are
+        known before any of them is published. Errors raised by the getter are ignored - the dependencies are then
+        recorded during the first successful computation.
+
+        :param obj: Object owning the attribute.
+        :param obj_property_name: Name of the attribute.
+        :return: None
+        """
+        descriptor = findClassAttribute(type(obj), obj_property_name)
+        track_dependencies = getattr(descriptor, 'trackDependencies', None)
+        if track_dependencies is not None:
+            track_dependencies(obj)
+
+    @classmethod
+    def _applyPendingRemovals(cls):
+        while cls._pending_removals:
+            key, reference = cls._pending_removals.popleft()
+            entry = cls.dependents.get(key)
+            if entry is not None and entry.reference is reference:
+                del cls.dependents[key]
+
+    @classmethod
+    def _onSourceCollected(cls, key: int, reference):
+        cls._pending_removals.append((key, reference))
+
+
+class ComputationState(threading.local):
+    """
+    Class storing computations of 'ComputationNode' objects in progress in the current thread - as a stack of
+    dictionaries collecting the attributes read by the computations (the last one is the innermost).
+    """
 
-    Values:
+    def __init__(self):
+        self.stack = list()
 
-    - PUB_OBJ - key for storing publisher object reference
-    - OBJ_PROP_NAME - key for storing publisher object's attribute name
+
+DependencyGraph.computations = ComputationState()
+
+
+class PropagationState(threading.local):
+    """
+    Class storing the publications of a single hub being dispatched in the current thread - used to detect binding
+    cycles and to limit the depth of the propagation. The lists are reused (their items above 'depth' are stale), so
+    tracking a publication does not allocate anything.
+
+    - depth - number of publications being dispatched (nested in each other),
+    - publishers - publishers of these publications - from the outermost one,
+    - names - names of the published attributes.
     """
-    PUB_OBJ = 0
-    OBJ_PROP_NAME = 1
 
+    def __init__(self):
+        self.depth = 0
+        self.publishers = list()
+        self.names = list()
 
-class CallbackData(Enum):
+
+class BatchState(threading.local):
     """
-    Enum class to store types of information needed during callbacks execution. Used to build dictionaries containing
-    callbacks' execution parameters. Particular enum values acts as keys for dictionaries.
+    Class storing the state of publication batches of a single hub in the current thread - batches opened in one
+    thread do not affect publications made by other threads.
 
-    Values:
+    - depth - depth of nested batches,
+    - queue - publications queued inside the batches - {(id(publisher), attribute_name): (publisher, attribute_name)}.
+    """
 
-    - DESTINATION_OBJECT - key for subscriber object - whose attribute is to receive new value
-    - DST_PROPERTY_NAME - key for subscriber object's attribute name
-    - SET_METHOD_NAME - key for the name of the setter method used to set new value to the subscriber's attribute
-    - SOURCE_OBJECT -  key for publisher object - whose attribute is to produce new value
-    - SRC_PROPERTY_NAME - key for publisher object's attribute name
-    - GET_METHOD_NAME - key for the name of the getter method used to get new value from the publisher's attribute
+    def __init__(self):
+        self.depth = 0
+        self.queue = dict()
+
+
+class hubmethod:
     """
-    DESTINATION_OBJECT = 0
-    DST_PROPERTY_NAME = 1
-    SET_METHOD_NAME = 2
-    SOURCE_OBJECT = 3
-    SRC_PROPERTY_NAME = 4
-    GET_METHOD_NAME = 5
+    Decorator for 'PropertyChangedEventHandler' methods. Called on a hub instance, the method acts on this instance;
+    called on the class itself - on the default hub ('PropertyChangedEventHandler.default_hub'). Thanks to that the
+    class-level API (e.g. 'PropertyChangedEventHandler.updateAllBindings()') keeps working with the default hub.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        update_wrapper(self, function)
+
+    def __get__(self, obj, objtype=None):
+        return MethodType(self.function, objtype.default_hub if obj is None else obj)
+
+
+def getEventHub(*objects):
+    """
+    Returns the event hub attached to the first of given objects that has one ('event_hub' attribute that is not None)
+    or the default hub if none of them has.
+
+    :param objects: Objects to check, in order of precedence.
+    :return: 'PropertyChangedEventHandler' instance.
+    """
+    for obj in objects:
+        hub = getattr(obj, 'event_hub', None)
+        if hub is not None:
+            return hub
+    return PropertyChangedEventHandler.default_hub
 
 
 class PropertyChangedEventHandler:
@@ -44,53 +1854,378 @@ class PropertyChangedEventHandler:
     - subscriber objects needs to SUBSCRIBE to particular attribute
     - publisher object need to PUBLISH changes of its attribute (by calling proper handler's method) - so
     PropertyChangedEventHandler can spread the new value to every relevant subscribers' attributes.
+
+    All subscriptions are stored in the 'callbacks' registry (see 'SubscriptionRegistry'), which does not keep
+    publishers nor subscribers alive.
+
+    Publications can be grouped into batches (see 'batch', 'beginBatch' and 'commitBatch'). Inside a batch property
+    changed events are only queued - once per (publisher, attribute) pair - and dispatched when the outermost batch
+    is committed. Batches are opened per thread.
+
+    Publishing and subscribing can be done concurrently from many threads - see 'SubscriptionRegistry'.
+
+    Every instance of the class is a separate event hub with its own registry - hubs can be created for a window or
+    a subsystem, attached to its objects (see 'attach' or 'ObservableObject.attachEventHub') and torn down together
+    with 'close' (or by using the hub as a context manager). Methods called on the class itself act on the default hub
+    ('PropertyChangedEventHandler.default_hub'), used by all objects without a hub attached.
     """
-    callbacks = dict()
+    default_hub = None
+    # All living hubs - see 'eventHubs'
+    instances = weakref.WeakSet()
 
-    @classmethod
-    def subscribeToAttribute(cls, callback_data: dict):
+    def __init__(self):
+        PropertyChangedEventHandler.instances.add(self)
+        self.callbacks = SubscriptionRegistry()
+        # Batches are opened per thread - see 'BatchState'
+        self._batch = BatchState()
+        # Deliveries scheduled for asynchronous subscribers
+        self.async_deliveries = AsyncDeliveries()
+        # Objects the hub is attached to - {id(object): object_reference}
+        self._attached_objects = dict()
+        # Collector of dispatch statistics - see 'setInstrumentation'
+        self.instrumentation = None
+        # Recorder of publications - see 'setJournal'
+        self.journal = None
+        # Publications being dispatched in the current thread - see 'setPropagationLimits'
+        self._propagation = PropagationState()
+        self.max_propagation_depth = 64
+        self.max_reentries = 8
+        self.on_cycle = None
+        # Subscriptions to property paths - {id(subscriber): (subscriber_reference, {PropertyPathBinding: None})}, they
+        # are kept alive here
+        self._path_bindings = dict()
+        self._path_bindings_lock = threading.Lock()
+        # (key, reference) pairs of collected subscribers of path bindings - removed by the next operation on the path
+        # bindings, as the garbage collector can run while the lock is held by the thread it runs in
+        self._collected_path_subscribers = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @hubmethod
+    def attach(self, *objects):
+        """
+        Attaches the hub to given objects - they publish their changes and create subscriptions using this hub.
+        Subscriptions are registered in the hub of the publisher, so publishers and their subscribers need to share
+        the hub. Objects of classes defining '__slots__' cannot have a hub attached individually - assign the hub to
+        their class' 'event_hub' attribute instead.
+
+        :param objects: Objects to attach the hub to.
+        :return: None
+        """
+        for obj in objects:
+            obj.event_hub = self
+            self._attached_objects[id(obj)] = makeReference(obj)
+
+    @hubmethod
+    def close(self):
+        """
+        Tears the hub down - removes all its subscriptions and queued publications and detaches it from the objects
+        it has been attached to (they fall back to the default hub).
+
+        :return: None
+        """
+        for reference in self._attached_objects.values():
+            obj = reference()
+            if obj is not None and getattr(obj, '__dict__', {}).get('event_hub') is self:
+                del obj.event_hub
+        self._attached_objects.clear()
+        self._batch = BatchState()
+        self._applyPathRemovals()
+        with self._path_bindings_lock:
+            path_bindings = [path_binding for _, group in self._path_bindings.values() for path_binding in group]
+        for path_binding in path_bindings:
+            path_binding.unsubscribe()
+        self.callbacks.clear()
+
+    @hubmethod
+    def subscribe(self, dst_obj, dst_property_name: str, setter_method_name: str, src_obj, src_property_name: str,
+                  getter_method_name: str, delivery_policy=None, value_cache=None, evaluation_policy=None,
+                  operators=None, template: BindingTemplate = None):
         """
         Creates subscription to given attribute's changes. Since subscription creation, there will be always relevant
-        callback performed when there is a property change event triggered for subscribed attribute.
+        callback performed when there is a property change event triggered for subscribed attribute. Arguments are the
+        same as in 'updateSubscriberObject'.
+
+        :param dst_obj: Subscriber - object containing attribute that needs to be updated.
+        :param dst_property_name: Name of the destination attribute.
+        :param setter_method_name: Name of the setter method.
+        :param src_obj: Publisher - object containing the subscribed attribute.
+        :param src_property_name: Name of the subscribed attribute - or a property path (names of attributes separated
+            with dots, e.g. 'current_model.x') - see 'PropertyPathBinding'.
+        :param getter_method_name: Name of the getter method.
+        :param delivery_policy: Object deciding when the published values are delivered to the subscriber - see
+            'DeliveryPolicies' module. If 'None', values are delivered immediately.
+        :param value_cache: 'CacheMode' value or comparator function - if given, the binding remembers the value it has
+            delivered last and skips the setter call when the same value is published again (see
+            'DeliveredValueCache'). If 'None', every value is passed to the setter.
+        :param evaluation_policy: Object evaluating the getter off the publishing thread - see 'BackgroundEvaluations'
+            module. If 'None', the getter is called during publication.
+        :param operators: Sequence of operators transforming, filtering or aggregating the values before they are
+            delivered - see 'BindingOperators' module. The chain is fused into a single callable here, once.
+        :param template: 'BindingTemplate' built for the same names - shared by subscriptions of the same shape (see
+            'ObservableObjects.BindingDeclaration'), so the methods are not looked up again. Not used for property
+            paths.
+        :return: 'Subscription' handle. If the subscriber already has an identical subscription (the same source
+            object and attribute, destination attribute, getter and setter methods and the same option objects), no
+            new subscription is created and the handle refers to the existing one. For property paths - 'PropertyPathBinding' object.
+        """
+        if src_property_name is not None and '.' in src_property_name:
+            return self._subscribeToPath(dst_obj, dst_property_name, setter_method_name, src_obj, src_property_name,
+                                         getter_method_name, delivery_policy=delivery_policy, value_cache=value_cache,
+                                         evaluation_policy=evaluation_policy, operators=operators)
+
+        # Compile given subscription data into a binding plan - getter and setter methods are resolved here, once
+        binding_plan = BindingPlan(dst_obj, dst_property_name, setter_method_name, src_obj, src_property_name,
+                                   getter_method_name, on_collected=self.callbacks.onSubscriberCollected,
+                                   async_deliveries=self.async_deliveries, delivery_policy=delivery_policy,
+                                   value_cache=value_cache, evaluation_policy=evaluation_policy, operators=operators,
+                                   template=template)
+        # Register observed variable (source of property changed events) if not registered yet and add the plan to the
+        # bindings assigned to the given attribute - atomically
+        binding_plan = self._registerObservedVariable(src_obj, src_property_name, binding_plan)
+        # If the attribute is a computed one, make sure its dependencies are known before any of them changes
+        DependencyGraph.trackDependencies(src_obj, src_property_name)
+        return Subscription(self.callbacks, binding_plan)
+
+    @hubmethod
+    def subscribeToAttribute(self, callback_data: dict, delivery_policy=None, value_cache=None,
+                             evaluation_policy=None, operators=None):
+        """
+        Dictionary-based variant of 'subscribe' - kept for compatibility.
 
         :param callback_data: Dictionary of arguments used to subscribe to particular attribute's changes and
             to perform relevant callback actions. Build e.g. with 'returnSubscriptionCallbackData' method from this
             class. Contains keys that conform 'CallbackData' enum values.
+        :param delivery_policy: Object deciding when the published values are delivered to the subscriber - see
+            'DeliveryPolicies' module. If 'None', values are delivered immediately.
+        :param value_cache: 'CacheMode' value or comparator function - see 'subscribe'.
+        :param evaluation_policy: Object evaluating the getter off the publishing thread - see 'subscribe'.
+        :param operators: Sequence of operators processing the values - see 'subscribe'.
+        :return: 'Subscription' handle - see 'subscribe'.
+        """
+        return self.subscribe(*self.extractSubscriptionCallbackData(callback_data), delivery_policy=delivery_policy,
+                              value_cache=value_cache, evaluation_policy=evaluation_policy, operators=operators)
+
+    @hubmethod
+    def subscribeTwoWay(self, dst_obj, dst_property_name: str, setter_method_name: str, dst_getter_method_name: str,
+                        src_obj, src_property_name: str, src_setter_method_name: str = None,
+                        getter_method_name: str = None, value_cache=None, templates: tuple = None) -> TwoWayBinding:
+        """
+        Creates two-way binding between the subscriber's attribute and the publisher's attribute - see 'TwoWayBinding'.
+        The source -> target direction works like 'subscribe'; the target -> source one is performed by
+        'TwoWayBinding.updateSource'. Echoes (a delivery in one direction triggering the other one) are suppressed.
+
+        :param dst_obj: Subscriber - object containing the bound attribute (e.g. a widget).
+        :param dst_property_name: Name of the destination attribute.
+        :param setter_method_name: Name of the destination attribute's setter method (e.g. 'setText').
+        :param dst_getter_method_name: Name of the destination attribute's getter method (e.g. 'text').
+        :param src_obj: Publisher - object containing the bound attribute (e.g. a view model).
+        :param src_property_name: Name of the source attribute.
+        :param src_setter_method_name: Name of the source attribute's setter method. If 'None', 'setattr' is used - the
+            source is expected to publish the change itself (e.g. in the property's setter).
+        :param getter_method_name: Name of the source attribute's getter method.
+        :param value_cache: 'CacheMode' value or comparator function of the source -> target direction - see
+            'subscribe'.
+        :param templates: Tuple of 'BindingTemplate' objects of the source -> target and target -> source directions
+            - see 'subscribe'. If 'None', the methods are looked up for this binding.
+        :return: 'TwoWayBinding' handle.
+        """
+        forward_template, backward_template = (None, None) if templates is None else templates
+        guard = ReentrancyGuard()
+        binding_plan = BindingPlan(dst_obj, dst_property_name, setter_method_name, src_obj, src_property_name,
+                                   getter_method_name, on_collected=self.callbacks.onSubscriberCollected,
+                                   async_deliveries=self.async_deliveries, value_cache=value_cache, guard=guard,
+                                   template=forward_template)
+        binding_plan = self._registerObservedVariable(src_obj, src_property_name, binding_plan)
+        DependencyGraph.trackDependencies(src_obj, src_property_name)
+        # The target -> source direction is not registered anywhere - it is executed by the handle on demand
+        backward_plan = BindingPlan(src_obj, src_property_name, src_setter_method_name, dst_obj, dst_property_name,
+                                    dst_getter_method_name, guard=guard, template=backward_template)
+        return TwoWayBinding(self, guard, Subscription(self.callbacks, binding_plan), backward_plan)
+
+    @hubmethod
+    def _subscribeToPath(self, dst_obj, dst_property_name: str, setter_method_name: str, src_obj, path: str,
+                         getter_method_name: str, **options) -> PropertyPathBinding:
+        """
+        Creates subscription to a property path - see 'subscribe' and 'PropertyPathBinding'.
+
+        :return: 'PropertyPathBinding' object.
+        """
+        if dst_obj is None or src_obj is None:
+            raise ValueError('Destination and source objects cannot be None!')
+        self._applyPathRemovals()
+        path_binding = PropertyPathBinding(self, dst_obj, dst_property_name, setter_method_name, src_obj, path,
+                                           getter_method_name, options)
+        with self._path_bindings_lock:
+            entry = self._path_bindings.get(id(dst_obj))
+            if entry is None:
+                # Path bindings are dropped together with their subscriber
+                reference = makeReference(dst_obj, partial(self._onPathSubscriberCollected, id(dst_obj)))
+                entry = self._path_bindings[id(dst_obj)] = (reference, dict())
+            entry[1][path_binding] = None
+        return path_binding
+
+    @hubmethod
+    def forgetPathBinding(self, path_binding: PropertyPathBinding):
+        """
+        Stops keeping given path binding alive - called when it is unsubscribed.
+
+        :param path_binding: 'PropertyPathBinding' object.
         :return: None
         """
-        dst_obj, dst_attr, setter_method_ame, src_obj, src_attr, getter_method_name = \
-            cls.extractSubscriptionCallbackData(callback_data)
+        with self._path_bindings_lock:
+            entry = self._path_bindings.get(path_binding.subscriber_id)
+            if entry is not None:
+                entry[1].pop(path_binding, None)
+                if not entry[1]:
+                    del self._path_bindings[path_binding.subscriber_id]
 
-        # Register observed variable (source of property changed events) if not registered yet
-        cls._registerObservedVariable(src_obj, src_attr)
-        # Add given callback data to the callback's list assigned to the given attribute
-        cls.callbacks[src_obj][src_attr].append(callback_data)
+    @hubmethod
+    def _onPathSubscriberCollected(self, key: int, reference):
+        # Called by the garbage collector - possibly in a thread holding the lock, so nothing is done here
+        self._collected_path_subscribers.append((key, reference))
 
-    @classmethod
-    def _registerObservedVariable(cls, pub_obj, obj_property_name: str):
+    @hubmethod
+    def _applyPathRemovals(self):
+        # Unsubscribes the path bindings of collected subscribers - the paths of a collected subscriber do not deliver
+        # anything in the meantime, they only keep their links subscribed
+        while self._collected_path_subscribers:
+            try:
+                key, reference = self._collected_path_subscribers.popleft()
+            except IndexError:
+                return
+            with self._path_bindings_lock:
+                entry = self._path_bindings.get(key)
+                # The entry may belong to a new object with the same id already
+                if entry is None or entry[0] is not reference:
+                    continue
+                del self._path_bindings[key]
+            for path_binding in list(entry[1]):
+                path_binding.unsubscribe()
+
+    @hubmethod
+    def unsubscribeAll(self, dst_obj):
         """
-        Method to register new attribute to let other objects to subscribe to its changes. Creates new entry in
-        'PropertyChangedEventHandler.callbacks' dictionary being a central database of whole event mechanism.
+        Removes all subscriptions of given subscriber registered in the hub - also the subscriptions to property paths.
+
+        :param dst_obj: Subscriber object.
+        :return: None
+        """
+        self._applyPathRemovals()
+        with self._path_bindings_lock:
+            entry = self._path_bindings.pop(id(dst_obj), None)
+        if entry is not None:
+            for path_binding in list(entry[1]):
+                path_binding.unsubscribe()
+        self.callbacks.discardSubscriber(dst_obj)
 
-        The 'callbacks' dictionary has the following structure:
+    @staticmethod
+    def eventHubs() -> list:
+        """
+        :return: List of all living hubs - the default one and the ones created explicitly.
+        """
+        return list(PropertyChangedEventHandler.instances)
 
-        {
-            publisher_object_reference_1 :  {
-                publisher_object_attribute_name_1 : [ <list of callbacks data dictionaries > ],
+    @hubmethod
+    def refreshBindings(self, dst_obj=None):
+        """
+        Re-resolves getter and setter methods of compiled binding plans. Needs to be called when an attribute object
+        that owns the setter method (e.g. QLabel stored in subscriber's attribute) has been replaced with another one.
 
-                publisher_object_attribute_name_2 : [ <list of callbacks data dictionaries > ],
+        :param dst_obj: Subscriber object whose binding plans are to be refreshed. If 'None', all plans are refreshed.
+        :return: None
+        """
+        for pub_obj, properties in self.callbacks.items():
+            for binding_plans in properties.values():
+                for binding_plan in binding_plans:
+                    if dst_obj is None or binding_plan.destination_object is dst_obj:
+                        binding_plan.resolve()
 
-                ...
-            },
+    @hubmethod
+    def setInstrumentation(self, instrumentation=None):
+        """
+        Enables collecting statistics of dispatched publications (per-binding call counts, getter and setter times,
+        fan-out sizes, latency histograms, slow subscribers) - see 'Instrumentation.DispatchInstrumentation'. When
+        disabled, dispatching costs a single attribute check more.
 
-            publisher_object_reference_2 : { ... },
+        :param instrumentation: 'DispatchInstrumentation' object. If 'None', instrumentation is disabled.
+        :return: None
+        """
+        self.instrumentation = instrumentation
 
-            ...
-        }
+    @hubmethod
+    def setPropagationLimits(self, max_depth: int = 64, max_reentries: int = 8, on_cycle=None):
+        """
+        Configures detection of binding cycles. An attribute can be published again while its own publication is being
+        dispatched in the same thread - e.g. by a subscriber correcting (clamping) the value - as long as the updates
+        converge. A feedback loop (setter, publish, setter, publish...) re-entering the same attribute more than
+        'max_reentries' times is a cycle, and so is a chain of nested publications deeper than 'max_depth'.
+
+        :param max_depth: Maximal number of nested publications.
+        :param max_reentries: Maximal number of publications of an attribute nested in its own publication. With 0,
+            every re-entrant publication is a cycle.
+        :param on_cycle: Function accepting 'BindingCycleError' (with the offending chain) - the publication that
+            closes the cycle is then dropped. If 'None', the error is raised.
+        :return: None
+        """
+        self.max_propagation_depth = max_depth
+        self.max_reentries = max_reentries
+        self.on_cycle = on_cycle
+
+    @hubmethod
+    def setJournal(self, journal=None):
+        """
+        Enables recording of publications (with values of the published attributes) - see
+        'ChangeJournals.ChangeJournal'. When disabled, publishing costs a single attribute check more.
+
+        :param journal: 'ChangeJournal' object. If 'None', recording is disabled.
+        :return: None
+        """
+        self.journal = journal
+
+    @hubmethod
+    def valueCacheStatistics(self) -> dict:
+        """
+        Sums up the counters of bindings with value caches - see 'DeliveredValueCache'.
+
+        :return: Dictionary with keys: 'bindings' (number of bindings with a cache), 'delivered' and 'skipped' (numbers
+            of values passed to the setters and skipped as unchanged).
+        """
+        bindings_count = delivered_count = skipped_count = 0
+        for _, properties in self.callbacks.items():
+            for binding_plans in properties.values():
+                for binding_plan in binding_plans:
+                    if binding_plan.value_cache is not None:
+                        bindings_count += 1
+                        delivered_count += binding_plan.value_cache.delivered_count
+                        skipped_count += binding_plan.value_cache.skipped_count
+        return {'bindings': bindings_count, 'delivered': delivered_count, 'skipped': skipped_count}
+
+    @hubmethod
+    def registryMemoryUsage(self) -> dict:
+        """
+        Measures the memory held by the subscriptions registry - see 'SubscriptionRegistry.memoryUsage'.
+
+        :return: Dictionary with keys: 'publishers', 'properties', 'bindings' and 'bytes'.
+        """
+        self._applyPathRemovals()
+        return self.callbacks.memoryUsage()
+
+    @hubmethod
+    def _registerObservedVariable(self, pub_obj, obj_property_name: str,
+                                  binding_plan: BindingPlan = None) -> BindingPlan:
+        """
+        Method to register new attribute to let other objects to subscribe to its changes. Creates new entry in
+        'PropertyChangedEventHandler.callbacks' registry being a central database of whole event mechanism.
 
         :param pub_obj: Reference to the object containing attribute that the property changed event is triggered for.
         :param obj_property_name: Name of the changing attribute.
-        :return: None
+        :param binding_plan: Binding plan to be added to the attribute's bindings (in the same registry operation).
+        :return: The plan registered - see 'SubscriptionRegistry.addBinding'.
         """
 
         if pub_obj is None:
@@ -98,80 +2233,553 @@ class PropertyChangedEventHandler:
         elif obj_property_name is None:
             raise ValueError('Cannot register property without name in the property changed event handler!')
 
-        if pub_obj not in cls.callbacks:
-            cls.callbacks[pub_obj] = {obj_property_name: list()}
-        elif obj_property_name not in cls.callbacks[pub_obj]:
-            cls.callbacks[pub_obj][obj_property_name] = list()
+        if binding_plan is None:
+            self.callbacks.register(pub_obj, obj_property_name)
+            return None
+        return self.callbacks.addBinding(pub_obj, obj_property_name, binding_plan)
 
-    @classmethod
-    def _unregisterObservedVariable(cls, pub_obj, obj_property_name: str):
+    @hubmethod
+    def _unregisterObservedVariable(self, pub_obj, obj_property_name: str):
         """
         Method to unregister given attribute from PropertyChangedEventHandler. After calling this method, triggering
         property changed event for the given attribute will not start any callback action.
 
-        Deletes entry in the 'PropertyChangedEventHandler.callbacks' dictionary, related to the specified attribute .
+        Deletes entry in the 'PropertyChangedEventHandler.callbacks' registry, related to the specified attribute .
 
         :param pub_obj: Reference to the object containing attribute that the property changed event is triggered for.
         :param obj_property_name: Name of the changing attribute.
         :return: None
         """
+        self.callbacks.unregister(pub_obj, obj_property_name)
+
+    @hubmethod
+    def publish(self, pub_obj, obj_property_name: str):
+        """
+        Method to trigger the property changed event for particular registered attribute
+        - starting the process of spreading given attribute's new value to every subscriber. No temporary containers
+        are built unless the attribute has computed attributes depending on it or a batch is open.
+
+        :param pub_obj: Reference to the object containing attribute that the property changed event is triggered for.
+        :param obj_property_name: Name of the changed attribute.
+        :return: None
+        """
+        if self.journal is not None:
+            self.journal.record(pub_obj, obj_property_name)
 
-        if pub_obj in cls.callbacks and obj_property_name in cls.callbacks[pub_obj]:
-            del cls.callbacks[pub_obj][obj_property_name]
+        # Inside a batch only queue the publication - repeated publications of the same attribute are coalesced.
+        # Computed attributes depending on it are invalidated immediately, so they are never read outdated.
+        if self._batch.depth:
+            self._batch.queue[(id(pub_obj), obj_property_name)] = (pub_obj, obj_property_name)
+            if DependencyGraph.dependents:
+                DependencyGraph.invalidate(((pub_obj, obj_property_name),))
+            return
 
-        if pub_obj in cls.callbacks and not any(cls.callbacks[pub_obj]):
-            del cls.callbacks[pub_obj]
+        # Publications nested in the dispatch of this one are tracked - feedback loops are detected here. Outermost
+        # publications (the common case) only store the publisher in the reused lists.
+        propagation = self._propagation
+        depth = propagation.depth
+        publishers, names = propagation.publishers, propagation.names
+        if depth:
+            if depth >= self.max_propagation_depth:
+                self._reportCycle(pub_obj, obj_property_name, False)
+                return
+            reentries = 0
+            for index in range(depth):
+                if publishers[index] is pub_obj and names[index] == obj_property_name:
+                    reentries += 1
+            if reentries > self.max_reentries:
+                self._reportCycle(pub_obj, obj_property_name, True)
+                return
+        if depth == len(publishers):
+            publishers.append(pub_obj)
+            names.append(obj_property_name)
+        else:
+            publishers[depth] = pub_obj
+            names[depth] = obj_property_name
+        propagation.depth = depth + 1
+        try:
+            if DependencyGraph.dependents and DependencyGraph.hasDependents(pub_obj, obj_property_name):
+                self._dispatchPublications(((pub_obj, obj_property_name),))
+            else:
+                binding_plans = self.callbacks.getBindings(pub_obj, obj_property_name)
+                if binding_plans:
+                    self._updateBindingsOnProperty(pub_obj, obj_property_name, binding_plans)
+        finally:
+            propagation.depth = depth
+            # The publisher is not kept alive by the stale item
+            publishers[depth] = None
 
-    @classmethod
-    def triggerBindingUpdate(cls, prop_changed_event_pub_args: dict):
+    @hubmethod
+    def _reportCycle(self, pub_obj, obj_property_name: str, reentrant: bool):
         """
-        Method to trigger the property changed event for particular registered attribute
-        - starting the process of spreading given attribute's new value to every subscriber.
+        Raises 'BindingCycleError' for the publication closing a cycle (or exceeding the depth limit) - or passes it to
+        the hub's 'on_cycle' handler.
+
+        :param pub_obj: Publisher.
+        :param obj_property_name: Name of the published attribute.
+        :param reentrant: True if the attribute has been re-entered too many times, False if the depth limit has been
+            exceeded.
+        :return: None
+        """
+        propagation = self._propagation
+        chain = [type(obj).__name__ + '.' + name
+                 for obj, name in zip(propagation.publishers[:propagation.depth], propagation.names)]
+        chain.append(type(pub_obj).__name__ + '.' + obj_property_name)
+        if reentrant:
+            error = BindingCycleError('Binding cycle detected (more than %d re-entries)' % self.max_reentries, chain)
+        else:
+            error = BindingCycleError('Propagation depth limit (%d) exceeded' % self.max_propagation_depth, chain)
+        if self.on_cycle is None:
+            raise error
+        self.on_cycle(error)
+
+    @hubmethod
+    def triggerBindingUpdate(self, prop_changed_event_pub_args: dict):
+        """
+        Dictionary-based variant of 'publish' - kept for compatibility.
+
+        :param prop_changed_event_pub_args: Dictionary of arguments. Build e.g. with 'returnPropChangedEventPubArgs'
+            method from this class. Contains keys that conform 'PublicationArguments' enum values.
+        :return: None
+        """
+        self.publish(*self.extractPropChangedEventPubArgs(prop_changed_event_pub_args))
+
+    @hubmethod
+    async def triggerBindingUpdateAsync(self, prop_changed_event_pub_args: dict, max_concurrency: int = None):
+        """
+        Dictionary-based variant of 'publishAsync' - kept for compatibility.
 
         :param prop_changed_event_pub_args: Dictionary of arguments. Build e.g. with 'returnPropChangedEventPubArgs'
             method from this class. Contains keys that conform 'PublicationArguments' enum values.
+        :param max_concurrency: Maximal number of asynchronous deliveries running at the same time. If 'None', there is
+            no limit.
         :return: None
         """
-        pub_obj, obj_property_name = cls.extractPropChangedEventPubArgs(prop_changed_event_pub_args)
+        pub_obj, obj_property_name = self.extractPropChangedEventPubArgs(prop_changed_event_pub_args)
+        await self.publishAsync(pub_obj, obj_property_name, max_concurrency)
 
-        if pub_obj in cls.callbacks and obj_property_name in cls.callbacks[pub_obj]:
-            cls._updateBindingsOnProperty(pub_obj, obj_property_name)
+    @hubmethod
+    async def publishAsync(self, pub_obj, obj_property_name: str, max_concurrency: int = None):
+        """
+        Awaitable variant of 'publish'. Synchronous subscribers are updated immediately, deliveries to asynchronous
+        subscribers run concurrently on the current event loop - at most 'max_concurrency' at the same time. Returns
+        when all the deliveries (also the ones to subscribers of dependent computed attributes) are complete. Inside a
+        batch the publication is only queued - as in the synchronous variant.
 
-    @classmethod
-    def updateAllBindings(cls):
+        :param pub_obj: Reference to the object containing attribute that the property changed event is triggered for.
+        :param obj_property_name: Name of the changed attribute.
+        :param max_concurrency: Maximal number of asynchronous deliveries running at the same time. If 'None', there is
+            no limit. Not applied when the hub's instrumentation is enabled - the deliveries are scheduled as in
+            'publish' then.
+        :return: None
+        """
+        if self._batch.depth:
+            self.publish(pub_obj, obj_property_name)
+            return
+        if self.journal is not None:
+            self.journal.record(pub_obj, obj_property_name)
+
+        publications = ((pub_obj, obj_property_name),)
+        affected_nodes = DependencyGraph.invalidate(publications) if DependencyGraph.dependents else ()
+
+        binding_plans = self.callbacks.getBindings(pub_obj, obj_property_name)
+        if binding_plans and self.instrumentation is not None:
+            # Measured dispatch - asynchronous setters are scheduled (their scheduling is measured) and awaited here
+            self._updateBindingsOnPropertyInstrumented(pub_obj, obj_property_name, binding_plans)
+            await self.async_deliveries.wait()
+        elif binding_plans:
+            await self._updateBindingsOnPropertyAsync(pub_obj, obj_property_name, binding_plans, max_concurrency)
+
+        if affected_nodes:
+            self._propagateToComputedAttributes(publications, affected_nodes)
+            await self.async_deliveries.wait()
+
+    @hubmethod
+    async def waitForAsyncDeliveries(self):
+        """
+        Awaits deliveries to asynchronous subscribers scheduled by the hub - see 'AsyncDeliveries.wait'.
+
+        :return: None
+        """
+        await self.async_deliveries.wait()
+
+    @hubmethod
+    async def _updateBindingsOnPropertyAsync(self, pub_obj, obj_property_name: str, binding_plans: PropertyBindings,
+                                             max_concurrency: int = None):
+        """
+        Asynchronous variant of '_updateBindingsOnProperty' - awaits the deliveries to asynchronous subscribers.
+
+        :param pub_obj: Reference to parent object of the registered attribute.
+        :param obj_property_name: Name of the registered attribute.
+        :param binding_plans: Bindings of the published attribute.
+        :param max_concurrency: Maximal number of asynchronous deliveries running at the same time.
+        :return: None
+        """
+        deliveries = list()
+        # (value_cache, value) of every delivery - values are cached only when their setter has succeeded
+        cached_values = list()
+        binding_plans.version += 1
+        version = binding_plans.version
+        deferred_scheduled = False
+        try:
+            for binding_plans_group in binding_plans.snapshot():
+                new_value = binding_plans_group[0].getter()
+                for binding_plan in binding_plans_group:
+                    # Deliveries postponed by a delivery policy, a background evaluation or operators (and guarded
+                    # ones) cannot be awaited
+                    if binding_plan.async_setter is None or binding_plan.delivery is not None or \
+                            binding_plan.evaluation is not None or binding_plan.pipeline is not None or \
+                            binding_plan.guard is not None:
+                        if binding_plan.deferred:
+                            binding_plan.scheduled_version = version
+                            deferred_scheduled = True
+                        binding_plan.setter(new_value)
+                        continue
+                    value_cache = binding_plan.value_cache
+                    if value_cache is not None and value_cache.matches(new_value):
+                        value_cache.skipped_count += 1
+                        continue
+                    deliveries.append(binding_plan.async_setter(new_value))
+                    cached_values.append((value_cache, new_value) if value_cache is not None else None)
+
+        except Exception as E:
+            # Coroutines that will never be awaited
+            for delivery in deliveries:
+                delivery.close()
+            # Subscribers that have not received the value are found by the next resynchronization
+            self.callbacks.markDirty(pub_obj, obj_property_name)
+            if isinstance(E, BindingCycleError):
+                raise
+            raise RuntimeError('Cannot complete variable -> gui binding due to some error! ' + str(E)) from E
+
+        # Asynchronous deliveries are scheduled - the values are considered delivered (deferred plans stamp the version
+        # when their deliveries take place)
+        for binding_plan in binding_plans:
+            if not binding_plan.deferred:
+                binding_plan.delivered_version = version
+        if deferred_scheduled:
+            self.callbacks.markDirty(pub_obj, obj_property_name)
+
+        deliveries = [delivery if cached_value is None else self._deliverAndCache(delivery, *cached_value)
+                      for delivery, cached_value in zip(deliveries, cached_values)]
+        if max_concurrency:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def limitConcurrency(delivery):
+                async with semaphore:
+                    return await delivery
+
+            deliveries = [limitConcurrency(delivery) for delivery in deliveries]
+
+        try:
+            await asyncio.gather(*deliveries)
+        except Exception as E:
+            raise RuntimeError('Cannot complete asynchronous binding due to some error! ' + str(E)) from E
+
+    @staticmethod
+    async def _deliverAndCache(delivery, value_cache: DeliveredValueCache, new_value):
+        # A value whose setter has failed is not cached - so publishing it again retries the delivery
+        await delivery
+        value_cache.store(new_value)
+
+    @hubmethod
+    def beginBatch(self):
+        """
+        Opens a batch of publications. Until the outermost batch is committed, property changed events are queued
+        instead of being dispatched. Batches can be nested - every 'beginBatch' call needs a matching 'commitBatch'.
+
+        :return: None
+        """
+        self._batch.depth += 1
+
+    @hubmethod
+    def isBatching(self) -> bool:
+        """
+        :return: True if a batch of publications is open in the current thread - see 'beginBatch'.
+        """
+        return self._batch.depth > 0
+
+    @hubmethod
+    def commitBatch(self):
+        """
+        Closes a batch of publications opened with 'beginBatch'. When the outermost batch is closed, every queued
+        (publisher, attribute) pair is dispatched once - in the order of first publication.
+
+        :return: None
+        """
+        if not self._batch.depth:
+            raise RuntimeError('Cannot commit batch of publications - no batch has been started!')
+
+        self._batch.depth -= 1
+        if self._batch.depth:
+            return
+
+        batch_state = self._batch
+        queued_publications, batch_state.queue = batch_state.queue, dict()
+        # Computed attributes have been invalidated during the batch already
+        self._dispatchPublications(tuple(queued_publications.values()), invalidate=False)
+
+    @hubmethod
+    def _dispatchPublications(self, publications: tuple, invalidate: bool = True):
+        """
+        Dispatches property changed events for given attributes and propagates the changes to computed attributes
+        depending on them - see 'DependencyGraph'. Computed attributes are processed in topological order, so each of
+        them is recomputed at most once and its subscribers never receive values computed from outdated inputs.
+
+        :param publications: Tuple of (publisher, attribute_name) tuples.
+        :param invalidate: If False, computed attributes are not invalidated again - see 'DependencyGraph.invalidate'.
+        :return: None
+        """
+        affected_nodes = DependencyGraph.invalidate(publications, invalidate) if DependencyGraph.dependents else ()
+
+        for pub_obj, obj_property_name in publications:
+            if self.callbacks.getBindings(pub_obj, obj_property_name):
+                self._updateBindingsOnProperty(pub_obj, obj_property_name)
+
+        if affected_nodes:
+            self._propagateToComputedAttributes(publications, affected_nodes)
+
+    @hubmethod
+    def _propagateToComputedAttributes(self, publications: tuple, affected_nodes: list):
+        """
+        Recomputes computed attributes affected by given publications and dispatches property changed events for those
+        whose values changed - see '_dispatchPublications'.
+
+        :param publications: Tuple of (publisher, attribute_name) tuples.
+        :param affected_nodes: Nodes returned by 'DependencyGraph.invalidate' for the publications.
+        :return: None
+        """
+        changed_attributes = {(id(pub_obj), obj_property_name) for pub_obj, obj_property_name in publications}
+        for node, was_dirty in affected_nodes:
+            owner = node.owner_reference()
+            if owner is None:
+                continue
+
+            # None of the node's sources really changed - the memoized value is still valid
+            if not any(source in changed_attributes for source in node.sources):
+                if not was_dirty and node.dirty:
+                    node.dirty = False
+                continue
+
+            # The computed attribute's owner can have another hub attached
+            owner_hub = getEventHub(owner)
+            has_bindings = owner_hub.callbacks.getBindings(owner, node.name)
+            if has_bindings or DependencyGraph.hasDependents(owner, node.name):
+                node.getValue()
+                if node.changed:
+                    node.changed = False
+                    changed_attributes.add((id(owner), node.name))
+                    if has_bindings:
+                        owner_hub._updateBindingsOnProperty(owner, node.name)
+            else:
+                # Nobody observes the attribute - leave it invalidated, it will be computed when read
+                changed_attributes.add((id(owner), node.name))
+
+    @hubmethod
+    @contextmanager
+    def batch(self):
+        """
+        Context manager wrapping the code block in 'beginBatch'/'commitBatch' calls, e.g.:
+
+        with PropertyChangedEventHandler.batch():
+            view_model.model_x = 'x'
+            view_model.model_y = 'y'
+
+        Queued publications are dispatched also when the block raises an exception - the attributes have been changed
+        anyway.
+
+        :return: None
+        """
+        self.beginBatch()
+        try:
+            yield
+        finally:
+            self.commitBatch()
+
+    @hubmethod
+    def updateAllBindings(self, changed_only: bool = False):
         """
         Method to send current values of all registered attributes to all relevant subscribers. Can be used e.g.
         at the end of the main window's constructor in PyQt5 GUI application.
 
+        :param changed_only: If True, only subscribers that have not received the current version of the source
+            attribute are updated - e.g. the ones subscribed since the last publication or the ones whose source
+            attribute was changed with 'markChanged'. Only the attributes from the registry's dirty set are
+            visited, so resynchronization cost does not depend on the total number of bindings.
+            If False, every registered attribute is sent to every subscriber.
         :return: None
         """
-        for pub_obj in cls.callbacks:
-            for property_name in cls.callbacks[pub_obj]:
-                cls._updateBindingsOnProperty(pub_obj, property_name)
+        if not changed_only:
+            for pub_obj, properties in self.callbacks.items():
+                for property_name in list(properties):
+                    self._updateBindingsOnProperty(pub_obj, property_name)
+            # Every binding has received the current value
+            self.callbacks.takeDirty()
+            return
 
-    @classmethod
-    def _updateBindingsOnProperty(cls, pub_obj, obj_property_name: str):
+        dirty_attributes = self.callbacks.takeDirty()
+        instrumented = self.instrumentation is not None
+        for index, (pub_obj, obj_property_name, binding_plans) in enumerate(dirty_attributes):
+            try:
+                if instrumented:
+                    self._updateBindingsOnPropertyInstrumented(pub_obj, obj_property_name, binding_plans,
+                                                               changed_only=True)
+                    continue
+                version = binding_plans.version
+                deferred_scheduled = False
+                for binding_plans_group in binding_plans.outdated():
+                    new_value = binding_plans_group[0].getter()
+                    for binding_plan in binding_plans_group:
+                        if binding_plan.deferred:
+                            binding_plan.scheduled_version = version
+                            binding_plan.setter(new_value)
+                            deferred_scheduled = True
+                        else:
+                            binding_plan.setter(new_value)
+                            binding_plan.delivered_version = version
+                if deferred_scheduled:
+                    # Checked again by the next resynchronization - until the deferred deliveries take place
+                    self.callbacks.markDirty(pub_obj, obj_property_name)
+            except Exception as E:
+                # Attributes not synchronized yet stay in the dirty set
+                for pub_obj_left, obj_property_name_left, _ in dirty_attributes[index:]:
+                    self.callbacks.markDirty(pub_obj_left, obj_property_name_left)
+                if isinstance(E, BindingCycleError) or instrumented:
+                    # Errors of the instrumented dispatch are already described
+                    raise
+                raise RuntimeError('Cannot complete variable -> gui binding due to some error! ' + str(E)) from E
+
+    @hubmethod
+    def markPropertyChanged(self, prop_changed_event_pub_args: dict):
+        """
+        Dictionary-based variant of 'markChanged' - kept for consistency with 'triggerBindingUpdate'.
+
+        :param prop_changed_event_pub_args: Dictionary of arguments. Build e.g. with 'returnPropChangedEventPubArgs'
+            method from this class. Contains keys that conform 'PublicationArguments' enum values.
+        :return: None
+        """
+        self.markChanged(*self.extractPropChangedEventPubArgs(prop_changed_event_pub_args))
+
+    @hubmethod
+    def markChanged(self, pub_obj, obj_property_name: str):
+        """
+        Records that given attribute has changed, without notifying the subscribers - e.g. during bulk reloads of
+        data. Computed attributes depending on it are invalidated and recorded as changed as well. The subscribers are
+        updated by the next 'updateAllBindings(changed_only=True)' call (or by the next publication of the attribute).
+
+        :param pub_obj: Reference to the object containing the changed attribute.
+        :param obj_property_name: Name of the changed attribute.
+        :return: None
+        """
+        changed_attributes = [(self, pub_obj, obj_property_name)]
+        if DependencyGraph.dependents:
+            for node, _ in DependencyGraph.invalidate(((pub_obj, obj_property_name),)):
+                owner = node.owner_reference()
+                if owner is not None:
+                    changed_attributes.append((getEventHub(owner), owner, node.name))
+
+        for event_hub, changed_obj, changed_property_name in changed_attributes:
+            binding_plans = event_hub.callbacks.getBindings(changed_obj, changed_property_name)
+            if binding_plans:
+                binding_plans.version += 1
+                event_hub.callbacks.markDirty(changed_obj, changed_property_name)
+
+    @hubmethod
+    def _updateBindingsOnProperty(self, pub_obj, obj_property_name: str, binding_plans: PropertyBindings = None):
         """
         Method that performs relevant callback operations to transfer new value of registered attribute, which triggered
         property change event, to all attribute's subscribers.
 
         :param pub_obj: Reference to parent object of the registered attribute.
         :param obj_property_name: Name of the registered attribute.
+        :param binding_plans: Bindings of the attribute, if already looked up.
         :return: None
         """
+        if binding_plans is None:
+            binding_plans = self.callbacks.getBindings(pub_obj, obj_property_name)
+        if not binding_plans:
+            return
+        if self.instrumentation is not None:
+            self._updateBindingsOnPropertyInstrumented(pub_obj, obj_property_name, binding_plans)
+            return
 
-        for callback_data in cls.callbacks[pub_obj][obj_property_name]:
-            # For every subscriber in a list, extract data necessary to perform callback operation.
-            # Initially, data comes in the form of dictionary, whose keys conform the values of 'CallbackData' enum.
-            dst_obj, dst_attr, setter_method_name, src_obj, src_attr, getter_method_name = \
-                cls.extractSubscriptionCallbackData(callback_data)
+        # Plans are grouped by the getter method - the source value is evaluated once per group and shared by all the
+        # group's subscribers. The snapshot is immutable, so subscribers can be collected (and their plans removed)
+        # during the callbacks.
+        binding_plans.version += 1
+        version = binding_plans.version
+        deferred_scheduled = False
+        try:
+            for binding_plans_group in binding_plans.snapshot():
+                new_value = binding_plans_group[0].getter()
+                for binding_plan in binding_plans_group:
+                    if binding_plan.deferred:
+                        binding_plan.scheduled_version = version
+                        binding_plan.setter(new_value)
+                        deferred_scheduled = True
+                    else:
+                        binding_plan.setter(new_value)
+                        binding_plan.delivered_version = version
+        except Exception as E:
+            # Subscribers that have not received the value are found by the next resynchronization
+            self.callbacks.markDirty(pub_obj, obj_property_name)
+            if isinstance(E, BindingCycleError):
+                raise
+            raise RuntimeError('Cannot complete variable -> gui binding due to some error! ' + str(E)) from E
+        if deferred_scheduled:
+            # Deferred deliveries that fail (or are dropped) are found by the next resynchronization as well
+            self.callbacks.markDirty(pub_obj, obj_property_name)
 
-            # Try to call the function which performs the exact tasks needed to transfer the value to subscriber
-            try:
-                cls.updateSubscriberObject(dst_obj, dst_attr, setter_method_name,
-                                           src_obj, src_attr, getter_method_name)
-            except Exception as E:
-                raise ('Cannot complete variable -> gui binding due to some error!' + str(E))
+    @hubmethod
+    def _updateBindingsOnPropertyInstrumented(self, pub_obj, obj_property_name: str, binding_plans: PropertyBindings,
+                                              changed_only: bool = False):
+        """
+        Variant of '_updateBindingsOnProperty' measuring getters and setters - used when the hub's instrumentation is
+        enabled, so the regular dispatch does not pay for the measurements.
+
+        :param pub_obj: Reference to parent object of the registered attribute.
+        :param obj_property_name: Name of the registered attribute.
+        :param binding_plans: Bindings of the attribute.
+        :param changed_only: If True, the current version is delivered only to the bindings that have not received it
+            - see 'updateAllBindings'. If False, a new version is delivered to all the bindings.
+        :return: None
+        """
+        instrumentation, clock = self.instrumentation, time.perf_counter
+        publication_start = clock()
+        total_getter_seconds, fan_out = 0.0, 0
+
+        if not changed_only:
+            binding_plans.version += 1
+        version = binding_plans.version
+        deferred_scheduled = False
+        try:
+            for binding_plans_group in binding_plans.outdated() if changed_only else binding_plans.snapshot():
+                getter_start = clock()
+                new_value = binding_plans_group[0].getter()
+                getter_seconds = clock() - getter_start
+                total_getter_seconds += getter_seconds
+                for binding_plan in binding_plans_group:
+                    if binding_plan.deferred:
+                        binding_plan.scheduled_version = version
+                        deferred_scheduled = True
+                    setter_start = clock()
+                    binding_plan.setter(new_value)
+                    instrumentation.recordDelivery(binding_plan, getter_seconds, clock() - setter_start)
+                    if not binding_plan.deferred:
+                        binding_plan.delivered_version = version
+                    fan_out += 1
+        except Exception as E:
+            self.callbacks.markDirty(pub_obj, obj_property_name)
+            if isinstance(E, BindingCycleError):
+                raise
+            raise RuntimeError('Cannot complete variable -> gui binding due to some error! ' + str(E)) from E
+        if deferred_scheduled:
+            self.callbacks.markDirty(pub_obj, obj_property_name)
+
+        if fan_out or not changed_only:
+            # Resynchronization not delivering anything is not a publication
+            instrumentation.recordPublication(pub_obj, obj_property_name, fan_out, total_getter_seconds,
+                                              clock() - publication_start)
 
     @staticmethod
     def updateSubscriberObject(dst_obj=None, dst_property_name: str = None, setter_method_name: str = None,
@@ -195,45 +2803,8 @@ class PropertyChangedEventHandler:
         :return: None
         """
 
-        # If destination or source objects are None, return exception error
-        if dst_obj is None or src_obj is None:
-            raise ValueError('Destination and source objects cannot be None!')
-        # If source property name is none, return error - there cannot be registered a variable without name
-        if src_property_name is None:
-            raise ValueError("Source property's name cannot be None")
-
-        # STAGE 1 - Get the new value from source
-
-        # When getter method is a 'getattr'
-        if getter_method_name is None:
-            new_value = getattr(src_obj, src_property_name)
-        # When getter method is custom
-        else:
-            # STAGE 1.1 - get the getter method - from source object or object's attribute
-            src_property = getattr(src_obj, src_property_name)
-            if getter_method_name in src_property.__dir__():
-                getter_method_owner = src_property
-            else:
-                getter_method_owner = src_obj
-
-            getter_method = getattr(getter_method_owner, getter_method_name)
-
-            # STAGE 1.2 - get the value to be passed to the destination
-            new_value = getter_method()
-
-        # STAGE 2 - pass the new value to the destination
-
-        # When setter method is a 'setattr'
-        if setter_method_name is None:
-            setattr(dst_obj, dst_property_name, new_value)
-        # When setter method is custom
-        else:
-            # STAGE 2.1 - get the setter method - from source object or object's attribute
-            setter_method_owner = dst_obj if dst_property_name is None else getattr(dst_obj, dst_property_name)
-            setter_method = getattr(setter_method_owner, setter_method_name)
-
-            # STAGE 2.2 - set the value using setter method
-            setter_method(new_value)
+        BindingPlan(dst_obj, dst_property_name, setter_method_name, src_obj, src_property_name,
+                    getter_method_name).execute()
 
     @staticmethod
     def returnPropChangedEventPubArgs(pub_obj, obj_property_name: str) -> dict:
@@ -303,3 +2874,8 @@ class PropertyChangedEventHandler:
                subscription_callback_data[CallbackData.SOURCE_OBJECT.value], \
                subscription_callback_data[CallbackData.SRC_PROPERTY_NAME.value], \
                subscription_callback_data[CallbackData.GET_METHOD_NAME.value]
+
+
+PropertyChangedEventHandler.default_hub = PropertyChangedEventHandler()
+# Class-level access to the registry (as in 'PropertyChangedEventHandler.callbacks') refers to the default hub's one
+PropertyChangedEventHandler.callbacks = PropertyChangedEventHandler.default_hub.callbacks
@@ -1,6 +1,6 @@
 from ObservableObjects import *
+from ObservableCollections import *
 from DataModels import *
-from varname import *
 
 
 class ViewModel(ObservableObject):
@@ -11,8 +11,9 @@ class ViewModel(ObservableObject):
     """
     def __init__(self):
         # For larger applications, data models can be stored e.g. in lists or dictionaries to switch between them
-        # during application execution
-        self.data_models = []
+        # during application execution. Observable list publishes every modification as 'data_models' property change -
+        # views can subscribe to the whole list or (with 'getChanges' getter) only to the inserted/removed rows.
+        self.data_models = ObservableList(owner=self, owner_property_name='data_models')
         # For presentation purposes there will be only one data model object stored. The list above is not used.
         self.current_model: DataModel = DataModel()
 
@@ -26,9 +27,9 @@ class ViewModel(ObservableObject):
 
     def set_model_x(self, value):
         self.current_model.x = value
-        # Since the 'presented_data' property (defined below) consists of i.e. this property and has to be in sync
-        # with PyQt5 GUI object, trigger property changed event for 'presented_data' every time this setter is used.
-        self.publishPropertyChanges(nameof(self.presented_data))
+        # Trigger property changed event for this property every time this setter is used. The 'presented_data'
+        # property (defined below) depends on this property, so it is recomputed and published automatically.
+        self.publishPropertyChanges('model_x')
 
     model_x = property(get_model_x, set_model_x, None, 'Variable to interact with datamodel values')
 
@@ -41,20 +42,26 @@ class ViewModel(ObservableObject):
 
     def set_model_y(self, value):
         self.current_model.y = value
-        # Since the 'presented_data' property (defined below) consists of i.e. this property and has to be in sync
-        # with PyQt5 GUI object, trigger property changed event for 'presented_data' every time this setter is used.
-        self.publishPropertyChanges(nameof(self.presented_data))
+        # Trigger property changed event for this property - 'presented_data' is updated automatically
+        self.publishPropertyChanges('model_y')
 
     model_y = property(get_model_y, set_model_y, None, 'Variable to interact with datamodel values')
 
-    # Define a property to provide data to visualization objects - in this case it consists of data from another
-    # two properties. Notice that whenever any of the two component properties changes (when its setter is used), a
-    # property changed event is triggered for 'presented_data' property
+    # Define a computed property to provide data to visualization objects - in this case it consists of data from
+    # another two properties. Its value is memoized and whenever any of the two component properties is published
+    # (when its setter is used), 'presented_data' is recomputed and a property changed event is triggered for it.
+    # The component properties are plain python properties, so they are listed explicitly as dependencies.
+    # Computed properties are read only.
     def get_presented_data(self):
         return self.model_x + ' ' + self.model_y
 
-    def set_presented_data(self, value):
-        raise Exception('Variable _presented_data cannot be set. It is read only!')
+    presented_data = ComputedProperty(get_presented_data, depends_on=('model_x', 'model_y'),
+                                      doc='Data to be presented on the screen')
 
-    presented_data = property(get_presented_data, set_presented_data, None, 'Data to be presented on the screen')
+    # Setting both component properties one by one would trigger property changed events twice. Inside a batch the
+    # events are queued and dispatched - and 'presented_data' is recomputed - only once, after both values are set.
+    def set_model_values(self, x, y):
+        with self.batchPropertyChanges():
+            self.model_x = x
+            self.model_y = y
 
@@ -1,5 +1,6 @@
 from PyQt5 import QtWidgets as qtw
 from ViewModels import *
+from DeliveryPolicies import QtScheduler, ThrottledDelivery
 import Utilities
 
 
@@ -14,9 +15,35 @@ class MainView(qtw.QWidget, ObserverObject):
     property of 'ViewModel' object - with the use of event-driven callbacks mechanism.
     Every time the setter method of 'model_x' or 'model_y' property is called, there is a property changed event
     triggered for 'presented_data' property. There is a subscription to 'presented_data' property made for QLabel object
-    - in the constructor of 'MainView' class, so the value can be synchronized automatically
+    - declared in 'bindings' attribute of 'MainView' class, so the value can be synchronized automatically
     """
 
+    # Class of the view model - lets the bindings declared below be checked against it when the class is created
+    view_model: ViewModel
+
+    # Bindings of the view's widgets - listed once for the class instead of being built (with name resolution) in every
+    # instance's constructor. Sources are given by the names of the view's attributes referencing them.
+    bindings = (
+        # Subscription to 'view_model.presented_data' property from the QLabel object.
+        # The setter method for assigning received values to QLabel ('setText') is a property of the QLabel itself,
+        # so need to pass both: dst_property_name and setter_method_name.
+        # Source object is 'view_model', source property - 'presented_data', and getter method is default - 'getattr'.
+        # The label does not need to be repainted more often than the screen refreshes - deliveries are throttled to
+        # 60 per second, intermediate values are dropped and the newest one is always shown. Text equal to the one
+        # displayed already is not set again - it would only cost a relayout.
+        BindingDeclaration('label', 'setText', 'view_model', 'presented_data',
+                           delivery_policy=ThrottledDelivery(QtScheduler(), max_rate=60),
+                           value_cache=CacheMode.EQUALITY),
+        # Two-way bindings of the QLineEdits: values of the view model's properties are delivered to them (e.g. when
+        # the view model is changed by the code) and the text typed by the user is transferred to the view model - on
+        # the 'textChanged' signal. 'setText' emits 'textChanged' again - such echoes are suppressed by the binding.
+        # src_setter_method_name = None, so the default 'setattr' function is used to set the value for source property
+        # - the property's setter publishes the change itself
+        TwoWayBindingDeclaration('input_1', 'setText', 'text', 'view_model', 'model_x', signal='textChanged'),
+        # Do exactly the same for 'input_2' QLineEdit and 'model_y' property of 'view_model'
+        TwoWayBindingDeclaration('input_2', 'setText', 'text', 'view_model', 'model_y', signal='textChanged'),
+    )
+
     def __init__(self, v_model: ViewModel):
         qtw.QWidget.__init__(self)
 
@@ -44,55 +71,8 @@ class MainView(qtw.QWidget, ObserverObject):
         # Set the layout of the Main View class as the one created above
         self.setLayout(self.main_layout)
 
-        self.createSubscriptionToVariables()
-        self.createBindingsToVariables()
-
-    def createSubscriptionToVariables(self):
-        """
-        Function to group all the statements aimed to create subscriptions to particular attributes.
-        :return: None
-        """
-
-        # Create subscription to 'view_model.presented_data' property from the QLabel object.
-        # The setter method for assigning received values to QLabel ('setText') is a property of the QLabel itself,
-        # so need to pass both: dst_property_name and setter_method_name.
-        # Source object is 'view_model', source property - 'presented_data', and getter method is default - 'getattr'.
-        self.subscribeToVariable(dst_property_name=nameof(self.label), setter_method_name=nameof(self.label.setText),
-                                 src_obj=self.view_model, src_property_name=nameof(self.view_model.presented_data),
-                                 getter_method_name=None)
-
-    def createBindingsToVariables(self):
-        """
-        Function to group all the statements aimed to create bindings FROM PyQt5 GUI elements TO plain variables -
-        using signal slots. Thanks to inheriting from 'ObserverObject', there can be one consistent method used to
-        propagate new values to destinations ('updateObjectFromAttribute').
-        :return: None
-        """
-
-        # Destination object - view_model
-        # dst_property_name - 'model_x'
-        # setter_method_name = None, so the default 'setattr' function is used to set the value for destination property
-        # Name of this class' property that is a source - 'input_1' (QLineEdit object)
-        # Value getter method (from source) - 'text'
-        self.input_1.textChanged.connect(lambda:
-                                         self.updateObjectFromAttribute(
-                                             dst_obj=self.view_model,
-                                             dst_property_name=nameof(self.view_model.model_x),
-                                             setter_method_name=None,
-                                             src_property_name=nameof(self.input_1),
-                                             getter_method_name=nameof(self.input_1.text)
-                                         )
-                                         )
-
-        # Do exactly the same for 'input_2' QLineEdit and 'model_y' property of 'view_model'
-        self.input_2.textChanged.connect(lambda:
-                                         self.updateObjectFromAttribute(
-                                             dst_obj=self.view_model,
-                                             dst_property_name=nameof(self.view_model.model_y),
-                                             src_property_name=nameof(self.input_2),
-                                             getter_method_name=nameof(self.input_2.text)
-                                         )
-                                         )
+        # Create the bindings declared below - the declarations are compiled once, when the class is created
+        self.applyBindings()
 
 
 class MainWindow(qtw.QMainWindow):
@@ -0,0 +1,64 @@
+import concurrent.futures
+import unittest
+
+from ObservableObjects import ObserverObject
+from Utilities import PropertyChangedEventHandler
+
+
+class Recorder(ObserverObject):
+    """
+    Subscriber recording the values passed to its 'put' setter method - with the time of the scheduler, if given.
+    """
+
+    def __init__(self, scheduler=None):
+        self.scheduler = scheduler
+        self.received = list()
+
+    def put(self, value):
+        self.received.append(value if self.scheduler is None else (self.scheduler.now(), value))
+
+
+class InlineExecutor(concurrent.futures.Executor):
+    """
+    Executor running the submitted functions immediately, on the submitting thread - background evaluations are
+    deterministic with it.
+    """
+
+    def submit(self, function, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except Exception as E:
+            future.set_exception(E)
+        return future
+
+
+class HubTestCase(unittest.TestCase):
+    """
+    Base class of the test cases - every test runs on its own event hub ('event_hub'), which is closed (with all its
+    subscriptions) when the test ends, so the default hub is never touched.
+    """
+
+    def setUp(self):
+        self.event_hub = PropertyChangedEventHandler()
+        self.addCleanup(self.event_hub.close)
+
+    def attach(self, *objects):
+        """
+        Attaches the test's hub to given objects.
+
+        :param objects: Publishers and subscribers of the test.
+        :return: The only object given or the tuple of the objects.
+        """
+        self.event_hub.attach(*objects)
+        return objects[0] if len(objects) == 1 else objects
+
+    @staticmethod
+    def publish(obj, property_name: str, value):
+        """
+        Assigns the value to the attribute and publishes the change.
+
+        :return: None
+        """
+        setattr(obj, property_name, value)
+        obj.publishPropertyChanges(property_name)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modules of the package are stored in the repository's root directory - make them importable by the tests (the
+# tests' own directory, with the shared 'Fixtures' module, is added by pytest)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
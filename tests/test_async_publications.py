@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject, ObserverObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class AsyncRecorder(ObserverObject):
+    """
+    Asynchronous subscriber - every delivery takes a few event loop iterations.
+    """
+
+    def __init__(self, statistics: dict = None, fail: bool = False):
+        self.received = list()
+        self.statistics = statistics if statistics is not None else {'running': 0, 'max_running': 0}
+        self.fail = fail
+
+    async def put(self, value):
+        self.statistics['running'] += 1
+        self.statistics['max_running'] = max(self.statistics['max_running'], self.statistics['running'])
+        try:
+            for _ in range(3):
+                await asyncio.sleep(0)
+            if self.fail:
+                raise ValueError('Cannot store the value')
+            self.received.append(value)
+        finally:
+            self.statistics['running'] -= 1
+
+
+class AsyncPublicationTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source = self.attach(Source())
+
+    def testPublishAsyncAwaitsAsynchronousSubscribers(self):
+        async def scenario():
+            recorder, sync_recorder = self.attach(AsyncRecorder(), Recorder())
+            recorder.subscribeToVariable(None, 'put', self.source, 'x')
+            sync_recorder.subscribeToVariable(None, 'put', self.source, 'x')
+            self.source.x = 1
+            await self.source.publishPropertyChangesAsync('x')
+            return recorder.received, sync_recorder.received
+
+        self.assertEqual(asyncio.run(scenario()), ([1], [1]))
+
+    def testSynchronousPublicationSchedulesDeliveries(self):
+        async def scenario():
+            recorder = self.attach(AsyncRecorder())
+            recorder.subscribeToVariable(None, 'put', self.source, 'x')
+            self.publish(self.source, 'x', 1)
+            received_before = list(recorder.received)
+            await self.event_hub.waitForAsyncDeliveries()
+            return received_before, recorder.received
+
+        self.assertEqual(asyncio.run(scenario()), ([], [1]))
+
+    def testConcurrencyIsLimited(self):
+        async def scenario():
+            statistics = {'running': 0, 'max_running': 0}
+            recorders = [self.attach(AsyncRecorder(statistics)) for _ in range(10)]
+            for recorder in recorders:
+                recorder.subscribeToVariable(None, 'put', self.source, 'x')
+            await self.event_hub.publishAsync(self.source, 'x', max_concurrency=3)
+            return statistics['max_running'], [recorder.received for recorder in recorders]
+
+        max_running, received = asyncio.run(scenario())
+        self.assertEqual(max_running, 3)
+        self.assertEqual(received, [[0]] * 10)
+
+    def testFailedDeliveryIsReported(self):
+        async def scenario():
+            recorder = self.attach(AsyncRecorder(fail=True))
+            recorder.subscribeToVariable(None, 'put', self.source, 'x')
+            await self.event_hub.publishAsync(self.source, 'x')
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(scenario())
+
+    def testPublicationFromAnotherThreadIsDeliveredOnTheSubscribersLoop(self):
+        async def scenario():
+            recorder = self.attach(AsyncRecorder())
+            recorder.subscribeToVariable(None, 'put', self.source, 'x')
+            publisher = threading.Thread(target=self.publish, args=(self.source, 'x', 1))
+            publisher.start()
+            await asyncio.get_running_loop().run_in_executor(None, publisher.join)
+            await self.event_hub.waitForAsyncDeliveries()
+            return recorder.received
+
+        self.assertEqual(asyncio.run(scenario()), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
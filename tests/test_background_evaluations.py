@@ -0,0 +1,125 @@
+import concurrent.futures
+import threading
+import unittest
+
+from BackgroundEvaluations import BackgroundEvaluation
+from DeliveryPolicies import FakeClockScheduler
+from Fixtures import HubTestCase, InlineExecutor, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+        self.getter_threads = list()
+
+    def getSquaredX(self):
+        self.getter_threads.append(threading.get_ident())
+        if self.x < 0:
+            raise ValueError('Negative value')
+        return self.x ** 2
+
+
+class ManualExecutor(concurrent.futures.Executor):
+    """
+    Executor running the submitted functions only when asked - computations can be started and completed in any order.
+    """
+
+    def __init__(self):
+        self.submitted = list()
+
+    def submit(self, function, *args, **kwargs):
+        future = concurrent.futures.Future()
+        self.submitted.append((future, function, args, kwargs))
+        return future
+
+    def start(self, index: int) -> bool:
+        return self.submitted[index][0].set_running_or_notify_cancel()
+
+    def complete(self, index: int):
+        future, function, args, kwargs = self.submitted[index]
+        future.set_result(function(*args, **kwargs))
+
+
+def negate(value):
+    return -value
+
+
+class BackgroundEvaluationTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = FakeClockScheduler()
+        self.source, self.recorder = self.attach(Source(), Recorder())
+
+    def subscribe(self, evaluation_policy):
+        subscription = self.recorder.subscribeToVariable(None, 'put', self.source, 'x',
+                                                         getter_method_name='getSquaredX',
+                                                         evaluation_policy=evaluation_policy)
+        return subscription.binding_plan.evaluation
+
+    def testResultIsDeliveredOnTheSchedulersLoop(self):
+        self.subscribe(BackgroundEvaluation(self.scheduler, executor=InlineExecutor()))
+        self.publish(self.source, 'x', 3)
+        self.assertEqual(self.recorder.received, [])
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [9])
+
+    def testComputationsNotStartedAreCancelled(self):
+        executor = ManualExecutor()
+        evaluation = self.subscribe(BackgroundEvaluation(self.scheduler, executor=executor))
+        for value in (1, 2, 3):
+            self.publish(self.source, 'x', value)
+        executor.start(2)
+        executor.complete(2)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [9])
+        self.assertEqual(evaluation.cancelled_count, 2)
+        self.assertEqual(self.source.getter_threads, [threading.get_ident()])
+
+    def testStaleResultsAreDiscarded(self):
+        executor = ManualExecutor()
+        evaluation = self.subscribe(BackgroundEvaluation(self.scheduler, executor=executor))
+        self.publish(self.source, 'x', 1)
+        executor.start(0)
+        self.publish(self.source, 'x', 2)
+        executor.start(1)
+        executor.complete(1)
+        executor.complete(0)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [4])
+        self.assertEqual(evaluation.stale_count, 1)
+
+    def testResultWaitingForTheLoopIsDiscardedWhenSuperseded(self):
+        evaluation = self.subscribe(BackgroundEvaluation(self.scheduler, executor=InlineExecutor()))
+        self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 2)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [4])
+        self.assertEqual(evaluation.stale_count, 1)
+
+    def testErrorsAreReported(self):
+        errors = list()
+        evaluation = self.subscribe(BackgroundEvaluation(self.scheduler, executor=InlineExecutor(),
+                                                         on_error=errors.append))
+        self.publish(self.source, 'x', -1)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [])
+        self.assertEqual((evaluation.errors_count, [type(error) for error in errors]), (1, [ValueError]))
+
+    def testTransformRunsInThePool(self):
+        self.subscribe(BackgroundEvaluation(self.scheduler, executor=InlineExecutor(), transform=negate))
+        self.publish(self.source, 'x', 3)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [-9])
+
+    def testGetterRunsOnWorkerThread(self):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            evaluation = self.subscribe(BackgroundEvaluation(executor=executor))
+            self.publish(self.source, 'x', 4)
+            evaluation.wait(timeout=5)
+        self.assertEqual(self.recorder.received, [16])
+        self.assertNotEqual(self.source.getter_threads, [threading.get_ident()])
+
+
+if __name__ == '__main__':
+    unittest.main()
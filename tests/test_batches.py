@@ -0,0 +1,68 @@
+import unittest
+
+from Fixtures import HubTestCase
+from ObservableObjects import ObservableObject, ObserverObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+
+
+class PairRecorder(ObserverObject):
+    def __init__(self):
+        self.received = list()
+
+    def putX(self, value):
+        self.received.append(('x', value))
+
+    def putY(self, value):
+        self.received.append(('y', value))
+
+
+class BatchTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source, self.recorder = self.attach(Source(), PairRecorder())
+        self.recorder.subscribeToVariable(None, 'putX', self.source, 'x')
+        self.recorder.subscribeToVariable(None, 'putY', self.source, 'y')
+
+    def testPublicationsAreCoalescedUntilTheBatchEnds(self):
+        with self.source.batchPropertyChanges():
+            for value in range(5):
+                self.publish(self.source, 'x', value)
+            self.assertEqual(self.recorder.received, [])
+        self.assertEqual(self.recorder.received, [('x', 4)])
+
+    def testAttributesArePublishedInOrderOfTheirFirstChange(self):
+        with self.source.batchPropertyChanges():
+            self.publish(self.source, 'y', 1)
+            self.publish(self.source, 'x', 2)
+            self.publish(self.source, 'y', 3)
+        self.assertEqual(self.recorder.received, [('y', 3), ('x', 2)])
+
+    def testNestedBatchesAreDispatchedByTheOutermostOne(self):
+        with self.event_hub.batch():
+            self.publish(self.source, 'x', 1)
+            with self.event_hub.batch():
+                self.publish(self.source, 'x', 2)
+            self.assertEqual(self.recorder.received, [])
+        self.assertEqual(self.recorder.received, [('x', 2)])
+
+    def testQueuedPublicationsAreDispatchedWhenTheBatchRaises(self):
+        with self.assertRaises(KeyError):
+            with self.event_hub.batch():
+                self.publish(self.source, 'x', 1)
+                raise KeyError('x')
+        self.assertEqual(self.recorder.received, [('x', 1)])
+
+    def testPublicationsAfterTheBatchAreImmediate(self):
+        with self.event_hub.batch():
+            self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(self.recorder.received, [('x', 1), ('x', 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+
+from Fixtures import HubTestCase
+from ObservableObjects import ObservableObject, ObserverObject, ObservableProperty, observableProperties, \
+    BindingDeclaration, TwoWayBindingDeclaration
+
+
+class ViewModel(ObservableObject):
+    title: str
+
+    def __init__(self):
+        self.title = 'title'
+        self._x = ''
+
+    def getTitle(self):
+        return self.title.upper()
+
+    def getX(self):
+        return self._x
+
+    def setX(self, value):
+        self._x = value
+        self.publishPropertyChanges('x')
+
+    x = property(getX, setX)
+
+
+class Label:
+    def __init__(self):
+        self.text = None
+
+    def setText(self, text):
+        self.text = text
+
+
+class Signal:
+    def __init__(self):
+        self.slots = list()
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+
+class LineEdit:
+    def __init__(self):
+        self._text = ''
+        self.textChanged = Signal()
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        self._text = text
+        for slot in self.textChanged.slots:
+            slot(text)
+
+
+class RowView(ObserverObject):
+    view_model: ViewModel
+
+    bindings = (
+        BindingDeclaration('label', 'setText', 'view_model', 'title', 'getTitle'),
+        TwoWayBindingDeclaration('edit', 'setText', 'text', 'view_model', 'x', signal='textChanged'),
+    )
+
+    def __init__(self, view_model):
+        self.view_model = view_model
+        self.label = Label()
+        self.edit = LineEdit()
+        self.handles = self.applyBindings()
+
+
+class DetailedRowView(RowView):
+    bindings = (BindingDeclaration(None, 'setNote', 'view_model', 'x'),)
+
+    def setNote(self, note):
+        self.note = note
+
+
+@observableProperties
+class Point(ObservableObject, ObserverObject):
+    __slots__ = ('seen',)
+    x = ObservableProperty(0)
+    bindings = (BindingDeclaration(None, 'onX', None, 'x'),)
+
+    def __init__(self):
+        self.seen = list()
+        self.applyBindings()
+
+    def onX(self, value):
+        self.seen.append(value)
+
+
+class BindingDeclarationTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.view_model = self.attach(ViewModel())
+
+    def declareClass(self, bindings, annotations=None):
+        return type('Declaring', (ObserverObject,), {'bindings': bindings, '__annotations__': annotations or {}})
+
+    def testDeclaredBindingsAreAppliedToEveryInstance(self):
+        views = [RowView(self.view_model), RowView(self.view_model)]
+        self.view_model.title = 'new'
+        self.view_model.publishPropertyChanges('title')
+        self.view_model.x = 'x'
+        self.assertEqual([(view.label.text, view.edit.text()) for view in views], [('NEW', 'x'), ('NEW', 'x')])
+
+    def testSignalTransfersTheValueToTheSource(self):
+        view = RowView(self.view_model)
+        view.edit.setText('typed')
+        self.assertEqual(self.view_model.x, 'typed')
+
+    def testBindingsAreInherited(self):
+        self.assertEqual(len(DetailedRowView.binding_records), 3)
+        view = DetailedRowView(self.view_model)
+        self.view_model.x = 'x'
+        self.assertEqual(view.note, 'x')
+
+    def testClassCreatedAgainByObservablePropertiesKeepsItsBindings(self):
+        # Instances of slotted classes cannot have a hub attached individually
+        Point.event_hub = self.event_hub
+        self.addCleanup(setattr, Point, 'event_hub', None)
+        self.assertEqual(len(Point.binding_records), 1)
+        point = Point()
+        point.x = 5
+        self.assertEqual(point.seen, [5])
+
+    def testInvalidDeclarationsAreRejected(self):
+        invalid_bindings = [
+            (1,),
+            (BindingDeclaration('label', 'setText', 'view_model', 'title', unknown_option=1),),
+            (BindingDeclaration('label', 'setText', 'view_model', '1title'),),
+            (BindingDeclaration('label', 'setText', 'view_model', 'title'),
+             BindingDeclaration('label', 'setText', 'view_model', 'title')),
+            (TwoWayBindingDeclaration(None, 'setText', 'text', 'view_model', 'x'),),
+        ]
+        for bindings in invalid_bindings:
+            with self.subTest(bindings=bindings), self.assertRaises((TypeError, ValueError)):
+                self.declareClass(bindings)
+
+    def testAttributesOfKnownSourceClassAreChecked(self):
+        with self.assertRaises(AttributeError):
+            self.declareClass((BindingDeclaration('label', 'setText', 'view_model', 'titel'),),
+                              {'view_model': ViewModel})
+        with self.assertRaises(AttributeError):
+            self.declareClass((BindingDeclaration(None, 'setTitle', 'view_model', 'title'),))
+        # Source class is not known - the declaration is accepted
+        self.declareClass((BindingDeclaration('label', 'setText', 'view_model', 'titel'),))
+
+
+if __name__ == '__main__':
+    unittest.main()
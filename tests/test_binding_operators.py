@@ -0,0 +1,94 @@
+import statistics
+import unittest
+
+from BindingOperators import Buffer, DistinctUntilChanged, Filter, Map, Window, fuseOperators
+from DeliveryPolicies import FakeClockScheduler, ThrottledDelivery
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class FusedOperatorTests(unittest.TestCase):
+    def process(self, operators, values) -> list:
+        received = list()
+        pipeline = fuseOperators(operators, received.append)
+        for value in values:
+            pipeline(value)
+        return received
+
+    def testMapsAndFiltersAreAppliedInOrder(self):
+        operators = [Map(lambda value: value + 1), Filter(lambda value: value % 2), Map(str), Map(lambda text: text * 2)]
+        self.assertEqual(self.process(operators, range(5)), ['11', '33', '55'])
+
+    def testDistinctUntilChanged(self):
+        self.assertEqual(self.process([DistinctUntilChanged()], [1, 1, 2, 2, 1]), [1, 2, 1])
+        operators = [DistinctUntilChanged(lambda previous, new: abs(previous - new) < 0.5)]
+        self.assertEqual(self.process(operators, [1.0, 1.2, 1.6, 2.5]), [1.0, 1.6, 2.5])
+
+    def testBufferByCount(self):
+        self.assertEqual(self.process([Buffer(count=2)], range(5)), [[0, 1], [2, 3]])
+
+    def testBufferByInterval(self):
+        scheduler = FakeClockScheduler()
+        received = list()
+        pipeline = fuseOperators([Buffer(count=10, interval=1.0, scheduler=scheduler)], received.append)
+        for value in range(3):
+            pipeline(value)
+            scheduler.advance(0.4)
+        self.assertEqual(received, [[0, 1, 2]])
+        self.assertEqual(scheduler.pendingCount(), 0)
+
+    def testWindow(self):
+        self.assertEqual(self.process([Window(2)], range(3)), [(0,), (0, 1), (1, 2)])
+        self.assertEqual(self.process([Window(3, statistics.mean, full_only=True)], [3, 6, 9, 12]), [6, 9])
+
+    def testStatefulOperatorsSplitTheFusedSteps(self):
+        operators = [Map(abs), DistinctUntilChanged(), Filter(bool), Map(str)]
+        self.assertEqual(self.process(operators, [1, -1, 0, 2]), ['1', '2'])
+
+    def testInvalidArgumentsAreRejected(self):
+        for create in (Buffer, lambda: Buffer(interval=1.0), lambda: Window(0)):
+            with self.assertRaises(ValueError):
+                create()
+
+
+class BindingPipelineTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source, self.recorder = self.attach(Source(), Recorder())
+
+    def publishAll(self, values):
+        for value in values:
+            self.publish(self.source, 'x', value)
+
+    def testPipelineTransformsPublishedValues(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x',
+                                          operators=[Filter(lambda value: value > 0), Map('%d%%'.__mod__)])
+        self.publishAll([-1, 5, 0, 10])
+        self.assertEqual(self.recorder.received, ['5%', '10%'])
+
+    def testEverySubscriptionHasItsOwnOperatorState(self):
+        other_recorder = self.attach(Recorder())
+        operators = [Window(2)]
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', operators=operators)
+        self.publish(self.source, 'x', 1)
+        other_recorder.subscribeToVariable(None, 'put', self.source, 'x', operators=operators)
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(self.recorder.received, [(1,), (1, 2)])
+        self.assertEqual(other_recorder.received, [(2,)])
+
+    def testPipelineRunsBeforeTheDeliveryPolicy(self):
+        scheduler = FakeClockScheduler()
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', operators=[Buffer(count=2)],
+                                          delivery_policy=ThrottledDelivery(scheduler, interval=1.0))
+        self.publishAll(range(6))
+        scheduler.advance(1.0)
+        self.assertEqual(self.recorder.received, [[0, 1], [4, 5]])
+
+
+if __name__ == '__main__':
+    unittest.main()
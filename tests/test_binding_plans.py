@@ -0,0 +1,121 @@
+import unittest
+
+from Fixtures import HubTestCase
+from ObservableObjects import ObservableObject, ObserverObject
+from Utilities import BindingPlan, PropertyChangedEventHandler
+
+
+class Text:
+    """
+    Attribute object owning its getter method - like a QLineEdit's 'text'.
+    """
+
+    def __init__(self, value=''):
+        self.value = value
+
+    def text(self):
+        return self.value
+
+
+class Label:
+    """
+    Attribute object owning its setter method - like a QLabel's 'setText'.
+    """
+
+    def __init__(self):
+        self.texts = list()
+
+    def setText(self, text):
+        self.texts.append(text)
+
+
+class Model(ObservableObject):
+    def __init__(self):
+        self.x = 0
+        self.name = Text('first')
+
+    def getDoubledX(self):
+        return self.x * 2
+
+
+class View(ObserverObject):
+    def __init__(self):
+        self.label = Label()
+        self.value = None
+        self.values = list()
+
+    def put(self, value):
+        self.values.append(value)
+
+
+class BindingPlanTests(unittest.TestCase):
+    def setUp(self):
+        self.model, self.view = Model(), View()
+
+    def testAttributeIsCopiedWithGetattrAndSetattr(self):
+        self.model.x = 3
+        BindingPlan(self.view, 'value', None, self.model, 'x', None).execute()
+        self.assertEqual(self.view.value, 3)
+
+    def testSetterMethodOfTheDestinationAttribute(self):
+        BindingPlan(self.view, 'label', 'setText', self.model, 'x', None).execute()
+        self.assertEqual(self.view.label.texts, [0])
+
+    def testGetterMethodOfTheSourceAttributeOrObject(self):
+        self.model.x = 4
+        BindingPlan(self.view, None, 'put', self.model, 'name', 'text').execute()
+        BindingPlan(self.view, None, 'put', self.model, 'x', 'getDoubledX').execute()
+        self.assertEqual(self.view.values, ['first', 8])
+
+    def testSourceAttributeOwningTheGetterIsReadAgainOnEveryExecution(self):
+        binding_plan = BindingPlan(self.view, None, 'put', self.model, 'name', 'text')
+        binding_plan.execute()
+        self.model.name = Text('second')
+        binding_plan.execute()
+        self.assertEqual(self.view.values, ['first', 'second'])
+
+    def testPlanIsResolvedOnFirstExecutionIfAttributesAreMissing(self):
+        del self.view.label
+        binding_plan = BindingPlan(self.view, 'label', 'setText', self.model, 'x', None)
+        self.view.label = Label()
+        binding_plan.execute()
+        self.assertEqual(self.view.label.texts, [0])
+
+    def testUpdateSubscriberObjectIsKeptForCompatibility(self):
+        self.model.x = 5
+        PropertyChangedEventHandler.updateSubscriberObject(self.view, 'label', 'setText', self.model, 'x', None)
+        self.assertEqual(self.view.label.texts, [5])
+
+    def testMissingObjectsAreRejected(self):
+        with self.assertRaises(ValueError):
+            BindingPlan(None, 'value', None, self.model, 'x', None)
+        with self.assertRaises(ValueError):
+            BindingPlan(self.view, 'value', None, self.model, None, None)
+
+
+class RefreshBindingsTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.model, self.view = self.attach(Model(), View())
+        self.view.subscribeToVariable('label', 'setText', self.model, 'x')
+
+    def testReplacedDestinationAttributeIsUsedAfterRefresh(self):
+        old_label, self.view.label = self.view.label, Label()
+        self.publish(self.model, 'x', 1)
+        self.assertEqual(old_label.texts, [1])
+
+        self.event_hub.refreshBindings(self.view)
+        self.publish(self.model, 'x', 2)
+        self.assertEqual(old_label.texts, [1])
+        self.assertEqual(self.view.label.texts, [2])
+
+    def testDictionaryBasedSubscriptionIsKeptForCompatibility(self):
+        other_view = self.attach(View())
+        callback_data = self.event_hub.returnSubscriptionCallbackData(other_view, None, 'put', self.model, 'x', None)
+        self.event_hub.subscribeToAttribute(callback_data)
+        self.event_hub.triggerBindingUpdate(self.event_hub.returnPropChangedEventPubArgs(self.model, 'x'))
+        self.assertEqual(other_view.values, [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import random
+import tempfile
+import unittest
+
+from ChangeJournals import ChangeJournal, ChangeJournalReplayer
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class ChangeJournalTests(unittest.TestCase):
+    def appendValue(self, journal, value):
+        journal.append(float(len(value)), 1, b'Source', b'x', value.encode('utf-8'), ChangeJournal.FLAG_REPR)
+
+    def assertJournalHolds(self, journal, appended_values):
+        values = [journal_record.value for journal_record in journal.records()]
+        # The journal holds the newest records - a suffix of the appended ones
+        self.assertEqual(values, appended_values[len(appended_values) - len(values):])
+        self.assertLessEqual(journal._head - journal._tail, journal.capacity)
+
+    def testWraparoundKeepsTheNewestRecordsIntact(self):
+        random_generator = random.Random(18)
+        for capacity in (100, 137, 256, 1000):
+            journal = ChangeJournal(capacity=capacity)
+            appended_values = list()
+            for index in range(500):
+                value = '%d:' % index + 'v' * random_generator.randint(0, 70)
+                self.appendValue(journal, value)
+                if ChangeJournal.RECORD_HEADER.size + len('Source') + len('x') + len(value) > capacity:
+                    # Records larger than the journal are dropped
+                    continue
+                appended_values.append(value)
+                with self.subTest(capacity=capacity, index=index):
+                    self.assertJournalHolds(journal, appended_values)
+                    self.assertEqual(journal.records()[-1].value, value)
+
+    def testRecordLargerThanTheCapacityIsDropped(self):
+        journal = ChangeJournal(capacity=64)
+        self.appendValue(journal, 'kept')
+        self.appendValue(journal, 'x' * 64)
+        self.assertEqual([journal_record.value for journal_record in journal.records()], ['kept'])
+        self.assertEqual(journal.dropped_records, 1)
+
+    def testMemoryMappedJournalIsContinued(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.journal')
+            with ChangeJournal(capacity=256, path=path) as journal:
+                for index in range(20):
+                    self.appendValue(journal, str(index))
+                values = [journal_record.value for journal_record in journal.records()]
+            with ChangeJournal(capacity=256, path=path) as journal:
+                self.assertEqual([journal_record.value for journal_record in journal.records()], values)
+
+
+class JournalRecordingTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.journal = ChangeJournal(capacity=4096)
+        self.event_hub.setJournal(self.journal)
+        self.source, self.recorder = self.attach(Source(), Recorder())
+
+    def testPublicationsAreRecordedAndReplayed(self):
+        for value in (1, 2, [3]):
+            self.publish(self.source, 'x', value)
+        journal_records = self.journal.records()
+        self.assertEqual([(journal_record.publisher_type, journal_record.property_name, journal_record.value)
+                          for journal_record in journal_records], [('Source', 'x', 1), ('Source', 'x', 2),
+                                                                   ('Source', 'x', [3])])
+
+        target = self.attach(Source())
+        self.recorder.subscribeToVariable(None, 'put', target, 'x')
+        self.event_hub.setJournal(None)
+        replayed_count = ChangeJournalReplayer(journal_records, {'Source': target}, self.event_hub).replay()
+        self.assertEqual(replayed_count, 3)
+        self.assertEqual(self.recorder.received, [1, 2, [3]])
+
+    def testUnserializableValueIsRecordedAsRepr(self):
+        self.publish(self.source, 'x', lambda: None)
+        journal_record = self.journal.records()[-1]
+        self.assertTrue(journal_record.value_is_repr)
+        self.assertIn('lambda', journal_record.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
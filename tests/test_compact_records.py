@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+from Utilities import BindingPlan, PropertyChangedEventHandler, StrongReference, makeReference
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class CompactRecordTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source, self.recorder = self.attach(Source(), Recorder())
+
+    def testBindingRecordsHaveNoInstanceDictionaries(self):
+        subscription = self.recorder.subscribeToVariable(None, 'put', self.source, 'x')
+        self.assertFalse(hasattr(subscription.binding_plan, '__dict__'))
+        self.assertFalse(hasattr(subscription, '__dict__'))
+        self.assertFalse(hasattr(makeReference(object()), '__dict__'))
+        self.assertIsInstance(makeReference(object()), StrongReference)
+
+    def testPublishingDoesNotUseArgumentDictionaries(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x')
+        with mock.patch.object(PropertyChangedEventHandler, 'returnPropChangedEventPubArgs',
+                               side_effect=AssertionError), \
+                mock.patch.object(PropertyChangedEventHandler, 'extractSubscriptionCallbackData',
+                                  side_effect=AssertionError):
+            self.publish(self.source, 'x', 1)
+            self.event_hub.updateAllBindings()
+        self.assertEqual(self.recorder.received, [1, 1])
+
+    def testDictionaryHelpersAreKeptForCompatibility(self):
+        arguments = self.event_hub.returnPropChangedEventPubArgs(self.source, 'x')
+        self.assertEqual(self.event_hub.extractPropChangedEventPubArgs(arguments), (self.source, 'x'))
+
+        callback_data = self.event_hub.returnSubscriptionCallbackData(self.recorder, None, 'put', self.source, 'x',
+                                                                      None)
+        binding_plan = BindingPlan.fromCallbackData(callback_data)
+        self.assertEqual(binding_plan.callback_data, callback_data)
+        self.source.x = 2
+        binding_plan.execute()
+        self.assertEqual(self.recorder.received, [2])
+
+        self.event_hub.markPropertyChanged(arguments)
+        self.event_hub.subscribeToAttribute(callback_data)
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.assertEqual(self.recorder.received, [2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import gc
+import threading
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class LockedRecorder(Recorder):
+    """
+    Recorder safe to be called from many publishing threads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def put(self, value):
+        with self.lock:
+            super().put(value)
+
+
+class ConcurrentPublishingTests(HubTestCase):
+    THREADS_COUNT = 8
+    PUBLICATIONS_COUNT = 300
+
+    def runThreads(self, target, *args):
+        errors = list()
+
+        def run(index):
+            try:
+                target(index, *args)
+            except Exception as E:
+                errors.append(E)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(self.THREADS_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertEqual(errors, [])
+
+    def testConcurrentPublicationsReachEverySubscriber(self):
+        source = self.attach(Source())
+        recorders = [self.attach(LockedRecorder()) for _ in range(5)]
+        for recorder in recorders:
+            recorder.subscribeToVariable(None, 'put', source, 'x')
+
+        def publish(index):
+            for _ in range(self.PUBLICATIONS_COUNT):
+                source.publishPropertyChanges('x')
+
+        self.runThreads(publish)
+        for recorder in recorders:
+            self.assertEqual(len(recorder.received), self.THREADS_COUNT * self.PUBLICATIONS_COUNT)
+
+    def testSubscribingWhilePublishing(self):
+        source = self.attach(Source())
+        stop = threading.Event()
+        subscriptions = list()
+
+        def publish():
+            while not stop.is_set():
+                source.publishPropertyChanges('x')
+
+        publisher = threading.Thread(target=publish)
+        publisher.start()
+        try:
+            def subscribe(index, recorders):
+                for _ in range(50):
+                    recorder = self.attach(LockedRecorder())
+                    recorders.append(recorder)
+                    subscription = recorder.subscribeToVariable(None, 'put', source, 'x')
+                    if index % 2:
+                        subscription.unsubscribe()
+                    else:
+                        subscriptions.append(subscription)
+
+            recorders = list()
+            self.runThreads(subscribe, recorders)
+        finally:
+            stop.set()
+            publisher.join(timeout=30)
+
+        # No subscription has been lost
+        self.assertTrue(all(subscription.active for subscription in subscriptions))
+        self.assertEqual(self.event_hub.registryMemoryUsage()['bindings'], len(subscriptions))
+        self.publish(source, 'x', 'last')
+        self.assertEqual(sum(recorder.received[-1:] == ['last'] for recorder in recorders), len(subscriptions))
+
+    def testSubscribersCollectedWhilePublishing(self):
+        source = self.attach(Source())
+
+        def subscribeAndDrop(index):
+            for _ in range(100):
+                recorder = self.attach(LockedRecorder())
+                recorder.subscribeToVariable(None, 'put', source, 'x')
+                source.publishPropertyChanges('x')
+                del recorder
+                if index == 0:
+                    gc.collect()
+
+        self.runThreads(subscribeAndDrop)
+        gc.collect()
+        self.assertEqual(self.event_hub.registryMemoryUsage()['bindings'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
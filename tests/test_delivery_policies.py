@@ -0,0 +1,64 @@
+import unittest
+
+from DeliveryPolicies import FakeClockScheduler, ThrottledDelivery, DebouncedDelivery, NextTickDelivery
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class DeliveryPolicyTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = FakeClockScheduler()
+        self.source, self.recorder = self.attach(Source(), Recorder(self.scheduler))
+
+    def subscribe(self, delivery_policy):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', delivery_policy=delivery_policy)
+
+    def publishEvery(self, period, values):
+        for value in values:
+            self.publish(self.source, 'x', value)
+            self.scheduler.advance(period)
+
+    def testThrottledDeliveryPassesLeadingValueAndNewestOnePerInterval(self):
+        self.subscribe(ThrottledDelivery(self.scheduler, interval=1.0))
+        # Published at 0.0, 0.25, 0.5, 0.75 and 1.0
+        self.publishEvery(0.25, [1, 2, 3, 4, 5])
+        self.assertEqual(self.recorder.received, [(0.0, 1), (1.0, 4)])
+
+        self.scheduler.advance(1.0)
+        self.assertEqual(self.recorder.received, [(0.0, 1), (1.0, 4), (2.0, 5)])
+        self.assertEqual(self.scheduler.pendingCount(), 0)
+
+    def testThrottledDeliveryAfterQuietPeriodIsImmediate(self):
+        self.subscribe(ThrottledDelivery(self.scheduler, max_rate=2))
+        self.publish(self.source, 'x', 1)
+        self.scheduler.advance(3.0)
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(self.recorder.received, [(0.0, 1), (3.0, 2)])
+
+    def testDebouncedDeliveryWaitsForQuietPeriod(self):
+        self.subscribe(DebouncedDelivery(self.scheduler, 0.5))
+        self.publishEvery(0.25, [1, 2, 3, 4, 5])
+        self.assertEqual(self.recorder.received, [])
+
+        self.scheduler.advance(0.25)
+        self.assertEqual(self.recorder.received, [(1.5, 5)])
+        self.assertEqual(self.scheduler.pendingCount(), 0)
+
+    def testNextTickDeliveryCoalescesValuesPublishedBeforeTheTick(self):
+        self.subscribe(NextTickDelivery(self.scheduler))
+        self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(self.recorder.received, [])
+
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [(0.0, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from Fixtures import HubTestCase
+from ObservableObjects import ObservableObject, ObserverObject, ObservableProperty, ComputedProperty
+
+
+class Totals(ObservableObject):
+    a = ObservableProperty(1)
+    b = ObservableProperty(2)
+
+    def __init__(self):
+        self.computations = {'total': 0, 'doubled': 0}
+
+    def getTotal(self):
+        self.computations['total'] += 1
+        return self.a + self.b
+
+    total = ComputedProperty(getTotal)
+
+    def getDoubled(self):
+        self.computations['doubled'] += 1
+        return self.total * 2 + self.a
+
+    doubled = ComputedProperty(getDoubled)
+
+
+class TotalsRecorder(ObserverObject):
+    def __init__(self, totals):
+        self.totals = totals
+        self.received = list()
+
+    def setTotal(self, value):
+        # The attribute depending on 'total' has to be up to date already when 'total' is delivered
+        self.received.append(('total', value, self.totals.doubled))
+
+    def setDoubled(self, value):
+        self.received.append(('doubled', value))
+
+
+class DependencyGraphTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.totals = Totals()
+        self.recorder = TotalsRecorder(self.totals)
+        self.attach(self.totals, self.recorder)
+        self.recorder.subscribeToVariable(None, 'setTotal', self.totals, 'total')
+        self.recorder.subscribeToVariable(None, 'setDoubled', self.totals, 'doubled')
+
+    def testDependentsAreDeliveredInTopologicalOrderWithoutGlitches(self):
+        self.totals.a = 5
+        self.assertEqual(self.recorder.received, [('total', 7, 19), ('doubled', 19)])
+
+    def testEveryComputedAttributeIsComputedOncePerChange(self):
+        computations = dict(self.totals.computations)
+        self.totals.a = 5
+        self.assertEqual(self.totals.computations, {name: count + 1 for name, count in computations.items()})
+
+    def testUnchangedComputedValueIsNotPublished(self):
+        with self.totals.batchPropertyChanges():
+            # 'total' stays 3, only 'doubled' changes
+            self.totals.a = 0
+            self.totals.b = 3
+        self.assertEqual(self.recorder.received, [('doubled', 6)])
+
+    def testComputedAttributeIsReadOnly(self):
+        with self.assertRaises(AttributeError):
+            self.totals.total = 3
+
+
+if __name__ == '__main__':
+    unittest.main()
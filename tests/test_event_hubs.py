@@ -0,0 +1,69 @@
+import unittest
+
+from Fixtures import Recorder
+from ObservableObjects import ObservableObject
+from Utilities import PropertyChangedEventHandler
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class EventHubTests(unittest.TestCase):
+    def setUp(self):
+        self.first_hub, self.second_hub = PropertyChangedEventHandler(), PropertyChangedEventHandler()
+        self.addCleanup(self.first_hub.close)
+        self.addCleanup(self.second_hub.close)
+        self.default_usage = PropertyChangedEventHandler.default_hub.registryMemoryUsage()
+
+    def tearDown(self):
+        self.assertEqual(PropertyChangedEventHandler.default_hub.registryMemoryUsage(), self.default_usage)
+
+    def publish(self, source, value):
+        source.x = value
+        source.publishPropertyChanges('x')
+
+    def testHubsAreIndependent(self):
+        first_source, second_source = Source(), Source()
+        first_recorder, second_recorder = Recorder(), Recorder()
+        self.first_hub.attach(first_source, first_recorder)
+        self.second_hub.attach(second_source, second_recorder)
+        first_recorder.subscribeToVariable(None, 'put', first_source, 'x')
+        second_recorder.subscribeToVariable(None, 'put', second_source, 'x')
+
+        self.publish(first_source, 1)
+        self.second_hub.updateAllBindings()
+        self.assertEqual(first_recorder.received, [1])
+        self.assertEqual(second_recorder.received, [0])
+        self.assertIn(first_source, self.first_hub.callbacks)
+        self.assertNotIn(first_source, self.second_hub.callbacks)
+
+    def testSubscriptionIsRegisteredInThePublishersHub(self):
+        source, recorder = Source(), Recorder()
+        self.first_hub.attach(source)
+        self.second_hub.attach(recorder)
+        recorder.subscribeToVariable(None, 'put', source, 'x')
+        self.publish(source, 1)
+        self.assertEqual(recorder.received, [1])
+        self.assertEqual(self.second_hub.registryMemoryUsage()['bindings'], 0)
+
+    def testClosingHubRemovesSubscriptionsAndDetachesObjects(self):
+        source, recorder = Source(), Recorder()
+        with PropertyChangedEventHandler() as event_hub:
+            source.attachEventHub(event_hub)
+            recorder.attachEventHub(event_hub)
+            recorder.subscribeToVariable(None, 'put', source, 'x')
+            self.assertIn(event_hub, PropertyChangedEventHandler.eventHubs())
+        self.assertEqual(event_hub.registryMemoryUsage()['bindings'], 0)
+        self.assertIsNone(source.event_hub)
+        self.assertIsNone(recorder.event_hub)
+
+    def testClassLevelApiActsOnTheDefaultHub(self):
+        self.assertIs(PropertyChangedEventHandler.updateAllBindings.__self__, PropertyChangedEventHandler.default_hub)
+        self.assertIs(PropertyChangedEventHandler.callbacks, PropertyChangedEventHandler.default_hub.callbacks)
+        self.assertIs(self.first_hub.updateAllBindings.__self__, self.first_hub)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class CountingSource(ObservableObject):
+    def __init__(self):
+        self.x = 0
+        self.getter_calls = {'getX': 0, 'getDoubledX': 0}
+
+    def getX(self):
+        self.getter_calls['getX'] += 1
+        return self.x
+
+    def getDoubledX(self):
+        self.getter_calls['getDoubledX'] += 1
+        return self.x * 2
+
+
+class GetterEvaluationTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source = self.attach(CountingSource())
+        self.recorders = [self.attach(Recorder()) for _ in range(5)]
+
+    def testGetterIsEvaluatedOncePerPublication(self):
+        for recorder in self.recorders:
+            recorder.subscribeToVariable(None, 'put', self.source, 'x', getter_method_name='getX')
+        self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(self.source.getter_calls['getX'], 2)
+        self.assertEqual([recorder.received for recorder in self.recorders], [[1, 2]] * 5)
+
+    def testEveryGetterIsEvaluatedOnce(self):
+        for index, recorder in enumerate(self.recorders):
+            recorder.subscribeToVariable(None, 'put', self.source, 'x',
+                                         getter_method_name='getX' if index % 2 else 'getDoubledX')
+        self.publish(self.source, 'x', 3)
+        self.assertEqual(self.source.getter_calls, {'getX': 1, 'getDoubledX': 1})
+        self.assertEqual([recorder.received for recorder in self.recorders], [[6], [3], [6], [3], [6]])
+
+    def testGetterIsNotEvaluatedWithoutSubscribers(self):
+        subscription = self.recorders[0].subscribeToVariable(None, 'put', self.source, 'x', getter_method_name='getX')
+        subscription.unsubscribe()
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(self.source.getter_calls['getX'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import gc
+import time
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from Instrumentation import DispatchInstrumentation, InMemorySink, LatencyHistogram
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class SlowRecorder(Recorder):
+    def put(self, value):
+        time.sleep(0.002)
+        super().put(value)
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def testPercentilesAreUpperBoundsOfBuckets(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.5e-6, 3e-6, 3e-6, 100e-6):
+            histogram.record(seconds)
+        self.assertEqual(histogram.buckets, {1: 1, 4: 2, 128: 1})
+        self.assertEqual(histogram.percentile(0.5), 4e-6)
+        self.assertEqual(histogram.percentile(1.0), 128e-6)
+        self.assertEqual(histogram.max_seconds, 100e-6)
+
+
+class DispatchInstrumentationTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sink = InMemorySink()
+        self.instrumentation = DispatchInstrumentation(slow_threshold=0.001, sinks=[self.sink])
+        self.event_hub.setInstrumentation(self.instrumentation)
+        self.source, self.recorder = self.attach(Source(), Recorder())
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x')
+
+    def publications(self) -> dict:
+        return {stats['attribute']: stats for stats in self.instrumentation.snapshot()['publications']}
+
+    def testPublicationsAndDeliveriesAreCounted(self):
+        for value in range(3):
+            self.publish(self.source, 'x', value)
+        self.assertEqual(self.recorder.received, [0, 1, 2])
+        self.assertEqual(self.publications()['Source.x']['publications'], 3)
+        self.assertEqual(self.publications()['Source.x']['max_fan_out'], 1)
+        bindings = self.instrumentation.snapshot()['bindings']
+        self.assertEqual([(stats['binding'], stats['calls']) for stats in bindings], [('Recorder.put <- Source.x', 3)])
+        self.assertEqual(len(self.sink.publications), 3)
+
+    def testSlowSubscribersAreReported(self):
+        slow_recorder = self.attach(SlowRecorder())
+        slow_recorder.subscribeToVariable(None, 'put', self.source, 'x')
+        self.publish(self.source, 'x', 1)
+        self.assertEqual([event['binding'] for event in self.sink.slow_subscribers], ['SlowRecorder.put <- Source.x'])
+
+    def testStatisticsOfCollectedPublishersAreDropped(self):
+        for _ in range(3):
+            source = self.attach(Source())
+            self.recorder.subscribeToVariable(None, 'put', source, 'x')
+            self.publish(source, 'x', 1)
+            del source
+            gc.collect()
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(len(self.instrumentation._publications), 1)
+        self.assertEqual(self.publications()['Source.x']['publications'], 1)
+
+    def testResynchronizationIsMeasured(self):
+        self.publish(self.source, 'x', 1)
+        late_recorder = self.attach(Recorder())
+        late_recorder.subscribeToVariable(None, 'put', self.source, 'x')
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.assertEqual(late_recorder.received, [1])
+        self.assertEqual(self.recorder.received, [1])
+        self.assertEqual(self.publications()['Source.x']['publications'], 2)
+        self.assertEqual(self.instrumentation.snapshot()['bindings'][-1]['calls'], 1)
+
+        # Nothing left to resynchronize - nothing is delivered nor recorded
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.assertEqual(self.publications()['Source.x']['publications'], 2)
+
+    def testAsynchronousPublicationsAreMeasured(self):
+        self.source.x = 5
+        asyncio.run(self.event_hub.publishAsync(self.source, 'x'))
+        self.assertEqual(self.recorder.received, [5])
+        self.assertEqual(self.publications()['Source.x']['publications'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
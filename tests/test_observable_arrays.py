@@ -0,0 +1,46 @@
+import unittest
+from array import array
+
+from Fixtures import HubTestCase, Recorder
+from ObservableCollections import ObservableArray
+from ObservableObjects import ObservableObject
+
+
+class ViewModel(ObservableObject):
+    def __init__(self):
+        self.samples = ObservableArray(memoryview(array('d', [0.0] * 8)), owner=self, owner_property_name='samples')
+
+
+class ObservableArrayTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.view_model, self.recorder = self.attach(ViewModel(), Recorder())
+        self.recorder.subscribeToVariable(None, 'put', self.view_model, 'samples', 'getChanges')
+
+    def changedRanges(self):
+        return [(change.start, change.stop, list(change.values)) for change in self.recorder.received[-1]]
+
+    def testNegativeIndexAssignmentRecordsNormalizedRange(self):
+        self.view_model.samples[-1] = 1.0
+        self.assertEqual(self.changedRanges(), [(7, 8, [1.0])])
+
+    def testNegativeIndicesOfBulkWriteAreNormalizedAndMerged(self):
+        self.view_model.samples.setValues([-1, 6, -8], [1.0, 2.0, 3.0])
+        self.assertEqual(self.changedRanges(), [(0, 1, [3.0]), (6, 8, [2.0, 1.0])])
+
+    def testBulkWriteWithIndexOutOfRangeWritesNothing(self):
+        with self.assertRaises(IndexError):
+            self.view_model.samples.setValues([0, -9], 1.0)
+        self.assertEqual(self.recorder.received, [])
+        self.assertEqual(list(self.view_model.samples.data), [0.0] * 8)
+
+    def testChangesOfBatchAreMergedIntoRanges(self):
+        with self.view_model.batchPropertyChanges():
+            for index in (0, 1, 5, 2):
+                self.view_model.samples[index] = 1.0
+        self.assertEqual(len(self.recorder.received), 1)
+        self.assertEqual([(start, stop) for start, stop, _ in self.changedRanges()], [(0, 3), (5, 6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableCollections import ObservableList, ObservableDict, ChangeKind
+from ObservableObjects import ObservableObject
+
+
+class ViewModel(ObservableObject):
+    def __init__(self):
+        self.rows = ObservableList([1, 2, 3], owner=self, owner_property_name='rows')
+        self.names = ObservableDict(owner=self, owner_property_name='names')
+
+
+class ObservableListTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.view_model, self.recorder = self.attach(ViewModel(), Recorder())
+        self.recorder.subscribeToVariable(None, 'put', self.view_model, 'rows', 'getChanges')
+
+    def lastChange(self):
+        changes = self.recorder.received[-1]
+        self.assertEqual(len(changes), 1)
+        return changes[0]
+
+    def testNegativeIndexAssignmentRecordsNormalizedIndex(self):
+        self.view_model.rows[-1] = 30
+        change = self.lastChange()
+        self.assertEqual((change.kind, change.start, change.items, change.removed),
+                         (ChangeKind.REPLACE, 2, (30,), (3,)))
+        self.assertEqual(list(self.view_model.rows), [1, 2, 30])
+
+    def testNegativeIndexDeletionRecordsNormalizedIndex(self):
+        del self.view_model.rows[-3]
+        change = self.lastChange()
+        self.assertEqual((change.kind, change.start, change.removed), (ChangeKind.REMOVE, 0, (1,)))
+
+    def testNegativeIndexInsertionRecordsNormalizedIndex(self):
+        self.view_model.rows.insert(-1, 25)
+        change = self.lastChange()
+        self.assertEqual((change.kind, change.start, change.items), (ChangeKind.INSERT, 2, (25,)))
+        self.assertEqual(list(self.view_model.rows), [1, 2, 25, 3])
+
+    def testIndexOutOfRangeChangesNothing(self):
+        with self.assertRaises(IndexError):
+            self.view_model.rows[-4] = 0
+        self.assertEqual(self.recorder.received, [])
+        self.assertEqual(list(self.view_model.rows), [1, 2, 3])
+
+    def testConsecutiveAppendsInBatchAreMerged(self):
+        with self.view_model.batchPropertyChanges():
+            for value in (4, 5, 6):
+                self.view_model.rows.append(value)
+        change = self.lastChange()
+        self.assertEqual((change.kind, change.start, change.items), (ChangeKind.INSERT, 3, (4, 5, 6)))
+
+
+class ObservableDictTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.view_model, self.recorder = self.attach(ViewModel(), Recorder())
+        self.recorder.subscribeToVariable(None, 'put', self.view_model, 'names', 'getChanges')
+
+    def testEveryModificationIsPublishedWithItsChangeRecord(self):
+        self.view_model.names['a'] = 1
+        self.view_model.names['a'] = 2
+        del self.view_model.names['a']
+        changes = [(change.kind, change.key, change.value, change.old_value)
+                   for changes in self.recorder.received for change in changes]
+        self.assertEqual(changes, [(ChangeKind.INSERT, 'a', 1, None), (ChangeKind.REPLACE, 'a', 2, 1),
+                                   (ChangeKind.REMOVE, 'a', None, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
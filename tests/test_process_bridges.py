@@ -0,0 +1,78 @@
+import array
+import mmap
+import multiprocessing
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+from ProcessBridges import PropertyBridgeReceiver, PropertyBridgeSender, snapshotValue
+
+
+class Model(ObservableObject):
+    def __init__(self):
+        self.x = 0
+        self.data = bytearray(b'abc')
+
+
+class SnapshotValueTests(unittest.TestCase):
+    def testWritableBuffersAreCopied(self):
+        for value in (bytearray(b'abc'), array.array('d', [1.0, 2.0])):
+            with self.subTest(value=value):
+                snapshot = snapshotValue(value)
+                self.assertIsNot(snapshot, value)
+                self.assertEqual(snapshot, value)
+
+    def testMemoryViewsAreCopiedIntoBytes(self):
+        data = bytearray(b'abcdef')
+        for view in (memoryview(data), memoryview(data)[::2], memoryview(bytes(data))):
+            with self.subTest(view=view):
+                contents = view.tobytes()
+                snapshot = snapshotValue(view)
+                data[0] += 1
+                self.assertEqual(snapshot, contents)
+                self.assertIsInstance(snapshot, bytes)
+
+    def testBuffersWithoutCopyingAreCopiedIntoBytes(self):
+        with mmap.mmap(-1, 4) as mapped_memory:
+            mapped_memory.write(b'abcd')
+            self.assertEqual(snapshotValue(mapped_memory), b'abcd')
+
+    def testOtherValuesAreNotCopied(self):
+        for value in (b'abc', [1, 2], 'text', None):
+            with self.subTest(value=value):
+                self.assertIs(snapshotValue(value), value)
+
+
+class PropertyBridgeTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        receiving_end, sending_end = multiprocessing.Pipe(duplex=False)
+        self.sender = PropertyBridgeSender(sending_end)
+        self.addCleanup(self.sender.close)
+        self.receiver = PropertyBridgeReceiver(receiving_end, self.event_hub)
+        self.model, self.recorder = self.attach(Model(), Recorder())
+        self.recorder.subscribeToVariable(None, 'put', self.receiver.mirror('model'), 'data')
+
+    def transfer(self):
+        self.assertTrue(self.sender.flush(timeout=5.0))
+        self.receiver.poll(timeout=5.0)
+
+    def testSharedValuesAreMirrored(self):
+        self.sender.share(self.model, 'model', ['x', 'data'])
+        self.transfer()
+        self.assertEqual(self.receiver.mirror('model').x, 0)
+        self.assertEqual(self.recorder.received, [bytearray(b'abc')])
+
+    def testBufferModifiedAfterPublicationIsSentAsPublished(self):
+        self.sender.share(self.model, 'model', ['data'])
+        self.transfer()
+        view = memoryview(bytearray(b'xyz'))
+        self.publish(self.model, 'data', view)
+        view[0] = ord('!')
+        self.transfer()
+        self.assertEqual(self.recorder.received[-1], b'xyz')
+        self.assertEqual(self.sender.dropped_values, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
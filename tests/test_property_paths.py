@@ -0,0 +1,102 @@
+import gc
+import threading
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Model(ObservableObject):
+    def __init__(self, x, inner=None):
+        self.x = x
+        self.inner = inner
+
+
+class ViewModel(ObservableObject):
+    def __init__(self, current_model):
+        self.current_model = current_model
+
+
+class PropertyPathTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.first_model = Model('a', Model('inner a'))
+        self.second_model = Model('b', Model('inner b'))
+        self.view_model = ViewModel(self.first_model)
+        self.recorder = Recorder()
+        self.attach(self.first_model, self.first_model.inner, self.second_model, self.second_model.inner,
+                    self.view_model, self.recorder)
+
+    def subscribe(self, path):
+        return self.recorder.subscribeToVariable(None, 'put', self.view_model, path)
+
+    def testChangeOfTheLastAttributeIsDelivered(self):
+        self.subscribe('current_model.x')
+        self.publish(self.first_model, 'x', 'a2')
+        self.assertEqual(self.recorder.received, ['a2'])
+
+    def testReplacingIntermediateObjectRewiresThePath(self):
+        path_binding = self.subscribe('current_model.x')
+        self.publish(self.view_model, 'current_model', self.second_model)
+        self.assertEqual(self.recorder.received, ['b'])
+        self.assertEqual(path_binding.rewired_links_count, 3)
+
+        # The replaced model is not observed anymore
+        self.publish(self.first_model, 'x', 'ignored')
+        self.publish(self.second_model, 'x', 'b2')
+        self.assertEqual(self.recorder.received, ['b', 'b2'])
+
+    def testOnlyTheLinksAfterTheReplacedObjectAreRewired(self):
+        path_binding = self.subscribe('current_model.inner.x')
+        rewired_links_count = path_binding.rewired_links_count
+        self.publish(self.first_model, 'inner', self.attach(Model('new inner')))
+        self.assertEqual(self.recorder.received, ['new inner'])
+        self.assertEqual(path_binding.rewired_links_count, rewired_links_count + 1)
+
+    def testPublishingTheSameObjectAgainDeliversNothing(self):
+        self.subscribe('current_model.x')
+        self.view_model.publishPropertyChanges('current_model')
+        self.assertEqual(self.recorder.received, [])
+
+    def testIncompletePathDeliversNothingUntilItIsCompleteAgain(self):
+        path_binding = self.subscribe('current_model.x')
+        self.publish(self.view_model, 'current_model', None)
+        self.assertIsNone(path_binding.binding_plan)
+        self.assertEqual(self.recorder.received, [])
+
+        self.publish(self.view_model, 'current_model', self.second_model)
+        self.assertEqual(self.recorder.received, ['b'])
+
+    def testUnsubscribedPathIsNotDelivered(self):
+        path_binding = self.subscribe('current_model.x')
+        path_binding.unsubscribe()
+        self.publish(self.first_model, 'x', 'a2')
+        self.publish(self.view_model, 'current_model', self.second_model)
+        self.assertFalse(path_binding.active)
+        self.assertEqual(self.recorder.received, [])
+
+    def testPathBindingIsDroppedWithItsSubscriber(self):
+        self.subscribe('current_model.x')
+        del self.recorder
+        gc.collect()
+        self.assertEqual(self.event_hub.registryMemoryUsage()['bindings'], 0)
+        self.assertEqual(len(self.event_hub._path_bindings), 0)
+
+    def testSubscriberCollectedWhileThePathBindingsAreLockedDoesNotDeadlock(self):
+        self.subscribe('current_model.x')
+
+        def collectUnderLock():
+            with self.event_hub._path_bindings_lock:
+                del self.recorder
+                gc.collect()
+
+        thread = threading.Thread(target=collectUnderLock, daemon=True)
+        thread.start()
+        thread.join(5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.event_hub.registryMemoryUsage()['bindings'], 0)
+        self.assertEqual(len(self.event_hub._path_bindings), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
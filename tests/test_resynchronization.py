@@ -0,0 +1,99 @@
+import unittest
+
+from BackgroundEvaluations import BackgroundEvaluation
+from DeliveryPolicies import FakeClockScheduler, DebouncedDelivery, ThrottledDelivery
+from Fixtures import HubTestCase, InlineExecutor, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+        self.failures_left = 0
+
+    def getX(self):
+        if self.failures_left:
+            self.failures_left -= 1
+            raise ValueError('Source not ready')
+        return self.x
+
+
+class FailingRecorder(Recorder):
+    def __init__(self, scheduler=None):
+        super().__init__(scheduler)
+        self.failures_left = 0
+
+    def put(self, value):
+        if self.failures_left:
+            self.failures_left -= 1
+            raise ValueError('Subscriber not ready')
+        super().put(value)
+
+
+class ChangedOnlyResynchronizationTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = FakeClockScheduler()
+        self.source, self.recorder = self.attach(Source(), FailingRecorder())
+
+    def testOnlyOutdatedSubscribersAreUpdated(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x')
+        self.publish(self.source, 'x', 1)
+        late_recorder = self.attach(Recorder())
+        late_recorder.subscribeToVariable(None, 'put', self.source, 'x')
+
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.assertEqual(self.recorder.received, [1])
+        self.assertEqual(late_recorder.received, [1])
+
+    def testChangesMarkedWithoutPublicationAreDelivered(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x')
+        self.publish(self.source, 'x', 1)
+        self.source.x = 2
+        self.event_hub.markChanged(self.source, 'x')
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.assertEqual(self.recorder.received, [1, 2])
+
+    def testPendingDeliveryIsNotConsideredDelivered(self):
+        subscription = self.recorder.subscribeToVariable(None, 'put', self.source, 'x',
+                                                         delivery_policy=DebouncedDelivery(self.scheduler, 1.0))
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(subscription.binding_plan.delivered_version, 0)
+
+        self.scheduler.advance(1.0)
+        self.assertEqual(self.recorder.received, [1])
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.scheduler.advance(1.0)
+        self.assertEqual(self.recorder.received, [1])
+
+    def testFailedDelayedDeliveryIsRepeatedByResynchronization(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x',
+                                          delivery_policy=ThrottledDelivery(self.scheduler, interval=1.0))
+        self.publish(self.source, 'x', 1)
+        self.recorder.failures_left = 1
+        self.publish(self.source, 'x', 2)
+        with self.assertRaises(ValueError):
+            self.scheduler.advance(1.0)
+        self.assertEqual(self.recorder.received, [1])
+
+        self.scheduler.advance(1.0)
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.assertEqual(self.recorder.received, [1, 2])
+
+    def testFailedBackgroundEvaluationIsRepeatedByResynchronization(self):
+        evaluation = BackgroundEvaluation(self.scheduler, executor=InlineExecutor())
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', getter_method_name='getX',
+                                          evaluation_policy=evaluation)
+        self.source.failures_left = 1
+        self.publish(self.source, 'x', 1)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [])
+
+        self.event_hub.updateAllBindings(changed_only=True)
+        self.scheduler.advance()
+        self.assertEqual(self.recorder.received, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import gc
+import unittest
+import weakref
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class EqualSource(Source):
+    """
+    Publisher equal to every other one (and unhashable) - the registry must not rely on '__eq__' nor '__hash__'.
+    """
+
+    def __eq__(self, other):
+        return True
+
+    __hash__ = None
+
+
+class SubscriptionRegistryTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.registry = self.event_hub.callbacks
+
+    def usage(self) -> dict:
+        return self.event_hub.registryMemoryUsage()
+
+    def testRegistryDoesNotKeepObjectsAlive(self):
+        source, recorder = self.attach(Source(), Recorder())
+        recorder.subscribeToVariable(None, 'put', source, 'x')
+        source_reference, recorder_reference = weakref.ref(source), weakref.ref(recorder)
+        del source, recorder
+        gc.collect()
+        self.assertIsNone(source_reference())
+        self.assertIsNone(recorder_reference())
+
+    def testEntriesOfCollectedPublisherAreRemoved(self):
+        recorder = self.attach(Recorder())
+        sources = [self.attach(Source()) for _ in range(3)]
+        for source in sources:
+            recorder.subscribeToVariable(None, 'put', source, 'x')
+        self.assertEqual(self.usage()['publishers'], 3)
+
+        del sources, source
+        gc.collect()
+        self.assertEqual(self.usage()['publishers'], 0)
+        self.assertEqual(self.registry.subscriberBindings(recorder), [])
+
+    def testBindingsOfCollectedSubscriberAreRemoved(self):
+        source = self.attach(Source())
+        recorders = [self.attach(Recorder()) for _ in range(3)]
+        for recorder in recorders:
+            recorder.subscribeToVariable(None, 'put', source, 'x')
+        self.assertEqual(self.usage()['bindings'], 3)
+
+        del recorders[1:], recorder
+        gc.collect()
+        self.publish(source, 'x', 1)
+        self.assertEqual(self.usage()['bindings'], 1)
+        self.assertEqual(recorders[0].received, [1])
+
+    def testPublishersAreIdentifiedByIdentity(self):
+        first, second = self.attach(EqualSource(), EqualSource())
+        first_recorder, second_recorder = self.attach(Recorder(), Recorder())
+        first_recorder.subscribeToVariable(None, 'put', first, 'x')
+        second_recorder.subscribeToVariable(None, 'put', second, 'x')
+
+        self.publish(first, 'x', 1)
+        self.assertEqual((first_recorder.received, second_recorder.received), ([1], []))
+        self.assertIn(first, self.registry)
+        self.assertEqual(self.usage()['publishers'], 2)
+
+    def testUnregisteringAttributeRemovesItsBindings(self):
+        source, recorder = self.attach(Source(), Recorder())
+        recorder.subscribeToVariable(None, 'put', source, 'x')
+        self.event_hub._unregisterObservedVariable(source, 'x')
+        self.publish(source, 'x', 1)
+        self.assertEqual(recorder.received, [])
+        self.assertNotIn(source, self.registry)
+
+    def testMemoryUsageGrowsWithBindings(self):
+        source = self.attach(Source())
+        recorders = [self.attach(Recorder()) for _ in range(10)]
+        empty_size = self.usage()['bytes']
+        for recorder in recorders:
+            recorder.subscribeToVariable(None, 'put', source, 'x')
+        usage = self.usage()
+        self.assertEqual((usage['publishers'], usage['properties'], usage['bindings']), (1, 1, 10))
+        self.assertGreater(usage['bytes'], empty_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
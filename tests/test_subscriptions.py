@@ -0,0 +1,73 @@
+import unittest
+
+from BindingOperators import Map
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject
+from Utilities import CacheMode
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class SubscriptionHandleTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source, self.recorder = self.attach(Source(), Recorder())
+
+    def subscribe(self, **options):
+        return self.recorder.subscribeToVariable(None, 'put', self.source, 'x', **options)
+
+    def testUnsubscribeStopsDeliveries(self):
+        subscription = self.subscribe()
+        self.publish(self.source, 'x', 1)
+        self.assertTrue(subscription.active)
+
+        subscription.unsubscribe()
+        subscription.unsubscribe()
+        self.publish(self.source, 'x', 2)
+        self.assertFalse(subscription.active)
+        self.assertEqual(self.recorder.received, [1])
+
+    def testHandleAsContextManager(self):
+        with self.subscribe():
+            self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 2)
+        self.assertEqual(self.recorder.received, [1])
+
+    def testIdenticalSubscriptionsAreCollapsed(self):
+        first, second = self.subscribe(), self.subscribe()
+        self.assertIs(first.binding_plan, second.binding_plan)
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(self.recorder.received, [1])
+
+    def testSubscriptionsWithTheSameOptionsAreCollapsed(self):
+        operators = [Map(str)]
+        first = self.subscribe(value_cache=CacheMode.EQUALITY, operators=operators)
+        second = self.subscribe(value_cache=CacheMode.EQUALITY, operators=operators)
+        self.assertIs(first.binding_plan, second.binding_plan)
+
+    def testSubscriptionsDifferingInOptionsAreDistinct(self):
+        plain = self.subscribe()
+        mapped = self.subscribe(operators=[Map(lambda value: value * 10)])
+        cached = self.subscribe(value_cache=CacheMode.EQUALITY)
+        self.assertEqual(len({id(plain.binding_plan), id(mapped.binding_plan), id(cached.binding_plan)}), 3)
+
+        self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(sorted(self.recorder.received), [1, 1, 1, 10, 10])
+
+    def testUnsubscribingOneOfDistinctSubscriptionsKeepsTheOther(self):
+        plain = self.subscribe()
+        mapped = self.subscribe(operators=[Map(lambda value: value * 10)])
+        mapped.unsubscribe()
+        self.assertTrue(plain.active)
+        self.assertFalse(mapped.active)
+
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(self.recorder.received, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+
+from Fixtures import HubTestCase
+from ObservableObjects import ObservableObject, ObserverObject
+from Utilities import BindingCycleError
+
+
+class ViewModel(ObservableObject):
+    def __init__(self):
+        self._x = ''
+        self.set_count = 0
+
+    def getX(self):
+        return self._x
+
+    def setX(self, value):
+        self.set_count += 1
+        self._x = value
+        self.publishPropertyChanges('x')
+
+    x = property(getX, setX)
+
+
+class LineEdit:
+    """
+    Widget-like object - 'setText' notifies the listeners, like 'textChanged' signal of a QLineEdit.
+    """
+
+    def __init__(self):
+        self._text = ''
+        self.listeners = list()
+        self.set_count = 0
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        self.set_count += 1
+        self._text = text
+        for listener in self.listeners:
+            listener()
+
+
+class View(ObserverObject):
+    def __init__(self):
+        self.edit = LineEdit()
+
+
+class Node(ObservableObject, ObserverObject):
+    def __init__(self):
+        self.value = 0
+
+    def put(self, value):
+        self.value = value
+        self.publishPropertyChanges('value')
+
+
+class Model(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class Clamp(ObserverObject):
+    """
+    Subscriber correcting the published value - publishes the source attribute again while its publication is being
+    dispatched.
+    """
+
+    def __init__(self, model, limit):
+        self.model = model
+        self.limit = limit
+        self.received = list()
+
+    def put(self, value):
+        self.received.append(value)
+        if value > self.limit:
+            self.model.x = self.limit
+            self.model.publishPropertyChanges('x')
+
+
+class TwoWayBindingTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.view_model, self.view = self.attach(ViewModel(), View())
+        self.binding = self.view.subscribeTwoWay('edit', 'setText', 'text', self.view_model, 'x')
+        self.view.edit.listeners.append(self.binding.updateSource)
+
+    def testSourceChangeIsDeliveredWithoutEcho(self):
+        self.view_model.x = 'hello'
+        self.assertEqual(self.view.edit.text(), 'hello')
+        self.assertEqual((self.view_model.set_count, self.view.edit.set_count), (1, 1))
+        self.assertGreater(self.binding.suppressed_count, 0)
+
+    def testTargetChangeIsTransferredWithoutEcho(self):
+        self.view.edit.setText('typed')
+        self.assertEqual(self.view_model.x, 'typed')
+        self.assertEqual((self.view_model.set_count, self.view.edit.set_count), (1, 1))
+
+    def testOtherSubscribersReceiveTheTransferredValue(self):
+        recorder = self.attach(Node())
+        recorder.subscribeToVariable(None, 'put', self.view_model, 'x')
+        self.view.edit.setText('typed')
+        self.assertEqual(recorder.value, 'typed')
+
+    def testUnsubscribedBindingTransfersNothing(self):
+        self.binding.unsubscribe()
+        self.view_model.x = 'after'
+        self.view.edit.setText('typed')
+        self.assertEqual(self.view_model.x, 'after')
+        self.assertEqual(self.view.edit.text(), 'typed')
+
+
+class BindingCycleTests(HubTestCase):
+    def createNodes(self, count):
+        nodes = [Node() for _ in range(count)]
+        self.attach(*nodes)
+        return nodes
+
+    def testFeedbackLoopRaisesBindingCycleError(self):
+        first, second, third = self.createNodes(3)
+        second.subscribeToVariable(None, 'put', first, 'value')
+        third.subscribeToVariable(None, 'put', second, 'value')
+        first.subscribeToVariable(None, 'put', third, 'value')
+        first.value = 5
+        with self.assertRaises(BindingCycleError) as context:
+            first.publishPropertyChanges('value')
+        self.assertEqual(context.exception.chain, ['Node.value'] * (3 * (self.event_hub.max_reentries + 1) + 1))
+
+    def testCycleCallbackReplacesTheError(self):
+        first, second = self.createNodes(2)
+        second.subscribeToVariable(None, 'put', first, 'value')
+        first.subscribeToVariable(None, 'put', second, 'value')
+        errors = list()
+        self.event_hub.setPropagationLimits(on_cycle=errors.append)
+        first.value = 5
+        first.publishPropertyChanges('value')
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], BindingCycleError)
+        self.assertEqual(second.value, 5)
+
+    def testPropagationDeeperThanTheLimitRaisesBindingCycleError(self):
+        nodes = self.createNodes(10)
+        for publisher, subscriber in zip(nodes, nodes[1:]):
+            subscriber.subscribeToVariable(None, 'put', publisher, 'value')
+        self.event_hub.setPropagationLimits(max_depth=5)
+        with self.assertRaises(BindingCycleError) as context:
+            nodes[0].publishPropertyChanges('value')
+        self.assertEqual(len(context.exception.chain), 6)
+
+        self.event_hub.setPropagationLimits()
+        nodes[0].value = 7
+        nodes[0].publishPropertyChanges('value')
+        self.assertEqual(nodes[-1].value, 7)
+
+    def testConvergingReentrantPublicationIsAllowed(self):
+        model = Model()
+        clamp = self.attach(model, Clamp(model, 10))[1]
+        clamp.subscribeToVariable(None, 'put', model, 'x')
+        model.x = 15
+        model.publishPropertyChanges('x')
+        self.assertEqual(model.x, 10)
+        self.assertEqual(clamp.received, [15, 10])
+
+    def testReentrantPublicationBeyondTheLimitRaisesBindingCycleError(self):
+        model = Model()
+        clamp = self.attach(model, Clamp(model, 10))[1]
+        clamp.subscribeToVariable(None, 'put', model, 'x')
+        self.event_hub.setPropagationLimits(max_reentries=0)
+        model.x = 15
+        with self.assertRaises(BindingCycleError):
+            model.publishPropertyChanges('x')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+
+from Fixtures import HubTestCase, Recorder
+from ObservableObjects import ObservableObject, ObserverObject
+from Utilities import CacheMode, DeliveredValueCache
+
+
+class Source(ObservableObject):
+    def __init__(self):
+        self.x = 0
+
+
+class FailingRecorder(Recorder):
+    def __init__(self):
+        super().__init__()
+        self.failures_left = 0
+
+    def put(self, value):
+        if self.failures_left:
+            self.failures_left -= 1
+            raise ValueError('Subscriber not ready')
+        super().put(value)
+
+
+class AsyncFailingRecorder(ObserverObject):
+    def __init__(self):
+        self.received = list()
+        self.failures_left = 0
+
+    async def put(self, value):
+        if self.failures_left:
+            self.failures_left -= 1
+            raise ValueError('Subscriber not ready')
+        self.received.append(value)
+
+
+class DeliveredValueCacheTests(unittest.TestCase):
+    def testModes(self):
+        equal_lists = ([1, 2], [1, 2])
+        expectations = {CacheMode.IDENTITY: False, CacheMode.EQUALITY: True, CacheMode.HASH: False}
+        for mode, expected in expectations.items():
+            with self.subTest(mode=mode):
+                value_cache = DeliveredValueCache(mode)
+                value_cache.store(equal_lists[0])
+                # Lists are unhashable - the hash cache never matches them
+                self.assertEqual(value_cache.matches(equal_lists[1]), expected)
+
+        value_cache = DeliveredValueCache(CacheMode.HASH)
+        value_cache.store('text')
+        self.assertTrue(value_cache.matches('te' + 'xt'))
+
+    def testComparatorFunction(self):
+        value_cache = DeliveredValueCache(lambda delivered, new: abs(delivered - new) < 0.5)
+        value_cache.store(1.0)
+        self.assertTrue(value_cache.matches(1.2))
+        self.assertFalse(value_cache.matches(2.0))
+
+    def testComparisonErrorsCountAsDifference(self):
+        value_cache = DeliveredValueCache(lambda delivered, new: 1 / 0)
+        value_cache.store(1)
+        self.assertFalse(value_cache.matches(1))
+
+    def testInvalidModeIsRejected(self):
+        with self.assertRaises(ValueError):
+            DeliveredValueCache('equality')
+
+
+class CachedBindingTests(HubTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source, self.recorder = self.attach(Source(), FailingRecorder())
+
+    def testRepeatedValuesAreSkipped(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', value_cache=CacheMode.EQUALITY)
+        for value in (1, 1, 2, 2, 1):
+            self.publish(self.source, 'x', value)
+        self.assertEqual(self.recorder.received, [1, 2, 1])
+        self.assertEqual(self.event_hub.valueCacheStatistics(), {'bindings': 1, 'delivered': 3, 'skipped': 2})
+
+    def testFailedDeliveryIsNotCached(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', value_cache=CacheMode.EQUALITY)
+        self.recorder.failures_left = 1
+        with self.assertRaises(RuntimeError):
+            self.publish(self.source, 'x', 1)
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(self.recorder.received, [1])
+
+    def testCacheIsResetWhenBindingIsResolvedAgain(self):
+        self.recorder.subscribeToVariable(None, 'put', self.source, 'x', value_cache=CacheMode.EQUALITY)
+        self.publish(self.source, 'x', 1)
+        self.event_hub.refreshBindings(self.recorder)
+        self.publish(self.source, 'x', 1)
+        self.assertEqual(self.recorder.received, [1, 1])
+
+    def testFailedAsynchronousDeliveryIsNotCached(self):
+        async def scenario():
+            recorder = self.attach(AsyncFailingRecorder())
+            recorder.subscribeToVariable(None, 'put', self.source, 'x', value_cache=CacheMode.EQUALITY)
+            recorder.failures_left = 1
+            self.source.x = 1
+            with self.assertRaises(RuntimeError):
+                await self.event_hub.publishAsync(self.source, 'x')
+            await self.event_hub.publishAsync(self.source, 'x')
+            await self.event_hub.publishAsync(self.source, 'x')
+            return recorder.received
+
+        self.assertEqual(asyncio.run(scenario()), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()